@@ -1,23 +1,130 @@
-from linear_sistem_solver import solve_linear_system
+import argparse
+import os
+import sys
+
+from batch_runner import main as batch
+from linear_sistem_solver import solver_methods
 from matrix_printer import print_augumented_matrix
-from matrix_reader import read_matrix
+from matrix_reader import read_matrices, read_matrix
+from solution import (
+    find_solution,
+    format_general_solution,
+    output_formats,
+    write_binary,
+    write_csv,
+    write_json_lines,
+)
+from solver_server import main as serve
 
+# Results are flushed in chunks so memory stays flat on long inputs
+chunk_size = 256
+
+commands = {"batch": batch, "serve": serve}
 
-def main():
-    matrix = read_matrix()
-    if len(matrix) == 0:
-        return
 
+def print_solution(matrix, method):
     print_augumented_matrix(matrix)
     print()
-    solved_matrix = solve_linear_system(matrix)
-    print_augumented_matrix(solved_matrix)
-
-    row, col = solved_matrix.shape
+    solution = find_solution(matrix, method)
+    print_augumented_matrix(solution.reduced)
 
     print()
-    for i in range(row):
-        print(f"x{i + 1} = {float(solved_matrix[i, col - 1])}")
+    for line in format_general_solution(solution):
+        print(line)
+
+
+def write_chunk(output, output_format, solutions, start):
+    if output_format == "binary":
+        write_binary(output, [solution.reduced for solution in solutions])
+    elif output_format == "json":
+        write_json_lines(output, solutions, start)
+    else:
+        write_csv(output, solutions, start, header=start == 0)
+
+
+def solve_stream(stream, output, output_format, method):
+    solutions = []
+    start = 0
+
+    for matrix in read_matrices(stream):
+        solutions.append(find_solution(matrix, method))
+        if len(solutions) == chunk_size:
+            write_chunk(output, output_format, solutions, start)
+            start += len(solutions)
+            solutions = []
+
+    write_chunk(output, output_format, solutions, start)
+
+
+def parse_arguments(arguments=None):
+    parser = argparse.ArgumentParser(
+        prog="linear_system_solver",
+        description="Solve linear systems given as augmented matrices.",
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        help="file of matrices separated by END lines; standard input if omitted",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["pretty"] + output_formats,
+        default="pretty",
+        help="pretty prints for people; json, csv and binary write every "
+        "solution in bulk",
+    )
+    parser.add_argument("--method", choices=list(solver_methods), default="fraction")
+    parser.add_argument("--output", help="write results here instead of stdout")
+    return parser.parse_args(arguments)
+
+
+def open_output(path, output_format):
+    mode = "wb" if output_format == "binary" else "w"
+    if path is not None:
+        return open(path, mode, newline="" if mode == "w" else None)
+    if output_format == "binary":
+        return sys.stdout.buffer
+    return sys.stdout
+
+
+def main(arguments=None):
+    if arguments is None:
+        arguments = sys.argv[1:]
+    if arguments and arguments[0] in commands:
+        return commands[arguments[0]](arguments[1:])
+
+    arguments = parse_arguments(arguments)
+
+    if arguments.format == "pretty":
+        if arguments.input is None:
+            matrices = [read_matrix()]
+        else:
+            with open(arguments.input) as stream:
+                matrices = list(read_matrices(stream))
+        for matrix in matrices:
+            if len(matrix) == 0:
+                return
+            print_solution(matrix, arguments.method)
+        return
+
+    output = open_output(arguments.output, arguments.format)
+    try:
+        if arguments.input is None:
+            solve_stream(sys.stdin, output, arguments.format, arguments.method)
+        else:
+            with open(arguments.input) as stream:
+                solve_stream(stream, output, arguments.format, arguments.method)
+    except Exception:
+        if arguments.output is not None:
+            # A partly written file would pass for a complete set of results
+            output.close()
+            os.remove(arguments.output)
+        raise
+    finally:
+        if arguments.output is not None:
+            output.close()
+        else:
+            output.flush()
 
 
 if __name__ == "__main__":
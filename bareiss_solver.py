@@ -0,0 +1,138 @@
+import numpy as np
+from fractions import Fraction
+from math import lcm
+
+# Largest magnitude for which piv * a - f * b cannot overflow int64
+int64_safe_bound = 2**31 - 1
+
+
+def row_scales(matrix):
+    return [lcm(*[Fraction(value).denominator for value in row]) for row in matrix]
+
+
+def scale_to_integers(matrix):
+    rows, columns = matrix.shape
+    integer_matrix = np.empty((rows, columns), dtype=object)
+
+    for row_index, scale in enumerate(row_scales(matrix)):
+        integer_matrix[row_index] = [
+            int(Fraction(value) * scale) for value in matrix[row_index]
+        ]
+
+    return integer_matrix
+
+
+def fits_int64(matrix):
+    if matrix.size == 0:
+        return True
+    return max(abs(int(matrix.max())), abs(int(matrix.min()))) <= int64_safe_bound
+
+
+def fraction_free_eliminate(matrix, coefficient_columns):
+    rows = len(matrix)
+
+    if fits_int64(matrix):
+        matrix = matrix.astype(np.int64)
+    else:
+        matrix = matrix.astype(object)
+
+    previous_pivot = 1
+    pivot_columns = []
+    pivot_row = 0
+
+    for column_index in range(coefficient_columns):
+        if pivot_row == rows:
+            break
+
+        candidates = np.flatnonzero(matrix[pivot_row:, column_index] != 0)
+        if len(candidates) == 0:
+            continue
+
+        candidate_row = pivot_row + candidates[0]
+        if candidate_row != pivot_row:
+            matrix[[pivot_row, candidate_row]] = matrix[[candidate_row, pivot_row]]
+
+        if matrix.dtype != object and not fits_int64(matrix[pivot_row:]):
+            matrix = matrix.astype(object)
+
+        pivot = matrix[pivot_row, column_index]
+        below = slice(pivot_row + 1, rows)
+        right = slice(column_index + 1, None)
+
+        # Sylvester's identity makes every division below exact
+        matrix[below, right] = (
+            pivot * matrix[below, right]
+            - np.outer(matrix[below, column_index], matrix[pivot_row, right])
+        ) // previous_pivot
+        matrix[below, column_index] = 0
+
+        previous_pivot = pivot
+        pivot_columns.append(column_index)
+        pivot_row += 1
+
+    return matrix.astype(object), pivot_columns
+
+
+def fraction_free_back_substitute(echelon, pivot_columns):
+    columns = echelon.shape[1]
+    rank = len(pivot_columns)
+    free_columns = [
+        index for index in range(columns) if index not in set(pivot_columns)
+    ]
+
+    if rank == 0:
+        return np.empty((0, len(free_columns)), dtype=object), 1, free_columns
+
+    # Every entry of the reduced form times this minor is an integer
+    determinant = echelon[rank - 1, pivot_columns[-1]]
+    pivot_block = echelon[:rank, pivot_columns]
+    numerators = determinant * echelon[:rank, free_columns]
+
+    for row_index in reversed(range(rank)):
+        if row_index < rank - 1:
+            numerators[row_index] = numerators[row_index] - pivot_block[
+                row_index, row_index + 1 :
+            ].dot(numerators[row_index + 1 :])
+        numerators[row_index] = (
+            numerators[row_index] // pivot_block[row_index, row_index]
+        )
+
+    return numerators, determinant, free_columns
+
+
+def echelon_to_fractions(echelon, pivot_columns):
+    rows, columns = echelon.shape
+
+    numerators, determinant, free_columns = fraction_free_back_substitute(
+        echelon, pivot_columns
+    )
+    rank = len(pivot_columns)
+
+    reduced = np.full((rows, columns), Fraction(0), dtype=object)
+    for row_index, pivot_index in enumerate(pivot_columns):
+        reduced[row_index, pivot_index] = Fraction(1)
+        reduced[row_index, free_columns] = [
+            Fraction(int(value), int(determinant)) for value in numerators[row_index]
+        ]
+
+    for row_index in range(rank, rows):
+        reduced[row_index] = [
+            Fraction(int(value), int(determinant)) for value in echelon[row_index]
+        ]
+
+    return reduced
+
+
+def reduce_to_fractions(matrix, coefficient_columns):
+    echelon, pivot_columns = fraction_free_eliminate(
+        scale_to_integers(matrix), coefficient_columns
+    )
+
+    return echelon_to_fractions(echelon, pivot_columns), pivot_columns
+
+
+def solve_bareiss(matrix):
+    columns = matrix.shape[1]
+    reduced, _ = reduce_to_fractions(matrix, columns - 1)
+
+    return reduced
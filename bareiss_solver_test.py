@@ -0,0 +1,119 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+
+from bareiss_solver import (
+    fraction_free_back_substitute,
+    fraction_free_eliminate,
+    reduce_to_fractions,
+    scale_to_integers,
+    solve_bareiss,
+)
+
+
+class TestScaleToIntegers(unittest.TestCase):
+    def test_scale_to_integers_integer_rows(self):
+        matrix = np.array([[1, 2, 3], [4, 5, 6]], dtype=object)
+        expected = [[1, 2, 3], [4, 5, 6]]
+        self.assertEqual(scale_to_integers(matrix).tolist(), expected)
+
+    def test_scale_to_integers_fraction_rows(self):
+        matrix = np.array(
+            [[Fraction(1, 2), Fraction(1, 3), 1], [Fraction(3, 4), 0, Fraction(1, 4)]],
+            dtype=object,
+        )
+        expected = [[3, 2, 6], [3, 0, 1]]
+        self.assertEqual(scale_to_integers(matrix).tolist(), expected)
+
+
+class TestFractionFreeEliminate(unittest.TestCase):
+    def test_fraction_free_eliminate_2x3(self):
+        matrix = np.array([[2, 8, 4], [1, -8, 10]], dtype=object)
+        echelon, pivot_columns = fraction_free_eliminate(matrix, 2)
+        self.assertEqual(echelon.tolist(), [[2, 8, 4], [0, -24, 16]])
+        self.assertEqual(pivot_columns, [0, 1])
+
+    def test_fraction_free_eliminate_skips_empty_column(self):
+        matrix = np.array([[0, 1, 2], [0, 3, 4]], dtype=object)
+        echelon, pivot_columns = fraction_free_eliminate(matrix, 2)
+        self.assertEqual(echelon.tolist(), [[0, 1, 2], [0, 0, -2]])
+        self.assertEqual(pivot_columns, [1])
+
+    def test_fraction_free_eliminate_promotes_large_values(self):
+        big = 10**30
+        matrix = np.array([[big, 1, 1], [1, big, 2]], dtype=object)
+        echelon, _ = fraction_free_eliminate(matrix, 2)
+        self.assertEqual(echelon[1, 1], big * big - 1)
+
+
+class TestFractionFreeBackSubstitute(unittest.TestCase):
+    def test_fraction_free_back_substitute_2x3(self):
+        echelon = np.array([[2, 8, 4], [0, -24, 16]], dtype=object)
+        numerators, determinant, free_columns = fraction_free_back_substitute(
+            echelon, [0, 1]
+        )
+        self.assertEqual(free_columns, [2])
+        self.assertEqual(
+            [Fraction(value, determinant) for value in numerators[:, 0]],
+            [Fraction(14, 3), Fraction(-2, 3)],
+        )
+
+
+class TestReduceToFractions(unittest.TestCase):
+    def test_reduce_to_fractions_reports_pivots(self):
+        matrix = np.array(
+            [[1, 0, -1, 0, 1], [0, 1, 2, -1, 3], [1, 1, 3, -1, 7]], dtype=object
+        )
+        _, pivot_columns = reduce_to_fractions(matrix, 4)
+        self.assertEqual(pivot_columns, [0, 1, 2])
+
+
+class TestSolveBareiss(unittest.TestCase):
+    def test_solve_bareiss_3x4(self):
+        matrix = np.array(
+            [[45, -5, -40, 100], [-5, 35, -10, 0], [-40, -10, 65, 0]], dtype=object
+        )
+        expected = np.array([[1, 0, 0, 6], [0, 1, 0, 2], [0, 0, 1, 4]], dtype=object)
+        self.assertTrue((solve_bareiss(matrix) == expected).all())
+
+    def test_solve_bareiss_fractions(self):
+        matrix = np.array(
+            [[10, -8, 0, 40], [-8, 20, -6, 0], [0, -6, 10, -20]], dtype=object
+        )
+        expected = np.array(
+            [[1, 0, 0, Fraction(28, 5)], [0, 1, 0, 2], [0, 0, 1, Fraction(-4, 5)]],
+            dtype=object,
+        )
+        self.assertTrue((solve_bareiss(matrix) == expected).all())
+
+    def test_solve_bareiss_free_variable(self):
+        matrix = np.array(
+            [[1, 2, 7, 1, -1, -15], [1, 1, 3, 1, 0, -6], [3, 2, 5, -1, 9, 19]],
+            dtype=object,
+        )
+        expected = np.array(
+            [[1, 0, -1, 0, 3, 10], [0, 1, 4, 0, -1, -9], [0, 0, 0, 1, -2, -7]],
+            dtype=object,
+        )
+        self.assertTrue((solve_bareiss(matrix) == expected).all())
+
+    def test_solve_bareiss_zero_rows_at_the_end(self):
+        matrix = np.array(
+            [[0, 0, 0, 0], [1, 2, 0, 4], [2, 4, 0, 8], [0, 0, 3, 3]], dtype=object
+        )
+        expected = np.array(
+            [[1, 2, 0, 4], [0, 0, 1, 1], [0, 0, 0, 0], [0, 0, 0, 0]], dtype=object
+        )
+        self.assertTrue((solve_bareiss(matrix) == expected).all())
+
+    def test_solve_bareiss_inconsistent(self):
+        matrix = np.array([[1, 1, 1], [1, 1, 2]], dtype=object)
+        solved = solve_bareiss(matrix)
+        self.assertEqual(solved[0, :2].tolist(), [1, 1])
+        self.assertEqual(solved[1, :2].tolist(), [0, 0])
+        self.assertNotEqual(solved[1, 2], 0)
+
+    def test_solve_bareiss_returns_fractions(self):
+        matrix = np.array([[2, 1], [0, 0]], dtype=object)
+        solved = solve_bareiss(matrix)
+        self.assertTrue(all(isinstance(value, Fraction) for value in solved.flat))
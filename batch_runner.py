@@ -0,0 +1,201 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from linear_sistem_solver import solver_methods
+from matrix_reader import read_matrix_file
+from solution import find_solution, solution_record
+
+BatchReport = namedtuple("BatchReport", ["files", "matrices", "failures", "seconds"])
+
+
+def expand_inputs(patterns):
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        # A pattern matching nothing is kept, so it is reported as missing
+        for path in sorted(glob.glob(pattern, recursive=True)) or [pattern]:
+            if path not in seen:
+                seen.add(path)
+                paths.append(path)
+    return paths
+
+
+def output_name(path):
+    return os.path.splitext(os.path.basename(path))[0] + ".jsonl"
+
+
+def read_chunks(paths, chunk_size, failures):
+    for path in paths:
+
+        def on_error(line_number, message):
+            failures.append((path, f"line {line_number}: {message}"))
+
+        chunk = []
+        start = 0
+        try:
+            for matrix in read_matrix_file(path, on_error):
+                chunk.append(matrix)
+                if len(chunk) == chunk_size:
+                    yield path, start, chunk
+                    start += len(chunk)
+                    chunk = []
+        except (OSError, UnicodeDecodeError) as error:
+            failures.append((path, str(error)))
+
+        if chunk:
+            yield path, start, chunk
+
+
+def solve_chunk(path, start, matrices, method):
+    records = []
+    for index, matrix in enumerate(matrices, start):
+        try:
+            records.append(solution_record(find_solution(matrix, method), index))
+        except Exception as error:
+            # Any failure, even a bug in one solver, belongs to this matrix
+            # and must not end the run for the rest of the batch
+            records.append({"index": index, "error": str(error)})
+    return path, records
+
+
+def solve_chunks(chunks, method, workers=None):
+    # Only a few chunks per worker are in flight, so reading stays just
+    # ahead of solving and results come back in input order
+    limit = 2 * (workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for path, start, matrices in chunks:
+            pending.append(executor.submit(solve_chunk, path, start, matrices, method))
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_batch(
+    patterns,
+    method="fraction",
+    workers=None,
+    chunk_size=64,
+    output_directory=None,
+    stream=None,
+):
+    if method not in solver_methods:
+        raise ValueError(
+            f"Unknown method '{method}'. Expected one of: {', '.join(solver_methods)}"
+        )
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    started = time.perf_counter()
+    paths = expand_inputs(patterns)
+
+    if output_directory is not None:
+        names = [output_name(path) for path in paths]
+        if len(set(names)) != len(names):
+            raise ValueError("Input files must have distinct names")
+        os.makedirs(output_directory, exist_ok=True)
+    elif stream is None:
+        stream = sys.stdout
+
+    failures = []
+    matrices = 0
+    current_path = None
+    output = stream
+
+    try:
+        chunks = read_chunks(paths, chunk_size, failures)
+        for path, records in solve_chunks(chunks, method, workers):
+            # Chunks come back in input order, so each file is written once
+            if output_directory is not None and path != current_path:
+                if current_path is not None:
+                    output.close()
+                output = open(os.path.join(output_directory, output_name(path)), "w")
+            current_path = path
+
+            lines = []
+            for record in records:
+                if "error" in record:
+                    failures.append(
+                        (path, f"matrix {record['index']}: {record['error']}")
+                    )
+                if output_directory is None:
+                    record = {"file": path, **record}
+                lines.append(json.dumps(record))
+            output.write("\n".join(lines) + "\n")
+            matrices += len(records)
+    finally:
+        if output_directory is not None and current_path is not None:
+            output.close()
+
+    return BatchReport(len(paths), matrices, failures, time.perf_counter() - started)
+
+
+def print_report(report, stream=None):
+    if stream is None:
+        stream = sys.stderr
+    rate = report.matrices / report.seconds if report.seconds > 0 else 0.0
+    print(
+        f"Solved {report.matrices} matrices from {report.files} files "
+        f"in {report.seconds:.2f} s ({rate:.1f} matrices/s)",
+        file=stream,
+    )
+    if report.failures:
+        print(f"{len(report.failures)} failures:", file=stream)
+        for path, message in report.failures:
+            print(f"  {path}: {message}", file=stream)
+
+
+def parse_arguments(arguments=None):
+    parser = argparse.ArgumentParser(
+        prog="linear_system_solver batch",
+        description="Solve every matrix in many files with a pool of processes.",
+    )
+    parser.add_argument("inputs", nargs="+", help="matrix files or glob patterns")
+    parser.add_argument("--method", choices=list(solver_methods), default="fraction")
+    parser.add_argument("--workers", type=int, help="processes to use (default: CPUs)")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=64,
+        help="matrices sent to a worker at a time",
+    )
+    destination = parser.add_mutually_exclusive_group()
+    destination.add_argument(
+        "--output-dir", help="write one JSON lines file per input file here"
+    )
+    destination.add_argument(
+        "--output", help="write a single JSON lines stream here instead of stdout"
+    )
+    return parser.parse_args(arguments)
+
+
+def main(arguments=None):
+    arguments = parse_arguments(arguments)
+
+    stream = None if arguments.output is None else open(arguments.output, "w")
+    try:
+        report = run_batch(
+            arguments.inputs,
+            arguments.method,
+            arguments.workers,
+            arguments.chunk_size,
+            arguments.output_dir,
+            stream,
+        )
+    finally:
+        if stream is not None:
+            stream.close()
+
+    print_report(report)
+    return report
+
+
+if __name__ == "__main__":
+    main()
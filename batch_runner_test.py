@@ -0,0 +1,161 @@
+import unittest
+import io
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+from batch_runner import (
+    expand_inputs,
+    main,
+    output_name,
+    print_report,
+    read_chunks,
+    run_batch,
+    solve_chunk,
+)
+from matrix_reader import read_matrices
+from solution import find_solution
+
+
+class TestBatchRunner(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.write("first.txt", "1 2 3\n4 5 6\nEND\n2 4\nEND\n3 6\nEND\n")
+        self.write("second.txt", "1 1 2\n1 1 3\nEND\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def write(self, name, text):
+        with open(self.path(name), "w") as file:
+            file.write(text)
+
+    def test_expand_inputs(self):
+        paths = expand_inputs(
+            [self.path("*.txt"), self.path("first.txt"), self.path("missing.txt")]
+        )
+        self.assertEqual(
+            paths,
+            [self.path("first.txt"), self.path("second.txt"), self.path("missing.txt")],
+        )
+
+    def test_output_name(self):
+        self.assertEqual(output_name("data/systems.txt"), "systems.jsonl")
+
+    def test_read_chunks(self):
+        failures = []
+        chunks = list(read_chunks([self.path("first.txt")], 2, failures))
+        self.assertEqual(
+            [(start, len(matrices)) for _, start, matrices in chunks], [(0, 2), (2, 1)]
+        )
+        self.assertEqual(failures, [])
+
+    def test_solve_chunk(self):
+        with open(self.path("first.txt")) as stream:
+            matrices = list(read_matrices(stream))
+        path, records = solve_chunk("first.txt", 5, matrices, "bareiss")
+
+        self.assertEqual(path, "first.txt")
+        self.assertEqual([record["index"] for record in records], [5, 6, 7])
+        self.assertEqual(records[0]["values"], ["-1", "2"])
+
+    def test_solve_chunk_records_any_error(self):
+        with open(self.path("first.txt")) as stream:
+            matrices = list(read_matrices(stream))
+
+        def solve(matrix, method):
+            # Stands in for a solver bug on one system of the chunk
+            if len(matrix) == 2:
+                raise IndexError("index out of range")
+            return find_solution(matrix, method)
+
+        with patch("batch_runner.find_solution", side_effect=solve):
+            _, records = solve_chunk("first.txt", 0, matrices, "bareiss")
+
+        self.assertEqual(records[0], {"index": 0, "error": "index out of range"})
+        self.assertEqual([record["values"] for record in records[1:]], [["2"], ["2"]])
+
+    def test_stream_output(self):
+        stream = io.StringIO()
+        report = run_batch(
+            [self.path("*.txt")], "bareiss", workers=2, chunk_size=1, stream=stream
+        )
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(
+            [(os.path.basename(record["file"]), record["index"]) for record in records],
+            [("first.txt", 0), ("first.txt", 1), ("first.txt", 2), ("second.txt", 0)],
+        )
+        self.assertFalse(records[-1]["consistent"])
+        self.assertEqual((report.files, report.matrices, report.failures), (2, 4, []))
+
+    def test_directory_output(self):
+        output_directory = self.path("out")
+        run_batch([self.path("*.txt")], workers=1, output_directory=output_directory)
+
+        self.assertEqual(
+            sorted(os.listdir(output_directory)), ["first.jsonl", "second.jsonl"]
+        )
+        with open(os.path.join(output_directory, "first.jsonl")) as file:
+            records = [json.loads(line) for line in file]
+        self.assertEqual(
+            [record["values"] for record in records], [["-1", "2"], ["2"], ["2"]]
+        )
+        self.assertNotIn("file", records[0])
+
+    def test_failures_are_reported_per_file(self):
+        self.write("bad.txt", "1 x\nEND\n1 2\n3 4 5\nEND\n2 4\nEND\n")
+        report = run_batch(
+            [self.path("bad.txt"), self.path("missing.txt")],
+            workers=1,
+            stream=io.StringIO(),
+        )
+
+        self.assertEqual(report.matrices, 1)
+        failed = [os.path.basename(path) for path, _ in report.failures]
+        self.assertEqual(failed, ["bad.txt", "bad.txt", "missing.txt"])
+        self.assertIn("line 1", report.failures[0][1])
+        self.assertIn("line 4", report.failures[1][1])
+
+    def test_duplicate_output_names_raise(self):
+        os.mkdir(self.path("nested"))
+        self.write("nested/first.txt", "1 1\nEND\n")
+        with self.assertRaises(ValueError):
+            run_batch(
+                [self.path("first.txt"), self.path("nested/first.txt")],
+                output_directory=self.path("out"),
+            )
+
+    def test_invalid_options_raise(self):
+        with self.assertRaises(ValueError):
+            run_batch([self.path("first.txt")], method="unknown")
+        with self.assertRaises(ValueError):
+            run_batch([self.path("first.txt")], chunk_size=0)
+
+    def test_print_report(self):
+        stream = io.StringIO()
+        report = run_batch([self.path("missing.txt")], workers=1, stream=io.StringIO())
+        print_report(report, stream)
+
+        lines = stream.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith("Solved 0 matrices from 1 files"))
+        self.assertEqual(lines[1], "1 failures:")
+
+    def test_main_writes_output_file(self):
+        output = self.path("results.jsonl")
+        with patch("sys.stderr", io.StringIO()):
+            report = main(
+                [self.path("second.txt"), "--workers", "1", "--output", output]
+            )
+
+        self.assertEqual(report.matrices, 1)
+        with open(output) as file:
+            self.assertEqual(len(file.readlines()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import numpy as np
+from collections import namedtuple
+
+from float_solver import rounding_scale
+
+BatchSolution = namedtuple("BatchSolution", ["matrices", "ranks", "consistent"])
+
+
+def solve_linear_systems(batch, tolerance=None):
+    batch = np.array(batch, dtype=np.float64)
+    if batch.ndim != 3:
+        raise ValueError("Expected a 3-D stack of augmented matrices (k, n, n + 1)")
+
+    systems, rows, columns = batch.shape
+    coefficient_columns = columns - 1
+
+    # As in float_reduce, each system's threshold follows the largest
+    # coefficient its elimination has produced so far
+    coefficients = batch[:, :, :coefficient_columns]
+    scale = rounding_scale(coefficients)
+    largest = np.zeros(systems)
+    if coefficients.size:
+        largest = np.abs(coefficients).max(axis=(1, 2))
+
+    system_indexes = np.arange(systems)
+    row_indexes = np.arange(rows)
+    pivot_rows = np.zeros(systems, dtype=np.intp)
+
+    for column_index in range(coefficient_columns):
+        # Rows that already hold a pivot can not be picked again
+        below = row_indexes[None, :] >= pivot_rows[:, None]
+        column = np.where(below, np.abs(batch[:, :, column_index]), -1.0)
+        candidate_rows = column.argmax(axis=1)
+        candidate_values = column[system_indexes, candidate_rows]
+
+        threshold = scale * largest if tolerance is None else tolerance
+        has_pivot = candidate_values > threshold
+        without_pivot = ~has_pivot
+        batch[:, :, column_index][below & without_pivot[:, None]] = 0.0
+
+        pivoting = system_indexes[has_pivot]
+        if len(pivoting) == 0:
+            continue
+
+        # Gathering is only needed when some systems skip this column
+        gathered = len(pivoting) != systems
+        block = batch[pivoting] if gathered else batch
+        block_indexes = np.arange(len(pivoting))
+
+        target_rows = pivot_rows[pivoting]
+        source_rows = candidate_rows[pivoting]
+        swapped = block[block_indexes, source_rows]
+        block[block_indexes, source_rows] = block[block_indexes, target_rows]
+        block[block_indexes, target_rows] = swapped
+
+        pivot_values = block[block_indexes, target_rows, column_index]
+        block[block_indexes, target_rows] /= pivot_values[:, None]
+
+        factors = block[:, :, column_index].copy()
+        factors[block_indexes, target_rows] = 0.0
+        block -= factors[:, :, None] * block[block_indexes, target_rows][:, None, :]
+        block[:, :, column_index] = 0.0
+        block[block_indexes, target_rows, column_index] = 1.0
+
+        if gathered:
+            batch[pivoting] = block
+
+        if tolerance is None:
+            reduced = np.abs(block[:, :, :coefficient_columns]).max(axis=(1, 2))
+            largest[pivoting] = np.maximum(largest[pivoting], reduced)
+        pivot_rows[pivoting] += 1
+
+    beyond_rank = row_indexes[None, :] >= pivot_rows[:, None]
+    batch[:, :, :coefficient_columns][beyond_rank] = 0.0
+
+    # Constants left in zero rows collect rounding from every row subtracted
+    # from them, judged as in analyze_solution
+    constants_tolerance = np.zeros(systems)
+    if batch.size:
+        largest_entries = np.abs(batch).max(axis=(1, 2))
+        constants_tolerance = rows * rounding_scale(batch) * largest_entries
+    leftover = np.where(beyond_rank, np.abs(batch[:, :, coefficient_columns]), 0.0)
+    consistent = (leftover <= constants_tolerance[:, None]).all(axis=1)
+
+    return BatchSolution(batch, pivot_rows, consistent)
@@ -0,0 +1,95 @@
+import unittest
+import numpy as np
+
+from bareiss_solver import reduce_to_fractions
+from batch_solver import solve_linear_systems
+
+
+class TestBatchTolerance(unittest.TestCase):
+    def test_tolerance_per_system(self):
+        batch = np.array([[[1e-20, 2e-20], [0.0, 0.0]], [[1.0, 2.0], [1e-15, 0.0]]])
+        solution = solve_linear_systems(batch)
+        self.assertEqual(solution.ranks.tolist(), [1, 1])
+
+
+class TestSolveLinearSystems(unittest.TestCase):
+    def test_solve_linear_systems_3x4(self):
+        batch = np.array(
+            [
+                [[45, -5, -40, 100], [-5, 35, -10, 0], [-40, -10, 65, 0]],
+                [[1, -2, 1, 0], [0, 2, -8, 8], [5, 0, -5, 10]],
+            ]
+        )
+        solution = solve_linear_systems(batch)
+        expected = [
+            [[1, 0, 0, 6], [0, 1, 0, 2], [0, 0, 1, 4]],
+            [[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, -1]],
+        ]
+        self.assertTrue(np.allclose(solution.matrices, expected))
+        self.assertEqual(solution.ranks.tolist(), [3, 3])
+        self.assertEqual(solution.consistent.tolist(), [True, True])
+
+    def test_solve_linear_systems_mixed_ranks(self):
+        batch = np.array(
+            [
+                [[1, 2, 3], [3, 4, 5]],
+                [[1, 2, 3], [2, 4, 6]],
+                [[1, 2, 3], [2, 4, 7]],
+            ]
+        )
+        solution = solve_linear_systems(batch)
+        self.assertTrue(np.allclose(solution.matrices[0], [[1, 0, -1], [0, 1, 2]]))
+        self.assertTrue(np.allclose(solution.matrices[1], [[1, 2, 3], [0, 0, 0]]))
+        self.assertTrue(np.allclose(solution.matrices[2][1, :2], [0, 0]))
+        self.assertEqual(solution.ranks.tolist(), [2, 1, 1])
+        self.assertEqual(solution.consistent.tolist(), [True, True, False])
+
+    def test_solve_linear_systems_free_variable(self):
+        batch = np.array([[[1, 0, -1, 0, 1], [0, 1, 2, -1, 3], [1, 1, 3, -1, 7]]])
+        solution = solve_linear_systems(batch)
+        expected = [[1, 0, 0, 0, 2.5], [0, 1, 0, -1, 0], [0, 0, 1, 0, 1.5]]
+        self.assertTrue(np.allclose(solution.matrices[0], expected))
+
+    def test_solve_linear_systems_matches_single_solves(self):
+        rng = np.random.default_rng(0)
+        batch = rng.standard_normal((50, 5, 6))
+        solution = solve_linear_systems(batch)
+        for index in range(len(batch)):
+            expected = np.linalg.solve(batch[index, :, :-1], batch[index, :, -1])
+            self.assertTrue(np.allclose(solution.matrices[index, :, -1], expected))
+
+    def test_solve_linear_systems_growth_during_elimination(self):
+        solution = solve_linear_systems(
+            [[[-2, 1, 5, -12], [-3, 1, -4, 16], [-5, 2, 1, 4]]]
+        )
+        self.assertEqual(solution.ranks.tolist(), [2])
+        self.assertTrue(solution.consistent[0])
+
+    def test_solve_linear_systems_matches_exact_ranks(self):
+        rng = np.random.default_rng(1)
+        batch = rng.integers(-5, 6, (500, 4, 3)) @ rng.integers(-5, 6, (500, 3, 5))
+        batch[250:, 0, -1] += 1
+        solution = solve_linear_systems(batch)
+        for index, matrix in enumerate(batch):
+            reduced, pivot_columns = reduce_to_fractions(matrix.astype(object), 4)
+            rank = len(pivot_columns)
+            self.assertEqual(solution.ranks[index], rank)
+            self.assertEqual(solution.consistent[index], not reduced[rank:, -1].any())
+
+    def test_solve_linear_systems_large_ranks(self):
+        rng = np.random.default_rng(0)
+        deficient = rng.standard_normal((3, 200, 199)) @ rng.standard_normal(
+            (3, 199, 201)
+        )
+        self.assertEqual(solve_linear_systems(deficient).ranks.tolist(), [199] * 3)
+        full = rng.standard_normal((3, 200, 201))
+        self.assertEqual(solve_linear_systems(full).ranks.tolist(), [200] * 3)
+
+    def test_solve_linear_systems_does_not_modify_input(self):
+        batch = np.array([[[2.0, 4.0]]])
+        solve_linear_systems(batch)
+        self.assertEqual(batch.tolist(), [[[2.0, 4.0]]])
+
+    def test_solve_linear_systems_rejects_2d_input(self):
+        with self.assertRaises(ValueError):
+            solve_linear_systems(np.array([[1, 2], [3, 4]]))
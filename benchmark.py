@@ -0,0 +1,329 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+import numpy as np
+from fractions import Fraction
+
+from linear_sistem_solver import solve_fraction, solve_linear_system, solver_methods
+from matrix_printer import print_augumented_matrix
+from matrix_reader import read_matrices, read_matrix
+from solver_profiler import SolverProfiler
+
+system_kinds = ["dense", "sparse", "singular", "inconsistent", "ill_conditioned"]
+default_sizes = [10, 50, 100, 200, 500, 1000, 2000]
+default_targets = ["solve", "read", "print", "stages"]
+stage_names = [
+    "push_zero_row_to_the_end",
+    "auto_swap",
+    "auto_multiply",
+    "auto_add",
+    "auto_add_reverse",
+]
+
+
+def to_fractions(matrix):
+    fractions = np.empty(matrix.shape, dtype=object)
+    fractions.flat = [Fraction(int(value)) for value in matrix.flat]
+    return fractions
+
+
+def generate_system(kind, size, seed=0):
+    rng = np.random.default_rng([seed, size, system_kinds.index(kind)])
+
+    if kind == "ill_conditioned":
+        # Hilbert matrix with the all-ones solution
+        matrix = np.empty((size, size + 1), dtype=object)
+        for row_index in range(size):
+            matrix[row_index, :size] = [
+                Fraction(1, row_index + column_index + 1)
+                for column_index in range(size)
+            ]
+            matrix[row_index, size] = sum(matrix[row_index, :size])
+        return matrix
+
+    matrix = rng.integers(-9, 10, (size, size + 1))
+
+    if kind == "sparse":
+        density = min(1.0, 5 / size)
+        matrix[rng.random((size, size + 1)) >= density] = 0
+        matrix[np.arange(size), np.arange(size)] = rng.integers(1, 10, size)
+
+    elif kind in ("singular", "inconsistent") and size > 1:
+        matrix[-1] = matrix[0] + matrix[1 % (size - 1)]
+        if kind == "inconsistent":
+            matrix[-1, -1] += 1
+
+    return to_fractions(matrix)
+
+
+def format_text(matrix):
+    lines = [" ".join(str(value) for value in row) for row in matrix]
+    return "\n".join(lines + ["END", ""])
+
+
+def measure(function, setup, repeat):
+    timings = []
+    for _ in range(repeat):
+        argument = setup()
+        start = time.perf_counter()
+        function(argument)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def time_solve(matrix, method, repeat):
+    return measure(
+        lambda argument: solve_linear_system(argument, method),
+        matrix.copy,
+        repeat,
+    )
+
+
+def read_with_input(text):
+    stdin = sys.stdin
+    sys.stdin = io.StringIO(text)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return read_matrix()
+    finally:
+        sys.stdin = stdin
+
+
+def time_read(matrix, repeat):
+    text = format_text(matrix)
+    return {
+        "read_matrix": measure(read_with_input, lambda: text, repeat),
+        "read_matrices": measure(
+            lambda stream: list(read_matrices(stream)),
+            lambda: io.StringIO(text),
+            repeat,
+        ),
+    }
+
+
+def time_print(matrix, repeat):
+    def print_to_buffer(argument):
+        with contextlib.redirect_stdout(io.StringIO()):
+            print_augumented_matrix(argument)
+
+    return measure(print_to_buffer, lambda: matrix, repeat)
+
+
+def time_stages(matrix, repeat):
+    timings = {name: [] for name in stage_names}
+
+    for _ in range(repeat):
+        profiler = SolverProfiler()
+        solve_fraction(matrix.copy(), profiler)
+        for name in stage_names:
+            timings[name].append(profiler.stage_seconds.get(name, 0.0))
+
+    return timings
+
+
+def summarize(kind, size, target, timings):
+    return {
+        "kind": kind,
+        "size": size,
+        "target": target,
+        "best": min(timings),
+        "median": statistics.median(timings),
+        "timings": timings,
+    }
+
+
+def run_case(kind, size, targets, methods, repeat, seed):
+    matrix = generate_system(kind, size, seed)
+    results = []
+
+    for target in targets:
+        if target == "solve":
+            for method in methods:
+                timings = time_solve(matrix, method, repeat)
+                results.append(summarize(kind, size, f"solve:{method}", timings))
+        elif target == "read":
+            for name, timings in time_read(matrix, repeat).items():
+                results.append(summarize(kind, size, name, timings))
+        elif target == "print":
+            results.append(summarize(kind, size, "print", time_print(matrix, repeat)))
+        elif target == "stages":
+            for name, timings in time_stages(matrix, repeat).items():
+                results.append(summarize(kind, size, f"stage:{name}", timings))
+
+    return results
+
+
+def target_group(target):
+    if target.startswith("stage:"):
+        return "stages"
+    if target.startswith("read_"):
+        return "read"
+    return target
+
+
+def run_benchmarks(
+    sizes=None,
+    kinds=None,
+    targets=None,
+    methods=None,
+    repeat=3,
+    seed=0,
+    max_seconds=None,
+    log=None,
+):
+    sizes = sorted(sizes or default_sizes)
+    kinds = kinds or system_kinds
+    targets = targets or default_targets
+    methods = methods or list(solver_methods)
+
+    results = []
+    skipped = []
+
+    for kind in kinds:
+        slow_groups = set()
+        for size in sizes:
+            case_methods = [
+                method for method in methods if f"solve:{method}" not in slow_groups
+            ]
+            case_targets = [
+                target
+                for target in targets
+                if target not in slow_groups and (target != "solve" or case_methods)
+            ]
+            if slow_groups:
+                skipped.append(
+                    {"kind": kind, "size": size, "targets": sorted(slow_groups)}
+                )
+            if not case_targets:
+                continue
+
+            case_results = run_case(
+                kind, size, case_targets, case_methods, repeat, seed
+            )
+            results += case_results
+
+            for result in case_results:
+                if log is not None:
+                    log(
+                        f"{kind:>16} {size:>5} {result['target']:<40} "
+                        f"{result['best']:.6f}s"
+                    )
+                # Once a target blows the budget, larger sizes are only slower
+                if max_seconds is not None and result["best"] > max_seconds:
+                    slow_groups.add(target_group(result["target"]))
+
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeat": repeat,
+        "seed": seed,
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def result_key(result):
+    return result["kind"], result["size"], result["target"]
+
+
+def compare_reports(baseline, current):
+    baseline_results = {result_key(result): result for result in baseline["results"]}
+    comparisons = []
+
+    for result in current["results"]:
+        previous = baseline_results.get(result_key(result))
+        if previous is None or previous["best"] == 0:
+            continue
+        comparisons.append(
+            {
+                "kind": result["kind"],
+                "size": result["size"],
+                "target": result["target"],
+                "baseline": previous["best"],
+                "current": result["best"],
+                "ratio": result["best"] / previous["best"],
+            }
+        )
+
+    return comparisons
+
+
+def print_comparisons(comparisons, threshold=1.1):
+    for comparison in comparisons:
+        flag = ""
+        if comparison["ratio"] > threshold:
+            flag = "  slower"
+        elif comparison["ratio"] < 1 / threshold:
+            flag = "  faster"
+        print(
+            f"{comparison['kind']:>16} {comparison['size']:>5} "
+            f"{comparison['target']:<40} {comparison['baseline']:.6f}s -> "
+            f"{comparison['current']:.6f}s x{comparison['ratio']:.2f}{flag}"
+        )
+
+
+def parse_arguments(arguments=None):
+    parser = argparse.ArgumentParser(
+        description="Time the linear system solver, reader and printer."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=default_sizes)
+    parser.add_argument("--kinds", nargs="+", choices=system_kinds)
+    parser.add_argument("--targets", nargs="+", choices=default_targets)
+    parser.add_argument("--methods", nargs="+", choices=list(solver_methods))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=10.0,
+        help="skip larger sizes of a target once one run takes longer",
+    )
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CURRENT"),
+        help="compare two JSON reports instead of running",
+    )
+    return parser.parse_args(arguments)
+
+
+def main(arguments=None):
+    arguments = parse_arguments(arguments)
+
+    if arguments.compare:
+        reports = []
+        for path in arguments.compare:
+            with open(path) as file:
+                reports.append(json.load(file))
+        print_comparisons(compare_reports(*reports))
+        return
+
+    report = run_benchmarks(
+        arguments.sizes,
+        arguments.kinds,
+        arguments.targets,
+        arguments.methods,
+        arguments.repeat,
+        arguments.seed,
+        arguments.max_seconds,
+        log=lambda line: print(line, file=sys.stderr),
+    )
+
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import unittest
+import io
+import json
+import numpy as np
+from contextlib import redirect_stdout
+from fractions import Fraction
+
+from benchmark import (
+    compare_reports,
+    generate_system,
+    main,
+    run_benchmarks,
+    time_stages,
+)
+from linear_sistem_solver import solve_linear_system
+
+
+class TestGenerateSystem(unittest.TestCase):
+    def test_generate_system_is_reproducible(self):
+        first = generate_system("dense", 6, seed=3)
+        second = generate_system("dense", 6, seed=3)
+        self.assertEqual(first.shape, (6, 7))
+        self.assertEqual(first.tolist(), second.tolist())
+
+    def test_generate_system_singular_is_consistent(self):
+        reduced = solve_linear_system(generate_system("singular", 5), "bareiss")
+        self.assertEqual(reduced[-1].tolist(), [0] * 6)
+
+    def test_generate_system_inconsistent(self):
+        reduced = solve_linear_system(generate_system("inconsistent", 5), "bareiss")
+        self.assertEqual(reduced[-1, :-1].tolist(), [0] * 5)
+        self.assertNotEqual(reduced[-1, -1], 0)
+
+    def test_generate_system_sparse_has_full_diagonal(self):
+        matrix = generate_system("sparse", 40)
+        self.assertTrue((np.diagonal(matrix[:, :40]) != 0).all())
+        self.assertLess((matrix != 0).sum(), 40 * 41 // 2)
+
+    def test_generate_system_ill_conditioned_solution(self):
+        reduced = solve_linear_system(generate_system("ill_conditioned", 4), "bareiss")
+        self.assertEqual(reduced[:, -1].tolist(), [Fraction(1)] * 4)
+
+
+class TestRunBenchmarks(unittest.TestCase):
+    def test_time_stages_reports_every_stage(self):
+        timings = time_stages(generate_system("dense", 4), repeat=2)
+        self.assertEqual(len(timings), 5)
+        self.assertTrue(all(len(values) == 2 for values in timings.values()))
+
+    def test_run_benchmarks_report_is_json(self):
+        report = run_benchmarks(
+            sizes=[3], kinds=["dense"], methods=["bareiss"], repeat=1
+        )
+        targets = [result["target"] for result in report["results"]]
+        self.assertIn("solve:bareiss", targets)
+        self.assertIn("read_matrix", targets)
+        self.assertIn("print", targets)
+        self.assertIn("stage:auto_add", targets)
+        json.dumps(report)
+
+    def test_run_benchmarks_skips_slow_targets(self):
+        report = run_benchmarks(
+            sizes=[3, 4],
+            kinds=["dense"],
+            targets=["print"],
+            repeat=1,
+            max_seconds=0,
+        )
+        self.assertEqual([result["size"] for result in report["results"]], [3])
+        self.assertEqual(report["skipped"][0]["targets"], ["print"])
+
+    def test_compare_reports(self):
+        baseline = {
+            "results": [{"kind": "dense", "size": 3, "target": "print", "best": 2.0}]
+        }
+        current = {
+            "results": [{"kind": "dense", "size": 3, "target": "print", "best": 1.0}]
+        }
+        comparisons = compare_reports(baseline, current)
+        self.assertEqual(comparisons[0]["ratio"], 0.5)
+
+    def test_main_writes_json_to_stdout(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main(["--sizes", "3", "--kinds", "dense", "--targets", "read"])
+        report = json.loads(output.getvalue())
+        self.assertEqual(len(report["results"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+
+from linear_sistem_solver import solve_linear_system
+
+
+def connect_columns(row_indexes, column_indexes, rows, columns):
+    labels = np.arange(columns)
+
+    # Hook each root onto the smallest root sharing a row with it, then
+    # jump pointers; labels only shrink, so this stops once rows agree
+    while True:
+        roots = labels[column_indexes]
+        row_minimum = np.full(rows, columns)
+        np.minimum.at(row_minimum, row_indexes, roots)
+
+        updated = labels.copy()
+        np.minimum.at(updated, roots, row_minimum[row_indexes])
+        while True:
+            jumped = updated[updated]
+            if (jumped == updated).all():
+                break
+            updated = jumped
+
+        if (updated == labels).all():
+            return labels
+        labels = updated
+
+
+def find_blocks(matrix):
+    rows, columns = matrix.shape
+    coefficient_columns = columns - 1
+
+    nonzero = matrix[:, :coefficient_columns] != 0
+    row_indexes, column_indexes = np.nonzero(nonzero)
+    labels = connect_columns(row_indexes, column_indexes, rows, coefficient_columns)
+
+    has_entries = nonzero.any(axis=1)
+    row_labels = labels[nonzero.argmax(axis=1)]
+    used_columns = np.unique(column_indexes)
+
+    blocks = []
+    for label in np.unique(labels[used_columns]):
+        block_rows = np.flatnonzero(has_entries & (row_labels == label))
+        block_columns = used_columns[labels[used_columns] == label]
+        blocks.append((block_rows, block_columns))
+
+    return blocks, np.flatnonzero(~has_entries)
+
+
+def zeros(shape, dtype):
+    if dtype == object:
+        return np.full(shape, Fraction(0), dtype=object)
+    return np.zeros(shape, dtype=dtype)
+
+
+def assemble(matrix, blocks, reduced_blocks, zero_rows):
+    columns = matrix.shape[1]
+    dtype = reduced_blocks[0].dtype if reduced_blocks else matrix.dtype
+    result = zeros(matrix.shape, dtype)
+
+    # Blocks share no columns, so sorting every pivot row by its pivot
+    # column keeps each pivot column clear outside its own row
+    pivot_rows = []
+    empty_rows = []
+    for (_, block_columns), reduced in zip(blocks, reduced_blocks):
+        for row in reduced:
+            leading = np.flatnonzero(row[:-1] != 0)
+            if len(leading) == 0:
+                empty_rows.append(row)
+            else:
+                pivot_rows.append((block_columns[leading[0]], block_columns, row))
+    pivot_rows.sort(key=lambda pivot_row: pivot_row[0])
+
+    row_index = 0
+    for _, block_columns, row in pivot_rows:
+        result[row_index, block_columns] = row[:-1]
+        result[row_index, -1] = row[-1]
+        row_index += 1
+    for row in empty_rows:
+        result[row_index, -1] = row[-1]
+        row_index += 1
+    for zero_row in zero_rows:
+        result[row_index, -1] = matrix[zero_row, columns - 1]
+        row_index += 1
+
+    return result
+
+
+def solve_blocks(matrix, method="bareiss", workers=None):
+    matrix = np.asarray(matrix)
+    columns = matrix.shape[1]
+
+    blocks, zero_rows = find_blocks(matrix)
+    if len(blocks) <= 1:
+        return solve_linear_system(matrix, method)
+
+    sub_systems = [
+        matrix[np.ix_(block_rows, np.append(block_columns, columns - 1))]
+        for block_rows, block_columns in blocks
+    ]
+
+    if workers is None:
+        reduced_blocks = [solve_linear_system(block, method) for block in sub_systems]
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            reduced_blocks = list(
+                executor.map(
+                    solve_linear_system, sub_systems, [method] * len(sub_systems)
+                )
+            )
+
+    return assemble(matrix, blocks, reduced_blocks, zero_rows)
@@ -0,0 +1,114 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+
+from bareiss_solver import solve_bareiss
+from block_solver import find_blocks, solve_blocks
+
+
+def permuted_blocks():
+    # Two 2x2 blocks and a 1x1 block, with rows and columns shuffled
+    return np.array(
+        [
+            [0, 3, 0, 0, 1, 5],
+            [2, 0, 0, 1, 0, 4],
+            [0, 0, 7, 0, 0, 14],
+            [0, 1, 0, 0, 2, 3],
+            [1, 0, 0, 1, 0, 2],
+        ],
+        dtype=object,
+    )
+
+
+def block_system(sizes, seed):
+    rng = np.random.default_rng(seed)
+    size = sum(sizes)
+    matrix = np.zeros((size, size + 1), dtype=object)
+    offset = 0
+    for block_size in sizes:
+        block = slice(offset, offset + block_size)
+        matrix[block, block] = rng.integers(-9, 10, (block_size, block_size))
+        offset += block_size
+    matrix[:, -1] = rng.integers(-9, 10, size)
+
+    columns = np.append(rng.permutation(size), size)
+    return matrix[rng.permutation(size)][:, columns]
+
+
+class TestFindBlocks(unittest.TestCase):
+    def test_finds_connected_components(self):
+        blocks, zero_rows = find_blocks(permuted_blocks())
+
+        found = sorted((rows.tolist(), columns.tolist()) for rows, columns in blocks)
+        self.assertEqual(found, [([0, 3], [1, 4]), ([1, 4], [0, 3]), ([2], [2])])
+        self.assertEqual(zero_rows.tolist(), [])
+
+    def test_chained_rows_form_one_block(self):
+        matrix = np.array([[1, 1, 0, 0, 1], [0, 0, 1, 1, 1], [0, 1, 1, 0, 1]])
+        blocks, _ = find_blocks(matrix)
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual(blocks[0][1].tolist(), [0, 1, 2, 3])
+
+    def test_zero_rows_and_unused_columns(self):
+        matrix = np.array([[1, 0, 0, 2], [0, 0, 0, 5], [0, 0, 3, 1]])
+        blocks, zero_rows = find_blocks(matrix)
+
+        self.assertEqual([columns.tolist() for _, columns in blocks], [[0], [2]])
+        self.assertEqual(zero_rows.tolist(), [1])
+
+
+class TestSolveBlocks(unittest.TestCase):
+    def test_matches_full_solve(self):
+        matrix = permuted_blocks()
+        self.assertEqual(
+            solve_blocks(matrix.copy()).tolist(), solve_bareiss(matrix).tolist()
+        )
+
+    def test_matches_full_solve_on_random_blocks(self):
+        for seed in range(10):
+            matrix = block_system([3, 1, 4, 2], seed)
+            self.assertEqual(
+                solve_blocks(matrix.copy()).tolist(), solve_bareiss(matrix).tolist()
+            )
+
+    def test_free_columns_and_zero_rows(self):
+        matrix = np.array(
+            [[1, 2, 0, 0, 3], [0, 0, 0, 0, 0], [0, 0, 0, 2, 4]], dtype=object
+        )
+        expected = [[1, 2, 0, 0, 3], [0, 0, 0, 1, 2], [0, 0, 0, 0, 0]]
+        self.assertEqual(solve_blocks(matrix).tolist(), expected)
+
+    def test_inconsistent_block_keeps_nonzero_constant(self):
+        matrix = np.array([[1, 1, 0, 2], [2, 2, 0, 5], [0, 0, 3, 6]], dtype=object)
+        reduced = solve_blocks(matrix)
+
+        self.assertEqual(reduced[0, :-1].tolist(), [1, 1, 0])
+        self.assertEqual(reduced[1].tolist(), [0, 0, 1, 2])
+        self.assertEqual(reduced[2, :-1].tolist(), [0, 0, 0])
+        self.assertNotEqual(reduced[2, -1], 0)
+
+    def test_single_block_uses_method_directly(self):
+        matrix = np.array([[2, 1, 3], [1, 3, 4]], dtype=object)
+        self.assertEqual(
+            solve_blocks(matrix.copy(), "fraction").tolist(),
+            solve_bareiss(matrix).tolist(),
+        )
+
+    def test_keeps_fractions(self):
+        matrix = np.array(
+            [[Fraction(1, 2), 0, 1], [0, Fraction(2, 3), 1]], dtype=object
+        )
+        self.assertEqual(
+            solve_blocks(matrix).tolist(), [[1, 0, 2], [0, 1, Fraction(3, 2)]]
+        )
+
+    def test_workers(self):
+        matrix = block_system([3, 3, 2], 0)
+        self.assertEqual(
+            solve_blocks(matrix.copy(), workers=2).tolist(),
+            solve_bareiss(matrix).tolist(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
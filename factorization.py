@@ -0,0 +1,108 @@
+import numpy as np
+from fractions import Fraction
+from math import lcm
+
+from bareiss_solver import (
+    fraction_free_back_substitute,
+    fraction_free_eliminate,
+    row_scales,
+)
+from float_solver import float_reduce, invert_square
+
+
+class LinearSystem:
+    def __init__(self, reduced, transform, pivot_columns, exact, scales, divisor):
+        self.reduced = reduced
+        self.transform = transform
+        self.pivot_columns = pivot_columns
+        self.rank = len(pivot_columns)
+        self.exact = exact
+        self.scales = scales
+        self.divisor = divisor
+
+    @classmethod
+    def factor(cls, coefficients, exact=True):
+        if exact:
+            return cls.factor_exact(coefficients)
+        return cls.factor_float(coefficients)
+
+    @classmethod
+    def factor_exact(cls, coefficients):
+        rows, columns = coefficients.shape
+        scales = row_scales(coefficients)
+
+        # Row operations on [D A | I] leave T' in the identity block, so any
+        # new right-hand side b is reduced by T' D b
+        augmented = np.zeros((rows, columns + rows), dtype=object)
+        for row_index, scale in enumerate(scales):
+            augmented[row_index, :columns] = [
+                int(Fraction(value) * scale) for value in coefficients[row_index]
+            ]
+            augmented[row_index, columns + row_index] = 1
+
+        echelon, pivot_columns = fraction_free_eliminate(augmented, columns)
+        numerators, divisor, free_columns = fraction_free_back_substitute(
+            echelon, pivot_columns
+        )
+        rank = len(pivot_columns)
+
+        integer_transform = echelon[:, columns:].copy()
+        reduced = np.full((rows, columns), Fraction(0), dtype=object)
+        for row_index, pivot_index in enumerate(pivot_columns):
+            row = np.zeros(columns + rows, dtype=object)
+            row[free_columns] = numerators[row_index]
+            row[pivot_index] = divisor
+            integer_transform[row_index] = row[columns:]
+            reduced[row_index] = [
+                Fraction(int(value), int(divisor)) for value in row[:columns]
+            ]
+
+        return cls(reduced, integer_transform, pivot_columns, True, scales, divisor)
+
+    @classmethod
+    def factor_float(cls, coefficients):
+        coefficients = np.array(coefficients, dtype=np.float64)
+        rows, columns = coefficients.shape
+
+        if rows == columns and rows > 0:
+            inverse = invert_square(coefficients)
+            if inverse is not None:
+                return cls(np.eye(rows), inverse, list(range(rows)), False, None, 1)
+
+        augmented = np.hstack([coefficients, np.eye(rows)])
+        reduced, pivot_columns = float_reduce(augmented, columns)
+
+        return cls(
+            reduced[:, :columns], reduced[:, columns:], pivot_columns, False, None, 1
+        )
+
+    def reduce_constants(self, constants):
+        if not self.exact:
+            return self.transform @ np.array(constants, dtype=np.float64)
+
+        scaled = np.array(
+            [
+                [Fraction(value) * scale for value in np.atleast_1d(row)]
+                for row, scale in zip(constants, self.scales)
+            ],
+            dtype=object,
+        )
+        common = lcm(*[value.denominator for value in scaled.flat])
+        integers = np.array(
+            [[int(value * common) for value in row] for row in scaled], dtype=object
+        )
+
+        reduced = self.transform.dot(integers)
+        denominator = int(self.divisor) * common
+        return np.array(
+            [[Fraction(int(value), denominator) for value in row] for row in reduced],
+            dtype=object,
+        )
+
+    def solve(self, constants):
+        reduced_constants = self.reduce_constants(constants)
+        return np.column_stack([self.reduced, reduced_constants.reshape(-1, 1)])
+
+    def solve_many(self, constants):
+        reduced_constants = self.reduce_constants(constants)
+        return np.hstack([self.reduced, reduced_constants])
@@ -0,0 +1,95 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+
+from factorization import LinearSystem
+
+
+class TestLinearSystemFactorExact(unittest.TestCase):
+    def test_factor_exact_solve(self):
+        coefficients = np.array(
+            [[45, -5, -40], [-5, 35, -10], [-40, -10, 65]], dtype=object
+        )
+        system = LinearSystem.factor(coefficients)
+        expected = np.array([[1, 0, 0, 6], [0, 1, 0, 2], [0, 0, 1, 4]], dtype=object)
+        self.assertTrue((system.solve(np.array([100, 0, 0])) == expected).all())
+
+    def test_factor_exact_reuses_factorization(self):
+        coefficients = np.array([[10, -8, 0], [-8, 20, -6], [0, -6, 10]], dtype=object)
+        system = LinearSystem.factor(coefficients)
+        first = system.solve(np.array([40, 0, -20], dtype=object))
+        second = system.solve(np.array([2, 6, 4], dtype=object))
+        self.assertEqual(first[:, -1].tolist(), [Fraction(28, 5), 2, Fraction(-4, 5)])
+        self.assertEqual(second[:, -1].tolist(), [1, 1, 1])
+
+    def test_factor_exact_fraction_coefficients(self):
+        coefficients = np.array(
+            [[Fraction(1, 2), 0], [0, Fraction(1, 3)]], dtype=object
+        )
+        system = LinearSystem.factor(coefficients)
+        solved = system.solve(np.array([Fraction(1, 4), 1], dtype=object))
+        self.assertEqual(solved[:, -1].tolist(), [Fraction(1, 2), 3])
+
+    def test_factor_exact_solve_many(self):
+        coefficients = np.array([[1, 2], [3, 4]], dtype=object)
+        system = LinearSystem.factor(coefficients)
+        solved = system.solve_many(np.array([[1, 0], [0, 1]], dtype=object))
+        expected = [[1, 0, -2, 1], [0, 1, Fraction(3, 2), Fraction(-1, 2)]]
+        self.assertEqual(solved.tolist(), expected)
+
+    def test_factor_exact_free_variable(self):
+        coefficients = np.array([[1, 0, -1, 0], [0, 1, 2, -1], [1, 1, 3, -1]])
+        system = LinearSystem.factor(coefficients)
+        expected = [
+            [1, 0, 0, 0, Fraction(5, 2)],
+            [0, 1, 0, -1, 0],
+            [0, 0, 1, 0, Fraction(3, 2)],
+        ]
+        self.assertEqual(system.solve(np.array([1, 3, 7])).tolist(), expected)
+        self.assertEqual(system.pivot_columns, [0, 1, 2])
+
+    def test_factor_exact_rank_deficient(self):
+        coefficients = np.array([[1, 2], [2, 4]], dtype=object)
+        system = LinearSystem.factor(coefficients)
+        self.assertEqual(system.rank, 1)
+        self.assertEqual(
+            system.solve(np.array([3, 6])).tolist(), [[1, 2, 3], [0, 0, 0]]
+        )
+        self.assertNotEqual(system.solve(np.array([3, 7]))[1, 2], 0)
+
+
+class TestLinearSystemFactorFloat(unittest.TestCase):
+    def test_factor_float_solve(self):
+        coefficients = np.array([[1, -2, 1], [0, 2, -8], [5, 0, -5]])
+        system = LinearSystem.factor(coefficients, exact=False)
+        expected = [[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, -1]]
+        self.assertTrue(np.allclose(system.solve(np.array([0, 8, 10])), expected))
+
+    def test_factor_float_solve_many(self):
+        coefficients = np.array([[2.0, 0.0], [0.0, 4.0]])
+        system = LinearSystem.factor(coefficients, exact=False)
+        solved = system.solve_many(np.array([[2.0, 4.0], [4.0, 8.0]]))
+        self.assertTrue(np.allclose(solved, [[1, 0, 1, 2], [0, 1, 1, 2]]))
+
+    def test_factor_float_rank_deficient(self):
+        coefficients = np.array([[1.0, 2.0], [2.0, 4.0]])
+        system = LinearSystem.factor(coefficients, exact=False)
+        self.assertEqual(system.rank, 1)
+        self.assertTrue(
+            np.allclose(system.solve(np.array([3.0, 6.0])), [[1, 2, 3], [0, 0, 0]])
+        )
+
+    def test_factor_float_rank_from_elimination_growth(self):
+        rng = np.random.default_rng(2)
+        coefficients = rng.integers(-5, 6, (60, 58)) @ rng.integers(-5, 6, (58, 90))
+        system = LinearSystem.factor(coefficients[:, :-1], exact=False)
+        self.assertEqual(system.rank, 58)
+
+    def test_factor_float_rectangular(self):
+        coefficients = np.array([[1.0, 0.0, -1.0], [0.0, 1.0, 2.0]])
+        system = LinearSystem.factor(coefficients, exact=False)
+        self.assertTrue(
+            np.allclose(
+                system.solve(np.array([1.0, 3.0])), [[1, 0, -1, 1], [0, 1, 2, 3]]
+            )
+        )
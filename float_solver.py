@@ -0,0 +1,122 @@
+import numpy as np
+
+# Rounding during elimination grows with the largest entry it produces,
+# so the pivot threshold follows the reduced coefficients rather than the
+# input alone; the margin covers the slack in that estimate
+tolerance_margin = 8
+
+
+def rounding_scale(matrix):
+    return tolerance_margin * max(matrix.shape[-2:]) * np.finfo(np.float64).eps
+
+
+def float_tolerance(matrix):
+    if matrix.size == 0:
+        return 0.0
+    return rounding_scale(matrix) * np.abs(matrix).max()
+
+
+def float_reduce(matrix, coefficient_columns, tolerance=None):
+    matrix = np.array(matrix, dtype=np.float64)
+    rows = len(matrix)
+    coefficients = matrix[:, :coefficient_columns]
+
+    scale = rounding_scale(coefficients)
+    largest = np.abs(coefficients).max() if coefficients.size else 0.0
+
+    pivot_columns = []
+    pivot_row = 0
+
+    for column_index in range(coefficient_columns):
+        if pivot_row == rows:
+            break
+
+        threshold = scale * largest if tolerance is None else tolerance
+        column = np.abs(matrix[pivot_row:, column_index])
+        candidate_row = pivot_row + int(column.argmax())
+
+        if column[candidate_row - pivot_row] <= threshold:
+            matrix[pivot_row:, column_index] = 0.0
+            continue
+
+        if candidate_row != pivot_row:
+            matrix[[pivot_row, candidate_row]] = matrix[[candidate_row, pivot_row]]
+
+        matrix[pivot_row] /= matrix[pivot_row, column_index]
+
+        factors = matrix[:, column_index].copy()
+        factors[pivot_row] = 0.0
+        matrix -= np.outer(factors, matrix[pivot_row])
+        matrix[:, column_index] = 0.0
+        matrix[pivot_row, column_index] = 1.0
+
+        if tolerance is None:
+            largest = max(largest, np.abs(coefficients).max())
+
+        pivot_columns.append(column_index)
+        pivot_row += 1
+
+    matrix[pivot_row:, :coefficient_columns] = 0.0
+
+    return matrix, pivot_columns
+
+
+def solve_square(coefficients, constants):
+    size = len(coefficients)
+
+    # A random right-hand side exposes singular matrices that LAPACK's LU
+    # factors without complaint because rounding left the last pivot nonzero
+    probe = np.random.default_rng(0).standard_normal(size)
+    right_hand_sides = np.column_stack([constants, probe])
+
+    try:
+        solutions = np.linalg.solve(coefficients, right_hand_sides)
+    except np.linalg.LinAlgError:
+        return None
+
+    if not np.isfinite(solutions).all():
+        return None
+
+    norm = np.abs(coefficients).sum(axis=1).max()
+    growth = norm * np.abs(solutions).max(axis=0)
+    scale = np.abs(right_hand_sides).max(axis=0)
+    if (growth * size * np.finfo(np.float64).eps > scale).any():
+        return None
+
+    return solutions[:, 0]
+
+
+def invert_square(coefficients):
+    size = len(coefficients)
+
+    try:
+        inverse = np.linalg.inv(coefficients)
+    except np.linalg.LinAlgError:
+        return None
+
+    if not np.isfinite(inverse).all():
+        return None
+
+    # Each identity column acts as its own probe, as in solve_square
+    norm = np.abs(coefficients).sum(axis=1).max()
+    if norm * np.abs(inverse).max() * size * np.finfo(np.float64).eps > 1:
+        return None
+
+    return inverse
+
+
+def solve_float(matrix):
+    matrix = np.array(matrix, dtype=np.float64)
+    rows, columns = matrix.shape
+
+    if rows == columns - 1 and rows > 0:
+        solution = solve_square(matrix[:, :-1], matrix[:, -1])
+        if solution is not None:
+            solved_matrix = np.zeros((rows, columns))
+            solved_matrix[:, :-1] = np.eye(rows)
+            solved_matrix[:, -1] = solution
+            return solved_matrix
+
+    solved_matrix, _ = float_reduce(matrix, columns - 1)
+
+    return solved_matrix
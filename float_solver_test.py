@@ -0,0 +1,151 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+
+from bareiss_solver import reduce_to_fractions
+from float_solver import (
+    float_reduce,
+    float_tolerance,
+    invert_square,
+    solve_float,
+    solve_square,
+)
+
+
+class TestFloatTolerance(unittest.TestCase):
+    def test_float_tolerance_scales_with_entries(self):
+        small = float_tolerance(np.array([[1.0, 2.0], [3.0, 4.0]]))
+        large = float_tolerance(np.array([[1000.0, 2.0], [3.0, 4.0]]))
+        self.assertGreater(large, small)
+
+    def test_float_tolerance_empty(self):
+        self.assertEqual(float_tolerance(np.zeros((0, 0))), 0.0)
+
+
+class TestFloatReduce(unittest.TestCase):
+    def test_float_reduce_full_rank(self):
+        matrix = np.array([[2, 8, 4], [1, -8, 10]])
+        reduced, pivot_columns = float_reduce(matrix, 2)
+        self.assertTrue(np.allclose(reduced, [[1, 0, 14 / 3], [0, 1, -2 / 3]]))
+        self.assertEqual(pivot_columns, [0, 1])
+
+    def test_float_reduce_rank_deficient(self):
+        matrix = np.array([[1, 2, 3], [2, 4, 6], [0, 0, 0]])
+        reduced, pivot_columns = float_reduce(matrix, 2)
+        self.assertTrue(np.allclose(reduced, [[1, 2, 3], [0, 0, 0], [0, 0, 0]]))
+        self.assertEqual(pivot_columns, [0])
+
+    def test_float_reduce_growth_during_elimination(self):
+        # Rank 4, but rounding leaves about 4e-15 in the last pivot
+        matrix = np.array(
+            [
+                [-4, -2, 0, -1, -2, -3],
+                [-2, 2, -4, -3, 4, 0],
+                [-3, -1, 0, -3, 4, -3],
+                [-3, -1, -2, 4, 2, -4],
+                [-6, 0, -4, -4, 2, -3],
+            ]
+        )
+        _, pivot_columns = float_reduce(matrix, 5)
+        self.assertEqual(pivot_columns, [0, 1, 2, 3])
+
+    def test_float_reduce_rounding_from_each_step(self):
+        # Rank 4; a small fourth pivot magnifies the rounding of the updates
+        matrix = np.array(
+            [
+                [8, -19, -4, -20, 5, -36],
+                [-6, 2, -2, -2, 8, 8],
+                [13, 33, -8, 0, 23, 5],
+                [-7, -26, 9, 5, -17, -10],
+                [2, 26, -2, 10, -20, 36],
+            ]
+        )
+        _, pivot_columns = float_reduce(matrix, 5)
+        self.assertEqual(pivot_columns, [0, 1, 2, 3])
+
+    def test_float_reduce_matches_exact_rank(self):
+        rng = np.random.default_rng(3)
+        for _ in range(200):
+            matrix = rng.integers(-4, 5, (4, 3)) @ rng.integers(-4, 5, (3, 5))
+            _, pivot_columns = float_reduce(matrix, 5)
+            _, exact_columns = reduce_to_fractions(matrix.astype(object), 5)
+            self.assertEqual(pivot_columns, exact_columns)
+
+    def test_float_reduce_large_systems(self):
+        # Thresholds that compound from step to step lose rank past ~100 pivots
+        rng = np.random.default_rng(0)
+        size = 200
+        full = rng.standard_normal((size, size + 1))
+        deficient = rng.standard_normal((size, size - 1)) @ rng.standard_normal(
+            (size - 1, size + 1)
+        )
+        wide = rng.integers(-9, 10, (size, 251))
+        for matrix, rank in [(full, size), (deficient, size - 1), (wide, size)]:
+            _, pivot_columns = float_reduce(matrix, matrix.shape[1] - 1)
+            self.assertEqual(len(pivot_columns), rank)
+
+    def test_float_reduce_does_not_modify_input(self):
+        matrix = np.array([[2.0, 4.0], [1.0, 3.0]])
+        float_reduce(matrix, 1)
+        self.assertEqual(matrix.tolist(), [[2.0, 4.0], [1.0, 3.0]])
+
+
+class TestSolveSquare(unittest.TestCase):
+    def test_solve_square_nonsingular(self):
+        solution = solve_square(
+            np.array([[2.0, 0.0], [0.0, 4.0]]), np.array([2.0, 2.0])
+        )
+        self.assertTrue(np.allclose(solution, [1.0, 0.5]))
+
+    def test_solve_square_singular(self):
+        coefficients = np.array(
+            [[7, 0, 9, 2], [8, 3, 0, -3], [0, -6, 5, 1], [-9, 0, 4, 7]]
+        )
+        coefficients[3] = coefficients[0] + coefficients[1] - coefficients[2]
+        self.assertIsNone(solve_square(coefficients.astype(float), np.ones(4)))
+
+
+class TestInvertSquare(unittest.TestCase):
+    def test_invert_square_nonsingular(self):
+        inverse = invert_square(np.array([[1.0, 2.0], [3.0, 4.0]]))
+        self.assertTrue(np.allclose(inverse, [[-2, 1], [1.5, -0.5]]))
+
+    def test_invert_square_singular(self):
+        self.assertIsNone(invert_square(np.array([[1.0, 2.0], [2.0, 4.0]])))
+
+
+class TestSolveFloat(unittest.TestCase):
+    def test_solve_float_3x4(self):
+        matrix = np.array(
+            [[45, -5, -40, 100], [-5, 35, -10, 0], [-40, -10, 65, 0]], dtype=object
+        )
+        expected = [[1, 0, 0, 6], [0, 1, 0, 2], [0, 0, 1, 4]]
+        self.assertTrue(np.allclose(solve_float(matrix), expected))
+
+    def test_solve_float_fractions(self):
+        matrix = np.array(
+            [[Fraction(1, 2), 0, Fraction(1, 4)], [0, Fraction(1, 3), 1]], dtype=object
+        )
+        self.assertTrue(np.allclose(solve_float(matrix), [[1, 0, 0.5], [0, 1, 3]]))
+
+    def test_solve_float_free_variable(self):
+        matrix = np.array(
+            [[1, 0, -1, 0, 1], [0, 1, 2, -1, 3], [1, 1, 3, -1, 7]], dtype=object
+        )
+        expected = [[1, 0, 0, 0, 2.5], [0, 1, 0, -1, 0], [0, 0, 1, 0, 1.5]]
+        self.assertTrue(np.allclose(solve_float(matrix), expected))
+
+    def test_solve_float_singular_square(self):
+        matrix = np.array([[1, 2, 3], [2, 4, 6]], dtype=object)
+        expected = [[1, 2, 3], [0, 0, 0]]
+        self.assertTrue(np.allclose(solve_float(matrix), expected))
+
+    def test_solve_float_inconsistent(self):
+        matrix = np.array([[1, 1, 1], [1, 1, 2]], dtype=object)
+        solved = solve_float(matrix)
+        self.assertTrue(np.allclose(solved[1, :2], [0, 0]))
+        self.assertNotAlmostEqual(solved[1, 2], 0)
+
+    def test_solve_float_returns_float64(self):
+        matrix = np.array([[2, 4]], dtype=object)
+        self.assertEqual(solve_float(matrix).dtype, np.float64)
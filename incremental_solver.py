@@ -0,0 +1,221 @@
+import numpy as np
+from fractions import Fraction
+from math import gcd
+
+from bareiss_solver import (
+    fraction_free_back_substitute,
+    fraction_free_eliminate,
+    row_scales,
+)
+from solution import analyze_solution
+
+
+def to_fraction_matrix(matrix):
+    matrix = np.asarray(matrix)
+    fractions = np.empty(matrix.shape, dtype=object)
+    # Fraction keeps numpy integers as they are, and they overflow later
+    fractions.flat = [
+        Fraction(int(value) if isinstance(value, np.integer) else value)
+        for value in matrix.flat
+    ]
+    return fractions
+
+
+def reduce_row(numerators, denominators, row_index):
+    row = numerators[row_index]
+    if denominators[row_index] < 0:
+        row = -row
+        denominators[row_index] = -denominators[row_index]
+
+    common = gcd(denominators[row_index], *row.tolist())
+    if common > 1:
+        row = row // common
+        denominators[row_index] //= common
+    numerators[row_index] = row
+
+
+def eliminate_entry(numerators, denominators, target, source, column_index):
+    # Rows are numerators over one denominator each, so clearing an entry
+    # costs integer products and a single gcd instead of a Fraction per cell
+    factor = numerators[target, column_index]
+    pivot = numerators[source, column_index]
+    numerators[target] = numerators[target] * pivot - factor * numerators[source]
+    denominators[target] *= pivot
+    reduce_row(numerators, denominators, target)
+
+
+def swap_rows(numerators, denominators, first, second):
+    numerators[[first, second]] = numerators[[second, first]]
+    denominators[[first, second]] = denominators[[second, first]]
+
+
+def restore_reduced_form(numerators, denominators, coefficient_columns):
+    rows = len(numerators)
+    pivot_columns = []
+    pivot_row = 0
+
+    # Gauss-Jordan that only pays for columns an update disturbed: a column
+    # already reduced costs one scan, with no row operations
+    for column_index in range(coefficient_columns):
+        if pivot_row == rows:
+            break
+
+        candidates = np.flatnonzero(numerators[pivot_row:, column_index] != 0)
+        if len(candidates) == 0:
+            continue
+
+        candidate_row = pivot_row + candidates[0]
+        if candidate_row != pivot_row:
+            swap_rows(numerators, denominators, pivot_row, candidate_row)
+
+        # Dividing by the pivot only changes the row's denominator
+        if numerators[pivot_row, column_index] != denominators[pivot_row]:
+            denominators[pivot_row] = numerators[pivot_row, column_index]
+            reduce_row(numerators, denominators, pivot_row)
+
+        for row_index in np.flatnonzero(numerators[:, column_index] != 0):
+            if row_index != pivot_row:
+                eliminate_entry(
+                    numerators, denominators, row_index, pivot_row, column_index
+                )
+
+        pivot_columns.append(column_index)
+        pivot_row += 1
+
+    return pivot_columns
+
+
+class IncrementalSolver:
+    def __init__(self, matrix):
+        self.matrix = to_fraction_matrix(matrix)
+        self.factor()
+
+    @property
+    def rank(self):
+        return len(self.pivot_columns)
+
+    @property
+    def pivots(self):
+        return list(enumerate(self.pivot_columns))
+
+    @property
+    def transform(self):
+        columns = self.matrix.shape[1]
+        return self.fractions(slice(columns, None))
+
+    def fractions(self, columns):
+        block = self.numerators[:, columns]
+        result = np.empty(block.shape, dtype=object)
+        for row_index, denominator in enumerate(self.denominators):
+            result[row_index] = [
+                Fraction(value, denominator) for value in block[row_index]
+            ]
+        return result
+
+    def factor(self):
+        rows, columns = self.matrix.shape
+        scales = row_scales(self.matrix)
+
+        # Each row holds [T A | T] for a transform T, so every change to A
+        # maps onto the reduced form through T's columns
+        augmented = np.zeros((rows, columns + rows), dtype=object)
+        for row_index, scale in enumerate(scales):
+            augmented[row_index, :columns] = [
+                int(value * scale) for value in self.matrix[row_index]
+            ]
+            augmented[row_index, columns + row_index] = 1
+
+        echelon, pivot_columns = fraction_free_eliminate(augmented, columns - 1)
+        numerators, determinant, free_columns = fraction_free_back_substitute(
+            echelon, pivot_columns
+        )
+
+        self.numerators = echelon
+        for row_index, pivot_index in enumerate(pivot_columns):
+            self.numerators[row_index] = 0
+            self.numerators[row_index, pivot_index] = determinant
+            self.numerators[row_index, free_columns] = numerators[row_index]
+        self.numerators[:, columns:] *= np.array(scales, dtype=object)
+
+        self.denominators = np.full(rows, int(determinant), dtype=object)
+        for row_index in range(rows):
+            reduce_row(self.numerators, self.denominators, row_index)
+        self.pivot_columns = list(pivot_columns)
+
+    def restore(self):
+        self.pivot_columns = restore_reduced_form(
+            self.numerators, self.denominators, self.matrix.shape[1] - 1
+        )
+
+    def add_equation(self, row):
+        row = to_fraction_matrix(np.atleast_1d(row))
+        rows, columns = self.matrix.shape
+        if row.shape != (columns,):
+            raise ValueError(f"Expected an equation with {columns} entries")
+
+        scale = row_scales([row])[0]
+        new_row = np.zeros(columns + rows + 1, dtype=object)
+        new_row[:columns] = [int(value * scale) for value in row]
+        new_row[-1] = scale
+
+        self.matrix = np.vstack([self.matrix, row])
+        self.numerators = np.vstack(
+            [np.hstack([self.numerators, np.zeros((rows, 1), dtype=object)]), new_row]
+        )
+        self.denominators = np.append(self.denominators, scale)
+
+        self.restore()
+
+    def remove_equation(self, row_index):
+        rows, columns = self.matrix.shape
+        if not 0 <= row_index < rows:
+            raise ValueError(f"Row {row_index} is out of range")
+
+        # Clear the equation's column of the transform with one row that
+        # still uses it; the other rows then no longer depend on it at all
+        transform_column = columns + row_index
+        users = np.flatnonzero(self.numerators[:, transform_column] != 0)
+        source = users[-1]
+        for target in users[:-1]:
+            eliminate_entry(
+                self.numerators, self.denominators, target, source, transform_column
+            )
+
+        self.matrix = np.delete(self.matrix, row_index, axis=0)
+        self.numerators = np.delete(
+            np.delete(self.numerators, source, axis=0), transform_column, axis=1
+        )
+        self.denominators = np.delete(self.denominators, source)
+
+        self.restore()
+
+    def update_entry(self, row_index, column_index, value):
+        rows, columns = self.matrix.shape
+        if not (0 <= row_index < rows and 0 <= column_index < columns):
+            raise ValueError(f"Entry ({row_index}, {column_index}) is out of range")
+
+        value = Fraction(value)
+        change = value - self.matrix[row_index, column_index]
+        if change == 0:
+            return
+        self.matrix[row_index, column_index] = value
+
+        # A rank-one change to A adds change * T[:, row] to one column
+        transform_column = columns + row_index
+        for target in np.flatnonzero(self.numerators[:, transform_column] != 0):
+            added = change.numerator * self.numerators[target, transform_column]
+            if change.denominator != 1:
+                self.numerators[target] *= change.denominator
+                self.denominators[target] *= change.denominator
+            self.numerators[target, column_index] += added
+            reduce_row(self.numerators, self.denominators, target)
+
+        # A new constant leaves the coefficient part in reduced form
+        if column_index != columns - 1:
+            self.restore()
+
+    def solve(self):
+        return self.fractions(slice(0, self.matrix.shape[1]))
+
+    def analyze(self):
+        return analyze_solution(self.solve(), self.pivots)
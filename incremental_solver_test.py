@@ -0,0 +1,96 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+
+from bareiss_solver import solve_bareiss
+from incremental_solver import IncrementalSolver, to_fraction_matrix
+
+
+def assert_matches_bareiss(test, solver):
+    reduced = solver.solve()
+    test.assertEqual(reduced.tolist(), solve_bareiss(solver.matrix.copy()).tolist())
+    test.assertEqual(solver.transform.dot(solver.matrix).tolist(), reduced.tolist())
+
+
+class TestIncrementalSolver(unittest.TestCase):
+    def setUp(self):
+        self.solver = IncrementalSolver(
+            np.array([[2, 1, -1, 8], [-3, -1, 2, -11], [-2, 1, 2, -3]])
+        )
+
+    def test_initial_factorization(self):
+        self.assertEqual(self.solver.solve()[:, -1].tolist(), [2, 3, -1])
+        self.assertEqual(self.solver.pivot_columns, [0, 1, 2])
+        assert_matches_bareiss(self, self.solver)
+
+    def test_update_constant(self):
+        self.solver.update_entry(0, 3, 9)
+        assert_matches_bareiss(self, self.solver)
+
+    def test_update_coefficient(self):
+        self.solver.update_entry(1, 2, Fraction(1, 3))
+        assert_matches_bareiss(self, self.solver)
+
+    def test_update_makes_system_singular(self):
+        self.solver.update_entry(2, 0, -2)
+        self.solver.update_entry(2, 1, -1)
+        self.solver.update_entry(2, 2, 1)
+        self.assertEqual(self.solver.rank, 2)
+        self.assertEqual(self.solver.solve()[2, :3].tolist(), [0, 0, 0])
+
+    def test_add_and_remove_equation(self):
+        self.solver.remove_equation(2)
+        self.assertEqual(self.solver.rank, 2)
+        self.assertEqual(self.solver.pivot_columns, [0, 1])
+        assert_matches_bareiss(self, self.solver)
+
+        self.solver.add_equation([-2, 1, 2, -3])
+        self.assertEqual(self.solver.solve()[:, -1].tolist(), [2, 3, -1])
+
+    def test_add_dependent_equation(self):
+        self.solver.add_equation([4, 2, -2, 16])
+        self.assertEqual(self.solver.rank, 3)
+        self.assertEqual(self.solver.solve()[3].tolist(), [0, 0, 0, 0])
+        self.assertTrue(self.solver.analyze().consistent)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.solver.add_equation([1, 2])
+        with self.assertRaises(ValueError):
+            self.solver.remove_equation(3)
+        with self.assertRaises(ValueError):
+            self.solver.update_entry(0, 4, 1)
+
+    def test_random_updates_match_bareiss(self):
+        rng = np.random.default_rng(0)
+        for _ in range(30):
+            rows, columns = rng.integers(1, 6, 2)
+            solver = IncrementalSolver(rng.integers(-2, 3, (rows, columns + 1)))
+            for _ in range(6):
+                operation = rng.integers(3)
+                if operation == 0:
+                    solver.add_equation(rng.integers(-2, 3, columns + 1))
+                elif operation == 1 and len(solver.matrix) > 1:
+                    solver.remove_equation(int(rng.integers(len(solver.matrix))))
+                else:
+                    solver.update_entry(
+                        int(rng.integers(len(solver.matrix))),
+                        int(rng.integers(columns + 1)),
+                        int(rng.integers(-2, 3)),
+                    )
+                reduced = solver.solve()
+                expected = solve_bareiss(solver.matrix.copy())
+                self.assertEqual(reduced[:, :-1].tolist(), expected[:, :-1].tolist())
+                self.assertEqual(
+                    solver.transform.dot(solver.matrix).tolist(), reduced.tolist()
+                )
+
+
+class TestToFractionMatrix(unittest.TestCase):
+    def test_numpy_integers_become_python_ints(self):
+        fractions = to_fraction_matrix(np.array([[2**40, 1]]))
+        self.assertIs(type(fractions[0, 0].numerator), int)
+
+
+if __name__ == "__main__":
+    unittest.main()
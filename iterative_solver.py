@@ -0,0 +1,441 @@
+import numpy as np
+from collections import namedtuple
+
+from float_solver import solve_float
+
+CsrMatrix = namedtuple(
+    "CsrMatrix", ["data", "indices", "indptr", "row_indexes", "shape"]
+)
+IterativeResult = namedtuple(
+    "IterativeResult", ["solution", "converged", "iterations", "residuals"]
+)
+
+default_tolerance = 1e-10
+default_restart = 30
+
+
+def build_csr(row_indexes, column_indexes, data, shape):
+    row_indexes = np.asarray(row_indexes, dtype=np.intp)
+    order = np.lexsort((column_indexes, row_indexes))
+    row_indexes = row_indexes[order]
+
+    indptr = np.zeros(shape[0] + 1, dtype=np.intp)
+    np.cumsum(np.bincount(row_indexes, minlength=shape[0]), out=indptr[1:])
+
+    return CsrMatrix(
+        np.asarray(data, dtype=np.float64)[order],
+        np.asarray(column_indexes, dtype=np.intp)[order],
+        indptr,
+        row_indexes,
+        shape,
+    )
+
+
+def dense_to_csr(coefficients):
+    coefficients = np.asarray(coefficients, dtype=np.float64)
+    row_indexes, column_indexes = np.nonzero(coefficients)
+    return build_csr(
+        row_indexes,
+        column_indexes,
+        coefficients[row_indexes, column_indexes],
+        coefficients.shape,
+    )
+
+
+def sparse_rows_to_csr(sparse_rows, coefficient_columns):
+    row_indexes = []
+    column_indexes = []
+    data = []
+    constants = np.zeros(len(sparse_rows))
+
+    for row_index, row in enumerate(sparse_rows):
+        for column_index, value in row.items():
+            if column_index == coefficient_columns:
+                constants[row_index] = float(value)
+            elif value != 0:
+                row_indexes.append(row_index)
+                column_indexes.append(column_index)
+                data.append(float(value))
+
+    csr = build_csr(
+        row_indexes, column_indexes, data, (len(sparse_rows), coefficient_columns)
+    )
+    return csr, constants
+
+
+def split_system(matrix, columns=None):
+    # Sparse rows are the dicts used by sparse_solver, constants included
+    if isinstance(matrix, list):
+        if columns is None:
+            columns = len(matrix) + 1
+        return sparse_rows_to_csr(matrix, columns - 1)
+
+    matrix = np.asarray(matrix)
+    constants = np.array(matrix[:, -1], dtype=np.float64)
+    return dense_to_csr(matrix[:, :-1]), constants
+
+
+def csr_multiply(csr, vector):
+    products = csr.data * vector[csr.indices]
+    # bincount gives int64 when there are no weights to sum
+    sums = np.bincount(csr.row_indexes, weights=products, minlength=csr.shape[0])
+    return sums.astype(np.float64, copy=False)
+
+
+def csr_diagonal(csr):
+    diagonal = np.zeros(min(csr.shape))
+    on_diagonal = csr.row_indexes == csr.indices
+    diagonal[csr.indices[on_diagonal]] = csr.data[on_diagonal]
+    return diagonal
+
+
+def is_symmetric(csr):
+    if csr.shape[0] != csr.shape[1]:
+        return False
+    transposed = build_csr(csr.indices, csr.row_indexes, csr.data, csr.shape)
+    return (
+        np.array_equal(csr.row_indexes, transposed.row_indexes)
+        and np.array_equal(csr.indices, transposed.indices)
+        and np.array_equal(csr.data, transposed.data)
+    )
+
+
+def nonzero_diagonal(csr):
+    diagonal = csr_diagonal(csr)
+    if (diagonal == 0).any():
+        raise ValueError("The matrix has a zero on its diagonal")
+    return diagonal
+
+
+def jacobi_preconditioner(csr):
+    inverse = 1.0 / nonzero_diagonal(csr)
+    return lambda residual: residual * inverse
+
+
+def ilu_factor(csr):
+    size = csr.shape[0]
+    data = csr.data.tolist()
+    indices = csr.indices.tolist()
+    indptr = csr.indptr.tolist()
+
+    nonzero_diagonal(csr)
+    diagonal_positions = [
+        indptr[row_index]
+        + indices[indptr[row_index] : indptr[row_index + 1]].index(row_index)
+        for row_index in range(size)
+    ]
+
+    # ILU(0): Gaussian elimination that drops every entry outside the
+    # pattern of A, so the factors need no more memory than A itself
+    for row_index in range(1, size):
+        start, end = indptr[row_index], indptr[row_index + 1]
+        positions = {indices[position]: position for position in range(start, end)}
+
+        for position in range(start, diagonal_positions[row_index]):
+            column_index = indices[position]
+            factor = data[position] / data[diagonal_positions[column_index]]
+            data[position] = factor
+            for upper in range(
+                diagonal_positions[column_index] + 1, indptr[column_index + 1]
+            ):
+                target = positions.get(indices[upper])
+                if target is not None:
+                    data[target] -= factor * data[upper]
+
+        if data[diagonal_positions[row_index]] == 0:
+            raise ValueError("ILU(0) broke down on a zero pivot")
+
+    data = np.array(data)
+    lower = []
+    upper = []
+    for row_index in range(size):
+        start, end = indptr[row_index], indptr[row_index + 1]
+        diagonal = diagonal_positions[row_index]
+        lower.append((csr.indices[start:diagonal], data[start:diagonal]))
+        upper.append(
+            (csr.indices[diagonal + 1 : end], data[diagonal + 1 : end], data[diagonal])
+        )
+
+    return lower, upper
+
+
+def ilu_preconditioner(csr):
+    lower, upper = ilu_factor(csr)
+
+    def apply(residual):
+        solution = np.array(residual, dtype=np.float64)
+        for row_index, (columns, values) in enumerate(lower):
+            solution[row_index] -= values @ solution[columns]
+        for row_index in range(len(upper) - 1, -1, -1):
+            columns, values, pivot = upper[row_index]
+            solution[row_index] -= values @ solution[columns]
+            solution[row_index] /= pivot
+        return solution
+
+    return apply
+
+
+preconditioners = {
+    "jacobi": jacobi_preconditioner,
+    "ilu": ilu_preconditioner,
+}
+
+
+def make_preconditioner(csr, preconditioner):
+    if preconditioner is None or callable(preconditioner):
+        return preconditioner
+    if preconditioner not in preconditioners:
+        raise ValueError(
+            f"Unknown preconditioner '{preconditioner}'. "
+            f"Expected one of: {', '.join(preconditioners)}"
+        )
+    return preconditioners[preconditioner](csr)
+
+
+def reference_norm(constants):
+    norm = np.linalg.norm(constants)
+    return norm if norm > 0 else 1.0
+
+
+def conjugate_gradient(
+    csr, constants, initial, tolerance, max_iterations, preconditioner
+):
+    solution = initial
+    residual = constants - csr_multiply(csr, solution)
+    norm = reference_norm(constants)
+    residuals = [np.linalg.norm(residual) / norm]
+
+    search = preconditioner(residual) if preconditioner else residual.copy()
+    product = residual @ search
+    iterations = 0
+
+    while residuals[-1] > tolerance and iterations < max_iterations:
+        projected = csr_multiply(csr, search)
+        curvature = search @ projected
+        # Only symmetric positive definite systems keep this positive
+        if curvature <= 0:
+            break
+
+        step = product / curvature
+        solution += step * search
+        residual -= step * projected
+        iterations += 1
+        residuals.append(np.linalg.norm(residual) / norm)
+
+        preconditioned = preconditioner(residual) if preconditioner else residual
+        next_product = residual @ preconditioned
+        search = preconditioned + (next_product / product) * search
+        product = next_product
+
+    return IterativeResult(solution, residuals[-1] <= tolerance, iterations, residuals)
+
+
+def gmres(
+    csr,
+    constants,
+    initial,
+    tolerance,
+    max_iterations,
+    preconditioner,
+    restart=default_restart,
+):
+    size = len(constants)
+    restart = max(1, min(restart, size))
+    precondition = preconditioner or (lambda vector: vector)
+
+    solution = initial
+    norm = reference_norm(constants)
+    residual = constants - csr_multiply(csr, solution)
+    residual_norm = np.linalg.norm(residual)
+    residuals = [residual_norm / norm]
+    iterations = 0
+    stalled = False
+
+    while residuals[-1] > tolerance and iterations < max_iterations and not stalled:
+        basis = np.zeros((restart + 1, size))
+        hessenberg = np.zeros((restart + 1, restart))
+        cosines = np.zeros(restart)
+        sines = np.zeros(restart)
+        rotated = np.zeros(restart + 1)
+        rotated[0] = residual_norm
+        basis[0] = residual / residual_norm
+
+        steps = 0
+        while steps < restart and iterations < max_iterations:
+            # Right preconditioning keeps the tracked residual the true one
+            vector = csr_multiply(csr, precondition(basis[steps]))
+            for index in range(steps + 1):
+                hessenberg[index, steps] = vector @ basis[index]
+                vector -= hessenberg[index, steps] * basis[index]
+            length = np.linalg.norm(vector)
+            hessenberg[steps + 1, steps] = length
+            if length > 0:
+                basis[steps + 1] = vector / length
+
+            for index in range(steps):
+                first = hessenberg[index, steps]
+                second = hessenberg[index + 1, steps]
+                hessenberg[index, steps] = (
+                    cosines[index] * first + sines[index] * second
+                )
+                hessenberg[index + 1, steps] = (
+                    -sines[index] * first + cosines[index] * second
+                )
+
+            radius = np.hypot(hessenberg[steps, steps], length)
+            if radius == 0:
+                # The Krylov space stopped growing: A is singular on it
+                stalled = True
+                break
+            cosines[steps] = hessenberg[steps, steps] / radius
+            sines[steps] = length / radius
+            hessenberg[steps, steps] = radius
+            hessenberg[steps + 1, steps] = 0.0
+            rotated[steps + 1] = -sines[steps] * rotated[steps]
+            rotated[steps] *= cosines[steps]
+
+            steps += 1
+            iterations += 1
+            residuals.append(abs(rotated[steps]) / norm)
+            if residuals[-1] <= tolerance:
+                break
+            if length == 0:
+                stalled = True
+                break
+
+        coefficients = np.zeros(steps)
+        for index in range(steps - 1, -1, -1):
+            coefficients[index] = (
+                rotated[index]
+                - hessenberg[index, index + 1 : steps] @ coefficients[index + 1 :]
+            ) / hessenberg[index, index]
+        solution += precondition(coefficients @ basis[:steps])
+
+        residual = constants - csr_multiply(csr, solution)
+        residual_norm = np.linalg.norm(residual)
+        residuals[-1] = residual_norm / norm
+
+    return IterativeResult(solution, residuals[-1] <= tolerance, iterations, residuals)
+
+
+def gauss_seidel(csr, constants, initial, tolerance, max_iterations, preconditioner):
+    if preconditioner is not None:
+        raise ValueError("Gauss-Seidel does not take a preconditioner")
+
+    diagonal = nonzero_diagonal(csr)
+    rows = [
+        (csr.indices[start:end], csr.data[start:end])
+        for start, end in zip(csr.indptr[:-1], csr.indptr[1:])
+    ]
+
+    solution = initial
+    norm = reference_norm(constants)
+    residuals = [np.linalg.norm(constants - csr_multiply(csr, solution)) / norm]
+    iterations = 0
+
+    while residuals[-1] > tolerance and iterations < max_iterations:
+        for row_index, (columns, values) in enumerate(rows):
+            solution[row_index] += (
+                constants[row_index] - values @ solution[columns]
+            ) / diagonal[row_index]
+        iterations += 1
+        residuals.append(np.linalg.norm(constants - csr_multiply(csr, solution)) / norm)
+
+    return IterativeResult(solution, residuals[-1] <= tolerance, iterations, residuals)
+
+
+iterative_methods = {
+    "cg": conjugate_gradient,
+    "gmres": gmres,
+    "gauss_seidel": gauss_seidel,
+}
+
+
+def iterate(
+    csr,
+    constants,
+    method="cg",
+    preconditioner=None,
+    tolerance=default_tolerance,
+    max_iterations=None,
+    initial=None,
+    **options,
+):
+    if method not in iterative_methods:
+        raise ValueError(
+            f"Unknown method '{method}'. "
+            f"Expected one of: {', '.join(iterative_methods)}"
+        )
+
+    if csr.shape[0] != csr.shape[1]:
+        raise ValueError("Iterative methods need a square coefficient matrix")
+
+    size = csr.shape[0]
+    if max_iterations is None:
+        max_iterations = 10 * size
+    if initial is None:
+        initial = np.zeros(size)
+
+    return iterative_methods[method](
+        csr,
+        np.asarray(constants, dtype=np.float64),
+        np.array(initial, dtype=np.float64),
+        tolerance,
+        max_iterations,
+        make_preconditioner(csr, preconditioner),
+        **options,
+    )
+
+
+def solve_iterative(
+    matrix,
+    method="cg",
+    preconditioner=None,
+    tolerance=default_tolerance,
+    max_iterations=None,
+    initial=None,
+    columns=None,
+    **options,
+):
+    csr, constants = split_system(matrix, columns)
+    return iterate(
+        csr,
+        constants,
+        method,
+        preconditioner,
+        tolerance,
+        max_iterations,
+        initial,
+        **options,
+    )
+
+
+def solve_iterative_system(matrix):
+    rows, columns = matrix.shape
+    if rows != columns - 1 or rows == 0:
+        return solve_float(matrix)
+
+    csr, constants = split_system(matrix)
+    method = "cg" if is_symmetric(csr) and (csr_diagonal(csr) > 0).all() else "gmres"
+    try:
+        preconditioner = jacobi_preconditioner(csr)
+    except ValueError:
+        method, preconditioner = "gmres", None
+
+    result = iterate(csr, constants, method, preconditioner)
+
+    # As in solve_square, a random right-hand side exposes singular matrices
+    # that the actual constants happen to be consistent with
+    converged = result.converged
+    if converged:
+        probe = np.random.default_rng(0).standard_normal(rows)
+        converged = iterate(csr, probe, method, preconditioner).converged
+
+    if not converged:
+        # Singular or badly conditioned systems get the direct reduction
+        return solve_float(matrix)
+
+    solved_matrix = np.zeros((rows, columns))
+    solved_matrix[:, :-1] = np.eye(rows)
+    solved_matrix[:, -1] = result.solution
+    return solved_matrix
@@ -0,0 +1,148 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+
+from iterative_solver import (
+    csr_diagonal,
+    csr_multiply,
+    dense_to_csr,
+    ilu_factor,
+    is_symmetric,
+    solve_iterative,
+    solve_iterative_system,
+    split_system,
+)
+from linear_sistem_solver import solve_linear_system
+
+
+def poisson_rows(size):
+    # The 1-D Laplacian: symmetric, positive definite and tridiagonal
+    rows = [{index: 2.0, size: 1.0} for index in range(size)]
+    for index in range(size - 1):
+        rows[index][index + 1] = -1.0
+        rows[index + 1][index] = -1.0
+    return rows
+
+
+def dominant_system(size, seed=0):
+    rng = np.random.default_rng(seed)
+    coefficients = rng.standard_normal((size, size))
+    coefficients += 2 * size * np.eye(size)
+    solution = rng.standard_normal(size)
+    return np.column_stack([coefficients, coefficients @ solution]), solution
+
+
+class TestCsr(unittest.TestCase):
+    def test_csr_multiply_matches_dense(self):
+        matrix = np.array([[1.0, 0.0, 2.0], [0.0, 0.0, 0.0], [3.0, 4.0, 0.0]])
+        csr = dense_to_csr(matrix)
+        vector = np.array([1.0, 2.0, 3.0])
+        self.assertEqual(csr_multiply(csr, vector).tolist(), [7.0, 0.0, 11.0])
+        self.assertEqual(csr_diagonal(csr).tolist(), [1.0, 0.0, 0.0])
+
+    def test_csr_multiply_without_entries_is_float(self):
+        csr = dense_to_csr(np.zeros((2, 2)))
+        product = csr_multiply(csr, np.ones(2))
+        self.assertEqual(product.dtype, np.float64)
+        self.assertEqual(product.tolist(), [0.0, 0.0])
+
+    def test_split_sparse_rows(self):
+        csr, constants = split_system([{0: Fraction(1, 2), 2: 3}, {1: 4}])
+        self.assertEqual(csr.shape, (2, 2))
+        self.assertEqual(csr.data.tolist(), [0.5, 4.0])
+        self.assertEqual(constants.tolist(), [3.0, 0.0])
+
+    def test_is_symmetric(self):
+        self.assertTrue(is_symmetric(dense_to_csr([[2, 1], [1, 3]])))
+        self.assertFalse(is_symmetric(dense_to_csr([[2, 1], [0, 3]])))
+
+    def test_ilu_factor_is_exact_on_tridiagonal(self):
+        # No fill-in is possible, so ILU(0) is the full LU factorization
+        csr, _ = split_system(poisson_rows(4))
+        lower, upper = ilu_factor(csr)
+        self.assertAlmostEqual(upper[3][2], 5 / 4)
+        self.assertAlmostEqual(lower[1][1][0], -1 / 2)
+
+
+class TestSolveIterative(unittest.TestCase):
+    def test_methods_and_preconditioners_converge(self):
+        matrix, solution = dominant_system(40)
+        cases = [
+            ("cg", None),
+            ("cg", "jacobi"),
+            ("cg", "ilu"),
+            ("gmres", None),
+            ("gmres", "jacobi"),
+            ("gmres", "ilu"),
+            ("gauss_seidel", None),
+        ]
+        symmetric = matrix.copy()
+        symmetric[:, :-1] = (matrix[:, :-1] + matrix[:, :-1].T) / 2
+        symmetric[:, -1] = symmetric[:, :-1] @ solution
+        for method, preconditioner in cases:
+            with self.subTest(method=method, preconditioner=preconditioner):
+                result = solve_iterative(symmetric, method, preconditioner)
+                self.assertTrue(result.converged)
+                self.assertTrue(np.allclose(result.solution, solution))
+
+    def test_history_ends_below_tolerance(self):
+        result = solve_iterative(poisson_rows(50), "cg", tolerance=1e-8)
+        self.assertEqual(len(result.residuals), result.iterations + 1)
+        self.assertLessEqual(result.residuals[-1], 1e-8)
+        self.assertLessEqual(result.iterations, 50)
+
+    def test_gmres_nonsymmetric_with_restart(self):
+        matrix, solution = dominant_system(60, seed=1)
+        result = solve_iterative(matrix, "gmres", "jacobi", restart=5)
+        self.assertTrue(result.converged)
+        self.assertTrue(np.allclose(result.solution, solution))
+
+    def test_max_iterations_stops_early(self):
+        result = solve_iterative(poisson_rows(100), "gauss_seidel", max_iterations=3)
+        self.assertFalse(result.converged)
+        self.assertEqual(result.iterations, 3)
+
+    def test_initial_guess(self):
+        matrix, solution = dominant_system(10)
+        result = solve_iterative(matrix, "gmres", initial=solution)
+        self.assertTrue(result.converged)
+        self.assertLessEqual(result.iterations, 1)
+
+    def test_invalid_arguments(self):
+        matrix, _ = dominant_system(3)
+        with self.assertRaises(ValueError):
+            solve_iterative(matrix, "sor")
+        with self.assertRaises(ValueError):
+            solve_iterative(matrix, "cg", "amg")
+        with self.assertRaises(ValueError):
+            solve_iterative(matrix, "gauss_seidel", "jacobi")
+        with self.assertRaises(ValueError):
+            solve_iterative(np.ones((2, 4)))
+        with self.assertRaises(ValueError):
+            solve_iterative(np.array([[0.0, 1.0, 1.0], [1.0, 0.0, 1.0]]), "cg", "ilu")
+
+
+class TestSolveIterativeSystem(unittest.TestCase):
+    def test_returns_reduced_matrix(self):
+        matrix = np.array([[4, 1, 1], [1, 3, 2]], dtype=object)
+        reduced = solve_linear_system(matrix, "iterative")
+        self.assertTrue(np.allclose(reduced, [[1, 0, 1 / 11], [0, 1, 7 / 11]]))
+
+    def test_singular_falls_back_to_reduction(self):
+        matrix = np.array([[1, 2, 3], [2, 4, 6]], dtype=object)
+        reduced = solve_iterative_system(matrix)
+        self.assertTrue(np.allclose(reduced, [[1, 2, 3], [0, 0, 0]]))
+
+    def test_zero_coefficients(self):
+        reduced = solve_linear_system(np.array([[0, -2]]), "iterative")
+        self.assertEqual(reduced.tolist(), [[0.0, -2.0]])
+        reduced = solve_linear_system(np.zeros((3, 4)), "iterative")
+        self.assertEqual(reduced.tolist(), np.zeros((3, 4)).tolist())
+
+    def test_non_square_falls_back_to_reduction(self):
+        reduced = solve_iterative_system(np.array([[1.0, 1.0, 2.0, 3.0]]))
+        self.assertTrue(np.allclose(reduced, [[1, 1, 2, 3]]))
+
+
+if __name__ == "__main__":
+    unittest.main()
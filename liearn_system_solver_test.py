@@ -9,6 +9,11 @@ from linear_sistem_solver import (
     check_is_pivot,
     find_any_pivot_index,
     find_any_pivot_index_row,
+    find_best_pivot_index,
+    find_zero_row_order,
+    find_leading_column,
+    find_leading_columns,
+    find_pivot_index,
     push_zero_row_to_the_end,
     solve_linear_system,
     swap_row,
@@ -32,6 +37,18 @@ class TestSwapRow(unittest.TestCase):
         self.assertTrue((swap_row(matrix, 1, 2) == expected).all())
 
 
+class TestFindLeadingColumn(unittest.TestCase):
+    def test_find_leading_column(self):
+        self.assertEqual(find_leading_column(np.array([0, 0, 3, 0])), 2)
+
+    def test_find_leading_column_zero_row(self):
+        self.assertEqual(find_leading_column(np.array([0, 0, 0])), 3)
+
+    def test_find_leading_columns(self):
+        matrix = np.array([[0, 2, 1], [0, 0, 0], [5, 0, 0]], dtype=object)
+        self.assertEqual(find_leading_columns(matrix).tolist(), [1, 3, 0])
+
+
 class TestFindAnyPivotIndexRow(unittest.TestCase):
     def test_find_any_pivot_index_2x2(self):
         row = np.array([1, 2])
@@ -100,6 +117,35 @@ class TestFindAnyPivotIndex(unittest.TestCase):
         matrix = np.array([[0, 0, 3], [1, 0, 0], [0, 0, 0]])
         self.assertEqual(find_any_pivot_index(matrix, 1, -1), 1)
 
+    def test_find_any_pivot_index_negative_prefix(self):
+        # A prefix of zeros and negatives has a zero maximum and stays eligible
+        matrix = np.array([[1, 2, 3, 4], [-1, 0, 5, 1]])
+        self.assertEqual(find_any_pivot_index(matrix, 1, 1), 1)
+
+    def test_find_any_pivot_index_positive_prefix(self):
+        matrix = np.array([[1, 2, 3, 4], [1, 0, 5, 1]])
+        self.assertEqual(find_any_pivot_index(matrix, 1, 1), -1)
+
+    def test_find_any_pivot_index_uses_leading_columns(self):
+        matrix = np.array([[1, 2, 3], [0, 4, 5]])
+        self.assertEqual(find_any_pivot_index(matrix, 0, 0, np.array([0, 1])), 1)
+
+
+class TestFindPivotIndex(unittest.TestCase):
+    def test_find_pivot_index(self):
+        matrix = np.array([[0, 2, 3], [1, 0, 3], [0, 0, 1]])
+        self.assertEqual(find_pivot_index(matrix, 0), 1)
+        self.assertEqual(find_pivot_index(matrix, 2), 2)
+
+    def test_find_pivot_index_zero_row_beyond_columns(self):
+        matrix = np.array([[1, 2], [0, 0], [0, 0]])
+        self.assertEqual(find_pivot_index(matrix, 2), 1)
+
+    def test_find_best_pivot_index(self):
+        matrix = np.array([[0, 2, 3], [1, 0, 3], [0, 0, 1]])
+        self.assertEqual(find_best_pivot_index(matrix, 1), 0)
+        self.assertEqual(find_best_pivot_index(matrix, 3), -1)
+
 
 class TestCheckIsPivot(unittest.TestCase):
     def test_check_is_pivot_2x2(self):
@@ -118,6 +164,10 @@ class TestCheckIsPivot(unittest.TestCase):
         row = np.array([0, 0, 3])
         self.assertFalse(check_is_pivot(row, 1))
 
+    def test_check_is_pivot_zero_row_beyond_columns(self):
+        row = np.array([0, 0])
+        self.assertTrue(check_is_pivot(row, 3))
+
 
 class TestPushZeroRowToTheEnd(unittest.TestCase):
     def test_push_zero_row_to_the_end_2x2(self):
@@ -174,6 +224,36 @@ class TestPushZeroRowToTheEnd(unittest.TestCase):
         )
         self.assertTrue((push_zero_row_to_the_end(matrix) == expected).all())
 
+    def test_push_zero_row_to_the_end_keeps_zero_row_order(self):
+        matrix = np.array([[0, 0, 1], [0, 0, 2], [1, 2, 3], [0, 0, 3]])
+        expected = np.array([[1, 2, 3], [0, 0, 1], [0, 0, 2], [0, 0, 3]])
+        self.assertTrue((push_zero_row_to_the_end(matrix) == expected).all())
+
+    def test_push_zero_row_to_the_end_negative_row(self):
+        matrix = np.array([[-1, 0, 5], [0, 0, 0], [0, -2, 1]])
+        expected = np.array([[-1, 0, 5], [0, -2, 1], [0, 0, 0]])
+        self.assertTrue((push_zero_row_to_the_end(matrix) == expected).all())
+
+    def test_push_zero_row_to_the_end_in_place(self):
+        matrix = np.array([[0, 0, 0], [1, 2, 3]])
+        self.assertIs(push_zero_row_to_the_end(matrix), matrix)
+
+    def test_push_zero_row_to_the_end_tracks_row_order(self):
+        matrix = np.array([[0, 0, 0], [1, 2, 3], [0, 0, 0], [4, 5, 6]])
+        row_order = np.arange(4)
+        push_zero_row_to_the_end(matrix, row_order)
+        self.assertEqual(row_order.tolist(), [1, 3, 0, 2])
+
+
+class TestFindZeroRowOrder(unittest.TestCase):
+    def test_find_zero_row_order(self):
+        matrix = np.array([[0, 0, 7], [1, 0, 0], [0, 0, 0], [0, 3, 0]])
+        self.assertEqual(find_zero_row_order(matrix).tolist(), [1, 3, 0, 2])
+
+    def test_find_zero_row_order_no_zero_rows(self):
+        matrix = np.array([[1, 0], [0, 1]])
+        self.assertEqual(find_zero_row_order(matrix).tolist(), [0, 1])
+
 
 class TestAutoSwap(unittest.TestCase):
     def test_auto_swap_2x2(self):
@@ -196,6 +276,11 @@ class TestAutoSwap(unittest.TestCase):
         expected = np.array([[1, 2, 0], [0, 2, 3], [0, 0, 3]])
         self.assertTrue((auto_swap(matrix) == expected).all())
 
+    def test_auto_swap_5x3_zero_rows(self):
+        matrix = np.array([[0, 0, 0], [1, 2, 3], [0, 0, 0], [0, 0, 0], [0, 4, 5]])
+        expected = np.array([[1, 2, 3], [0, 4, 5], [0, 0, 0], [0, 0, 0], [0, 0, 0]])
+        self.assertTrue((auto_swap(matrix) == expected).all())
+
     def test_auto_swap_3x3_4(self):
         matrix = np.array([[1, 2, 3, 4], [0, 0, 0, 0], [0, 0, 3, 0]])
         expected = np.array([[1, 2, 3, 4], [0, 0, 3, 0], [0, 0, 0, 0]])
@@ -220,6 +305,12 @@ class TestAutoMultiply(unittest.TestCase):
         expected = np.array([[0, 3, 3, 3], [1, 2, 2, 2], [1, 1, 10, 1]], dtype=object)
         self.assertTrue((auto_multiply(matrix) == expected).all())
 
+    def test_auto_multiply_records_pivots(self):
+        matrix = np.array([[3, 3, 3, 3], [0, 2, 2, 2], [0, 0, 10, 1]], dtype=object)
+        pivots = []
+        auto_multiply(matrix, pivots=pivots)
+        self.assertEqual(pivots, [(0, 0), (1, 1), (2, 2)])
+
 
 class TestAutoAdd(unittest.TestCase):
     def test_auto_add_3x3_no_action(self):
@@ -241,6 +332,11 @@ class TestAutoAdd(unittest.TestCase):
         )
         self.assertTrue((auto_add(matrix) == expected).all())
 
+    def test_auto_add_uses_pivot_column_of_current_row(self):
+        matrix = np.array([[1, 0, 0, 1], [0, 0, 1, 1], [0, 0, 2, 3]], dtype=object)
+        expected = np.array([[1, 0, 0, 1], [0, 0, 1, 1], [0, 0, 0, 1]], dtype=object)
+        self.assertTrue((auto_add(matrix) == expected).all())
+
 
 class TestSolveLinearSystem(unittest.TestCase):
     def test_solve_linear_system_3x4(self):
@@ -270,6 +366,36 @@ class TestSolveLinearSystem(unittest.TestCase):
         )
         self.assertTrue((solve_linear_system(matrix) == expected).all())
 
+    def test_solve_linear_system_4x3_zero_column(self):
+        matrix = np.array(
+            [[-1, 0, 1], [-3, 0, 2], [-3, 0, 0], [-1, -1, -1]], dtype=object
+        )
+        expected = np.array(
+            [[1, 0, -1], [0, 1, 2], [0, 0, -3], [0, 0, -1]], dtype=object
+        )
+        self.assertTrue((solve_linear_system(matrix) == expected).all())
+
+    def test_solve_linear_system_6x4_inconsistent(self):
+        matrix = np.array(
+            [
+                [-2, -2, 0, -4],
+                [1, 1, -2, -2],
+                [-1, 1, -2, 4],
+                [3, -3, 0, 1],
+                [2, 4, -4, -4],
+                [-1, -1, -2, -6],
+            ],
+            dtype=object,
+        )
+        reduced = solve_linear_system(matrix)
+        self.assertTrue(
+            (
+                reduced[:, :-1]
+                == [[1, 0, 0], [0, 0, 1], [0, 2, 0], [0, 0, 0], [0, 0, 0], [0, 0, 0]]
+            ).all()
+        )
+        self.assertTrue(reduced[3:, -1].any())
+
     def test_solve_linear_system_3x2(self):
         matrix = np.array([[6, -5, 10], [-5, 17, -30]], dtype=object)
         expected = np.array(
@@ -378,3 +504,48 @@ class TestSolveLinearSystem(unittest.TestCase):
             dtype=object,
         )
         self.assertTrue((solve_linear_system(matrix) == expected).all())
+
+    def test_solve_linear_system_bareiss_method(self):
+        matrix = np.array([[1, -2, 1, 0], [0, 2, -8, 8], [5, 0, -5, 10]], dtype=object)
+        expected = np.array([[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, -1]], dtype=object)
+        self.assertTrue(
+            (solve_linear_system(matrix, method="bareiss") == expected).all()
+        )
+
+    def test_solve_linear_system_unknown_method(self):
+        matrix = np.array([[1, 2], [3, 4]], dtype=object)
+        with self.assertRaises(ValueError):
+            solve_linear_system(matrix, method="magic")
+
+    def test_solve_linear_system_float_method(self):
+        matrix = np.array([[1, -2, 1, 0], [0, 2, -8, 8], [5, 0, -5, 10]], dtype=object)
+        expected = [[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, -1]]
+        self.assertTrue(
+            np.allclose(solve_linear_system(matrix, method="float"), expected)
+        )
+
+    def test_solve_linear_system_sparse_method(self):
+        matrix = np.array([[1, -2, 1, 0], [0, 2, -8, 8], [5, 0, -5, 10]], dtype=object)
+        expected = np.array([[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, -1]], dtype=object)
+        self.assertTrue(
+            (solve_linear_system(matrix, method="sparse") == expected).all()
+        )
+
+    def test_solve_linear_system_modular_method(self):
+        matrix = np.array([[1, -2, 1, 0], [0, 2, -8, 8], [5, 0, -5, 10]], dtype=object)
+        expected = np.array([[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, -1]], dtype=object)
+        self.assertTrue(
+            (solve_linear_system(matrix, method="modular") == expected).all()
+        )
+
+    def test_solve_linear_system_bareiss_workers(self):
+        matrix = np.array([[1, -2, 1, 0], [0, 2, -8, 8], [5, 0, -5, 10]], dtype=object)
+        expected = np.array([[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, -1]], dtype=object)
+        self.assertTrue(
+            (solve_linear_system(matrix, method="bareiss", workers=2) == expected).all()
+        )
+
+    def test_solve_linear_system_workers_unsupported_method(self):
+        matrix = np.array([[1, 2], [3, 4]], dtype=object)
+        with self.assertRaises(ValueError):
+            solve_linear_system(matrix, method="fraction", workers=2)
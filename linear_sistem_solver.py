@@ -1,6 +1,16 @@
 import numpy as np
 from fractions import Fraction
 
+from bareiss_solver import solve_bareiss
+from float_solver import solve_float
+from iterative_solver import solve_iterative_system
+from mixed_solver import solve_mixed
+from modular_solver import solve_modular
+from parallel_solver import solve_bareiss_parallel, solve_float_parallel
+from rational_matrix import solve_rational
+from sparse_solver import solve_sparse
+from structured_solver import solve_structured
+
 
 def swap_row(matrix, row_A, row_B):
     temp_row = matrix[row_A].copy()
@@ -10,121 +20,154 @@ def swap_row(matrix, row_A, row_B):
     return matrix
 
 
-def check_is_best_pivot(row, last_pivot_index):
-    if row[last_pivot_index] != 0:
-        for index in range(last_pivot_index):
-            if row[index] != 0:
-                return False
-        return True
-    else:
-        return False
+def find_leading_column(row):
+    nonzero = np.flatnonzero(row != 0)
+    if len(nonzero) == 0:
+        return len(row)
+    return int(nonzero[0])
 
 
-def find_any_pivot_index_row(row, last_pivot_index):
-    if last_pivot_index == -1 and row[0] != 0:
-        return 0
+def find_leading_columns(matrix):
+    nonzero = matrix != 0
+    leading_columns = nonzero.argmax(axis=1)
+    leading_columns[~nonzero.any(axis=1)] = matrix.shape[1]
+    return leading_columns
 
-    if last_pivot_index == -1 and row[0] == 0:
-        return -1
 
-    if last_pivot_index == 0 and row[0] != 0:
-        return -1
+def is_pivot_at(leading_columns, index, size):
+    return (leading_columns == index) | ((index >= size) & (leading_columns == size))
 
-    if last_pivot_index > 0 and row[: last_pivot_index + 1].max() != 0:
-        return -1
 
-    rows = len(row)
+def check_is_best_pivot(row, last_pivot_index):
+    return find_leading_column(row) == last_pivot_index
+
+
+def find_next_pivot_columns(matrix, leading_columns, last_pivot_index):
+    columns = matrix.shape[1]
+
+    if last_pivot_index == -1:
+        return np.where(leading_columns == 0, 0, -1)
+
+    pivot_columns = np.where(
+        (leading_columns > last_pivot_index) & (leading_columns < columns - 1),
+        leading_columns,
+        -1,
+    )
+
+    # Rows with a nonzero prefix are only rejected when the prefix maximum
+    # is nonzero, so a prefix of zeros and negatives can still hold a pivot
+    if last_pivot_index > 0:
+        prefixed_rows = np.flatnonzero(leading_columns <= last_pivot_index)
+        if len(prefixed_rows) > 0:
+            block = matrix[prefixed_rows]
+            open_prefix = block[:, : last_pivot_index + 1].max(axis=1) == 0
+            tail = block[:, last_pivot_index + 1 : columns - 1] != 0
+            if tail.shape[1] == 0:
+                pivot_columns[prefixed_rows] = -1
+            else:
+                pivot_columns[prefixed_rows] = np.where(
+                    open_prefix & tail.any(axis=1),
+                    tail.argmax(axis=1) + last_pivot_index + 1,
+                    -1,
+                )
 
-    for index in range(last_pivot_index + 1, rows - 1):
-        if row[index] != 0:
-            return index
-    return -1
+    return pivot_columns
 
 
-def find_best_pivot_index(matrix, row_index):
-    rows = len(matrix)
+def find_any_pivot_index_row(row, last_pivot_index, leading_column=None):
+    if leading_column is None:
+        leading_column = find_leading_column(row)
+    pivot_columns = find_next_pivot_columns(
+        row[None, :], np.array([leading_column]), last_pivot_index
+    )
+    return int(pivot_columns[0])
 
-    for index in range(rows):
-        row = matrix[index]
-        if check_is_best_pivot(row, row_index):
-            return index
-    return -1
 
+def first_match(mask, offset=0):
+    matches = np.flatnonzero(mask)
+    if len(matches) == 0:
+        return -1
+    return offset + int(matches[0])
 
-def find_any_pivot_index(matrix, row_index, previous_pivot_index):
-    rows = len(matrix)
 
-    for index in range(row_index, rows):
-        row = matrix[index]
-        if find_any_pivot_index_row(row, previous_pivot_index) > -1:
-            return index
-    return -1
+def find_best_pivot_index(matrix, row_index, leading_columns=None):
+    if leading_columns is None:
+        leading_columns = find_leading_columns(matrix)
+    return first_match(leading_columns == row_index)
 
 
-def check_is_pivot(row, index):
-    size = len(row)
-    if index >= size or row[index] != 0:
-        for index in range(index):
-            if row[index] != 0:
-                return False
-        return True
-    else:
-        return False
+def find_any_pivot_index(matrix, row_index, previous_pivot_index, leading_columns=None):
+    if leading_columns is None:
+        leading_columns = find_leading_columns(matrix)
+    pivot_columns = find_next_pivot_columns(
+        matrix[row_index:], leading_columns[row_index:], previous_pivot_index
+    )
+    return first_match(pivot_columns > -1, row_index)
 
 
-def find_pivot_index(matrix, row_index):
-    rows = len(matrix)
+def check_is_pivot(row, index):
+    return bool(is_pivot_at(find_leading_column(row), index, len(row)))
 
-    for index in range(rows):
-        row = matrix[index]
-        if check_is_pivot(row, row_index):
-            return index
-    return -1
 
+def find_pivot_index(matrix, row_index, leading_columns=None):
+    if leading_columns is None:
+        leading_columns = find_leading_columns(matrix)
+    return first_match(is_pivot_at(leading_columns, row_index, matrix.shape[1]))
 
-def push_zero_row_to_the_end(matrix):
-    rows, columns = matrix.shape
 
-    floating_index = -1
-    real_index = -1
-    stop_index = rows * columns
+def find_zero_row_order(matrix):
+    columns = matrix.shape[1]
+    is_zero_row = ~(matrix[:, : columns - 1] != 0).any(axis=1)
+    return np.concatenate([np.flatnonzero(~is_zero_row), np.flatnonzero(is_zero_row)])
+
 
-    while real_index != stop_index and floating_index != rows - 1:
-        floating_index += 1
-        real_index += 1
-        row = matrix[floating_index]
+def push_zero_row_to_the_end(matrix, row_order=None, profiler=None):
+    order = find_zero_row_order(matrix)
 
-        if row[: columns - 1].max() == 0:
-            matrix = np.delete(matrix, floating_index, 0)
-            matrix = np.append(matrix, [row], axis=0)
-            floating_index = -1
+    # Rows ahead of the first displaced one are already in place
+    moved = np.flatnonzero(order != np.arange(len(order)))
+    if len(moved) > 0:
+        start = moved[0]
+        matrix[start:] = matrix[order[start:]]
+        if row_order is not None:
+            row_order[start:] = row_order[order[start:]]
+        if profiler is not None:
+            profiler.count("zero_rows_moved", len(moved))
 
     return matrix
 
 
-def auto_swap(matrix):
-    rows = len(matrix)
+def auto_swap(matrix, profiler=None):
+    rows, columns = matrix.shape
+    leading_columns = find_leading_columns(matrix)
 
     # Swaps best case scenario
     for row_index in range(rows):
-        row = matrix[row_index]
-        if check_is_pivot(row, row_index) == False:
-            pivot_index = find_pivot_index(matrix, row_index)
+        if not is_pivot_at(leading_columns[row_index], row_index, columns):
+            pivot_index = find_pivot_index(matrix, row_index, leading_columns)
             if pivot_index > -1:
                 matrix = swap_row(matrix, row_index, pivot_index)
+                swap_row(leading_columns, row_index, pivot_index)
+                if profiler is not None:
+                    profiler.count("row_swaps")
 
     # Swaps any case scenario
     for row_index in range(rows):
-        row = matrix[row_index]
-        if check_is_pivot(row, row_index) == False:
-            pivot_index = find_any_pivot_index(matrix, row_index, row_index)
+        if not is_pivot_at(leading_columns[row_index], row_index, columns):
+            pivot_index = find_any_pivot_index(
+                matrix, row_index, row_index, leading_columns
+            )
             if pivot_index > -1:
                 matrix = swap_row(matrix, row_index, pivot_index)
+                swap_row(leading_columns, row_index, pivot_index)
+                if profiler is not None:
+                    profiler.count("row_swaps")
     return matrix
 
 
-def auto_multiply(matrix):
+def auto_multiply(matrix, profiler=None, pivots=None):
     rows, columns = matrix.shape
+    leading_columns = find_leading_columns(matrix)
 
     pivot_index = -1
 
@@ -134,27 +177,38 @@ def auto_multiply(matrix):
 
         current_row = matrix[row_index]
 
-        candidate_pivot = find_any_pivot_index_row(current_row, pivot_index)
+        candidate_pivot = find_any_pivot_index_row(
+            current_row, pivot_index, leading_columns[row_index]
+        )
 
         is_pivot = candidate_pivot > -1
         if is_pivot:
             pivot_index = candidate_pivot
+            if pivots is not None:
+                pivots.append((row_index, pivot_index))
             cell_value = current_row[pivot_index]
             if cell_value != 1:
                 matrix[row_index] = Fraction(1, cell_value) * current_row
+                if profiler is not None:
+                    profiler.record_row("row_scalings", matrix[row_index], columns + 1)
     return matrix
 
 
-def auto_add(matrix):
+def auto_add(matrix, profiler=None):
     rows = len(matrix)
+    leading_columns = find_leading_columns(matrix)
 
     pivot_index = -1
 
     for row_index in range(rows - 1):
         current_row = matrix[row_index]
-        pivot_index = find_any_pivot_index(matrix, row_index, pivot_index)
-        if pivot_index == -1:
+        # The pivot is a column of this row, not the index of a row below
+        candidate_pivot = find_any_pivot_index_row(
+            current_row, pivot_index, leading_columns[row_index]
+        )
+        if candidate_pivot == -1:
             continue
+        pivot_index = candidate_pivot
         for column_index in range(row_index + 1, rows):
             cell_value = matrix[column_index][pivot_index]
             current_row_value = current_row[pivot_index]
@@ -164,10 +218,17 @@ def auto_add(matrix):
                 matrix[column_index] = (
                     row_multiplier * current_row + matrix[column_index]
                 )
+                leading_columns[column_index] = find_leading_column(
+                    matrix[column_index]
+                )
+                if profiler is not None:
+                    profiler.record_row(
+                        "row_additions", matrix[column_index], 2 * len(current_row) + 1
+                    )
     return matrix
 
 
-def auto_add_reverse(matrix):
+def auto_add_reverse(matrix, profiler=None):
     rows, columns = matrix.shape
 
     for row_index in reversed(range(rows)):
@@ -180,33 +241,94 @@ def auto_add_reverse(matrix):
                     matrix[row_index_above] = (
                         row_multiplier * matrix[row_index] + matrix[row_index_above]
                     )
+                    if profiler is not None:
+                        profiler.record_row(
+                            "row_additions", matrix[row_index_above], 2 * columns + 1
+                        )
 
     return matrix
 
 
-def solve_top_to_bottom(matrix):
-    matrix = push_zero_row_to_the_end(matrix)
-    matrix = auto_swap(matrix)
-    matrix = auto_multiply(matrix)
-    matrix = auto_add(matrix)
+def run_stage(stage, matrix, profiler, **options):
+    if profiler is None:
+        return stage(matrix, **options)
+    with profiler.stage(stage.__name__):
+        return stage(matrix, profiler=profiler, **options)
+
+
+def solve_top_to_bottom(matrix, profiler=None):
+    matrix = run_stage(push_zero_row_to_the_end, matrix, profiler)
+    matrix = run_stage(auto_swap, matrix, profiler)
+    matrix = run_stage(auto_multiply, matrix, profiler)
+    matrix = run_stage(auto_add, matrix, profiler)
 
-    matrix = auto_swap(matrix)
-    matrix = auto_multiply(matrix)
-    matrix = push_zero_row_to_the_end(matrix)
+    matrix = run_stage(auto_swap, matrix, profiler)
+    matrix = run_stage(auto_multiply, matrix, profiler)
+    matrix = run_stage(push_zero_row_to_the_end, matrix, profiler)
 
     return matrix
 
 
-def solve_bottom_to_top(matrix):
-    matrix = auto_add_reverse(matrix)
-    matrix = push_zero_row_to_the_end(matrix)
-    matrix = auto_multiply(matrix)
+def solve_bottom_to_top(matrix, profiler=None, pivots=None):
+    matrix = run_stage(auto_add_reverse, matrix, profiler)
+    matrix = run_stage(push_zero_row_to_the_end, matrix, profiler)
+    # The last scaling pass sees the final rows, so its pivots are the result's
+    matrix = run_stage(auto_multiply, matrix, profiler, pivots=pivots)
 
     return matrix
 
 
-def solve_linear_system(matrix):
-    matrix = solve_top_to_bottom(matrix)
-    matrix = solve_bottom_to_top(matrix)
+def solve_fraction(matrix, profiler=None, pivots=None):
+    matrix = run_stage(solve_top_to_bottom, matrix, profiler)
+    matrix = run_stage(solve_bottom_to_top, matrix, profiler, pivots=pivots)
 
     return matrix
+
+
+solver_methods = {
+    "fraction": solve_fraction,
+    "bareiss": solve_bareiss,
+    "float": solve_float,
+    "sparse": solve_sparse,
+    "modular": solve_modular,
+    "iterative": solve_iterative_system,
+    "mixed": solve_mixed,
+    "rational": solve_rational,
+    "structured": solve_structured,
+}
+
+
+parallel_methods = {
+    "bareiss": solve_bareiss_parallel,
+    "float": solve_float_parallel,
+}
+
+
+def run_method(matrix, method, workers, profiler, pivots):
+    if workers is not None:
+        return parallel_methods[method](matrix, workers)
+    if method == "fraction":
+        return solve_fraction(matrix, profiler, pivots)
+    return solver_methods[method](matrix)
+
+
+def solve_linear_system(
+    matrix, method="fraction", workers=None, profiler=None, pivots=None
+):
+    if method not in solver_methods:
+        raise ValueError(
+            f"Unknown method '{method}'. Expected one of: {', '.join(solver_methods)}"
+        )
+
+    if workers is not None and method not in parallel_methods:
+        raise ValueError(
+            f"Method '{method}' does not support workers. "
+            f"Expected one of: {', '.join(parallel_methods)}"
+        )
+
+    if profiler is None:
+        return run_method(matrix, method, workers, profiler, pivots)
+
+    # Only the legacy pipeline reports its stages; other engines are timed whole
+    with profiler.stage(f"solve:{method}"):
+        return run_method(matrix, method, workers, profiler, pivots)
@@ -0,0 +1,232 @@
+import numpy as np
+import struct
+from fractions import Fraction
+
+magic = b"LSSM"
+version = 1
+# The last field was reserved padding; it holds the payload size of
+# records whose size does not follow from the shape
+header_format = "<4sBB2xQQQ"
+header_size = struct.calcsize(header_format)
+
+integer_kind = 1
+float_kind = 2
+rational_kind = 3
+# Numerator and denominator of each entry as a byte count followed by the
+# signed little-endian bytes, for values beyond int64
+big_rational_kind = 4
+
+kinds = (integer_kind, float_kind, rational_kind, big_rational_kind)
+length_format = struct.Struct("<I")
+int64_range = range(-(2**63), 2**63)
+
+kind_dtypes = {integer_kind: np.dtype("<i8"), float_kind: np.dtype("<f8")}
+
+
+def find_kind(matrix):
+    if matrix.dtype.kind in "iub":
+        return integer_kind
+    if matrix.dtype.kind == "f":
+        return float_kind
+
+    values = list(matrix.flat)
+    if any(isinstance(value, float) for value in values):
+        return float_kind
+
+    fractions = [Fraction(value) for value in values]
+    if not all(
+        value.numerator in int64_range and value.denominator in int64_range
+        for value in fractions
+    ):
+        return big_rational_kind
+    if all(value.denominator == 1 for value in fractions):
+        return integer_kind
+    return rational_kind
+
+
+def to_int64(values, shape):
+    try:
+        return np.array(values, dtype="<i8").reshape(shape)
+    except OverflowError:
+        raise ValueError("Matrix entries do not fit in int64") from None
+
+
+def encode_matrix(matrix, kind):
+    if kind == float_kind:
+        return [np.ascontiguousarray(matrix, dtype="<f8")]
+    if kind == integer_kind:
+        if matrix.dtype != object:
+            return [np.ascontiguousarray(matrix, dtype="<i8")]
+        return [to_int64([int(value) for value in matrix.flat], matrix.shape)]
+
+    fractions = [Fraction(value) for value in matrix.flat]
+    if kind == big_rational_kind:
+        return [encode_big_rationals(fractions)]
+    return [
+        to_int64([value.numerator for value in fractions], matrix.shape),
+        to_int64([value.denominator for value in fractions], matrix.shape),
+    ]
+
+
+def encode_integer(value):
+    data = value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+    return length_format.pack(len(data)) + data
+
+
+def encode_big_rationals(fractions):
+    parts = []
+    for value in fractions:
+        parts.append(encode_integer(value.numerator))
+        parts.append(encode_integer(value.denominator))
+    return b"".join(parts)
+
+
+def decode_big_rationals(data, offset, rows, columns):
+    values = []
+    for _ in range(2 * rows * columns):
+        if offset + length_format.size > len(data):
+            raise ValueError("Truncated binary matrix")
+        (length,) = length_format.unpack_from(data, offset)
+        offset += length_format.size + length
+        if offset > len(data):
+            raise ValueError("Truncated binary matrix")
+        values.append(
+            int.from_bytes(data[offset - length : offset], "little", signed=True)
+        )
+
+    matrix = np.empty((rows, columns), dtype=object)
+    matrix.flat = [
+        Fraction(numerator, denominator)
+        for numerator, denominator in zip(values[::2], values[1::2])
+    ]
+    return matrix
+
+
+def write_binary_matrix(target, matrix, kind=None):
+    matrix = np.asarray(matrix)
+    if kind is None:
+        kind = find_kind(matrix)
+
+    rows, columns = matrix.shape
+    blocks = encode_matrix(matrix, kind)
+    payload = sum(memoryview(block).nbytes for block in blocks)
+    header = struct.pack(header_format, magic, version, kind, rows, columns, payload)
+
+    if isinstance(target, (str, bytes)) or hasattr(target, "__fspath__"):
+        with open(target, "wb") as file:
+            write_blocks(file, header, blocks)
+    else:
+        write_blocks(target, header, blocks)
+
+
+def write_blocks(file, header, blocks):
+    file.write(header)
+    for block in blocks:
+        file.write(memoryview(block).cast("B"))
+
+
+def read_binary_header(path, offset=0):
+    with open(path, "rb") as file:
+        file.seek(offset)
+        data = file.read(header_size)
+
+    return parse_binary_header(data, offset)
+
+
+def parse_binary_header(data, offset=0):
+    if len(data) < header_size:
+        raise ValueError(f"Truncated matrix header at byte {offset}")
+
+    file_magic, file_version, kind, rows, columns, payload = struct.unpack_from(
+        header_format, data
+    )
+    if file_magic != magic:
+        raise ValueError(f"Not a binary matrix at byte {offset}")
+    if file_version != version:
+        raise ValueError(f"Unsupported binary matrix version {file_version}")
+    if kind not in kinds:
+        raise ValueError(f"Unknown binary matrix kind {kind}")
+
+    if kind != big_rational_kind:
+        # Fixed-size records may come from writers that left the field zero
+        blocks = 2 if kind == rational_kind else 1
+        payload = blocks * rows * columns * 8
+    return kind, rows, columns, payload
+
+
+def map_block(path, dtype, offset, rows, columns, mode):
+    if rows * columns == 0:
+        return np.zeros((rows, columns), dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=(rows, columns))
+
+
+def load_binary_rational(path, offset=0, mode="c"):
+    kind, rows, columns, _ = read_binary_header(path, offset)
+    if kind != rational_kind:
+        raise ValueError("Binary matrix does not hold rationals")
+
+    start = offset + header_size
+    block = rows * columns * 8
+    numerators = map_block(path, "<i8", start, rows, columns, mode)
+    denominators = map_block(path, "<i8", start + block, rows, columns, mode)
+
+    return numerators, denominators
+
+
+def load_binary_matrix(path, offset=0, mode="c"):
+    kind, rows, columns, payload = read_binary_header(path, offset)
+
+    if kind == big_rational_kind:
+        with open(path, "rb") as file:
+            file.seek(offset + header_size)
+            data = file.read(payload)
+        if len(data) < payload:
+            raise ValueError(f"Truncated binary matrix at byte {offset}")
+        return decode_big_rationals(data, 0, rows, columns)
+
+    if kind == rational_kind:
+        numerators, denominators = load_binary_rational(path, offset, mode)
+        matrix = np.empty((rows, columns), dtype=object)
+        matrix.flat = [
+            Fraction(int(numerator), int(denominator))
+            for numerator, denominator in zip(numerators.flat, denominators.flat)
+        ]
+        return matrix
+
+    # Copy-on-write by default, so solvers can reduce the map in place
+    return map_block(path, kind_dtypes[kind], offset + header_size, rows, columns, mode)
+
+
+def decode_binary_matrix(data):
+    kind, rows, columns, payload = parse_binary_header(data)
+    if len(data) < header_size + payload:
+        raise ValueError("Truncated binary matrix")
+
+    if kind == big_rational_kind:
+        return decode_big_rationals(data, header_size, rows, columns)
+
+    count = rows * columns
+    if kind != rational_kind:
+        values = np.frombuffer(data, kind_dtypes[kind], count, header_size)
+        return values.reshape(rows, columns).copy()
+
+    numerators = np.frombuffer(data, "<i8", count, header_size)
+    denominators = np.frombuffer(data, "<i8", count, header_size + count * 8)
+    matrix = np.empty((rows, columns), dtype=object)
+    matrix.flat = [
+        Fraction(int(numerator), int(denominator))
+        for numerator, denominator in zip(numerators, denominators)
+    ]
+    return matrix
+
+
+def iter_binary_matrices(path, mode="c"):
+    with open(path, "rb") as file:
+        file.seek(0, 2)
+        size = file.tell()
+
+    offset = 0
+    while offset < size:
+        _, _, _, payload = read_binary_header(path, offset)
+        yield load_binary_matrix(path, offset, mode)
+        offset += header_size + payload
@@ -0,0 +1,146 @@
+import unittest
+import io
+import os
+import tempfile
+import numpy as np
+from fractions import Fraction
+
+from matrix_binary import (
+    big_rational_kind,
+    decode_binary_matrix,
+    header_size,
+    integer_kind,
+    iter_binary_matrices,
+    load_binary_matrix,
+    load_binary_rational,
+    read_binary_header,
+    write_binary_matrix,
+)
+
+
+class BinaryMatrix(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "matrix.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip_integers(self):
+        matrix = np.array([[1, -2, 3], [4, 5, -6]])
+        write_binary_matrix(self.path, matrix)
+
+        loaded = load_binary_matrix(self.path)
+        self.assertIsInstance(loaded, np.memmap)
+        self.assertEqual(loaded.dtype, np.int64)
+        self.assertSequenceEqual(loaded.tolist(), matrix.tolist())
+
+    def test_round_trip_floats(self):
+        matrix = np.array([[0.5, -2.25], [1e300, 3.0]])
+        write_binary_matrix(self.path, matrix)
+
+        loaded = load_binary_matrix(self.path)
+        self.assertEqual(loaded.dtype, np.float64)
+        self.assertSequenceEqual(loaded.tolist(), matrix.tolist())
+
+    def test_round_trip_fractions(self):
+        matrix = np.array([[Fraction(1, 2), 2], [3, Fraction(-4, 3)]], dtype=object)
+        write_binary_matrix(self.path, matrix)
+
+        loaded = load_binary_matrix(self.path)
+        self.assertEqual(loaded.dtype, object)
+        self.assertSequenceEqual(loaded.tolist(), matrix.tolist())
+
+        numerators, denominators = load_binary_rational(self.path)
+        self.assertSequenceEqual(numerators.tolist(), [[1, 2], [3, -4]])
+        self.assertSequenceEqual(denominators.tolist(), [[2, 1], [1, 3]])
+
+    def test_whole_fractions_are_stored_as_integers(self):
+        matrix = np.array([[Fraction(4), Fraction(-1)]], dtype=object)
+        write_binary_matrix(self.path, matrix)
+
+        self.assertEqual(read_binary_header(self.path)[0], 1)
+        self.assertEqual(os.path.getsize(self.path), header_size + 16)
+
+    def test_overflow_raises(self):
+        matrix = np.array([[Fraction(2**63), 1]], dtype=object)
+        with self.assertRaises(ValueError):
+            write_binary_matrix(self.path, matrix, integer_kind)
+
+    def test_round_trip_big_rationals(self):
+        matrix = np.array(
+            [[Fraction(2**63), -(3**50)], [Fraction(1, 2**70), Fraction(-7, 3)]],
+            dtype=object,
+        )
+        write_binary_matrix(self.path, matrix)
+
+        self.assertEqual(read_binary_header(self.path)[0], big_rational_kind)
+        loaded = load_binary_matrix(self.path)
+        self.assertEqual(loaded.dtype, object)
+        self.assertSequenceEqual(loaded.tolist(), matrix.tolist())
+
+        with open(self.path, "rb") as file:
+            data = file.read()
+        self.assertSequenceEqual(decode_binary_matrix(data).tolist(), matrix.tolist())
+        with self.assertRaises(ValueError):
+            decode_binary_matrix(data[:-1])
+
+    def test_loaded_map_is_copy_on_write(self):
+        write_binary_matrix(self.path, np.array([[1, 2], [3, 4]]))
+
+        loaded = load_binary_matrix(self.path)
+        loaded[0, 0] = 9
+        self.assertEqual(load_binary_matrix(self.path)[0, 0], 1)
+
+    def test_bad_magic_raises(self):
+        with open(self.path, "wb") as file:
+            file.write(b"\0" * header_size)
+        with self.assertRaises(ValueError):
+            load_binary_matrix(self.path)
+
+    def test_truncated_header_raises(self):
+        with open(self.path, "wb") as file:
+            file.write(b"LSSM")
+        with self.assertRaises(ValueError):
+            load_binary_matrix(self.path)
+
+    def test_write_to_stream(self):
+        stream = io.BytesIO()
+        write_binary_matrix(stream, np.array([[1, 2]]))
+        self.assertEqual(len(stream.getvalue()), header_size + 16)
+
+    def test_decode_from_bytes(self):
+        matrices = [
+            np.array([[1, -2, 3]]),
+            np.array([[0.5], [2.5]]),
+            np.array([[Fraction(1, 3), Fraction(-5, 2)]], dtype=object),
+        ]
+        for matrix in matrices:
+            stream = io.BytesIO()
+            write_binary_matrix(stream, matrix)
+            decoded = decode_binary_matrix(stream.getvalue())
+            self.assertSequenceEqual(decoded.tolist(), matrix.tolist())
+
+        with self.assertRaises(ValueError):
+            decode_binary_matrix(stream.getvalue()[:-8])
+
+    def test_iter_concatenated_records(self):
+        matrices = [
+            np.array([[1, 2, 3]]),
+            np.array([[1.5], [2.5]]),
+            np.array([[Fraction(1, 3)]], dtype=object),
+            np.array([[Fraction(-(2**80), 3), 5]], dtype=object),
+            np.array([[4, 5]]),
+        ]
+        with open(self.path, "wb") as file:
+            for matrix in matrices:
+                write_binary_matrix(file, matrix)
+
+        loaded = list(iter_binary_matrices(self.path))
+        self.assertEqual(len(loaded), 5)
+        for matrix, expected in zip(loaded, matrices):
+            self.assertSequenceEqual(matrix.tolist(), expected.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
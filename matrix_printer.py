@@ -1,3 +1,7 @@
+import sys
+import numpy as np
+
+
 def pad_number(number, pad):
     pad_length = pad - len(str(number))
     return " " * pad_length + str(number)
@@ -13,19 +17,72 @@ def get_matrix_pad(matrix):
     return max_padding
 
 
-def print_matrix(matrix, is_augmented=False):
+elision = "..."
+
+
+def select_indexes(size, limit):
+    if limit is None or size <= limit:
+        return np.arange(size), None
+
+    # The tail keeps the constants column visible in augmented output
+    head = limit // 2
+    return np.r_[0:head, size - (limit - head) : size], head
+
+
+def format_cells(matrix):
+    if matrix.dtype != object:
+        return matrix.astype(str)
+
+    # numpy's own object to str conversion is much slower than map
+    cells = np.array(list(map(str, matrix.flat)), dtype=str)
+    return cells.reshape(matrix.shape)
+
+
+def format_matrix(
+    matrix, is_augmented=False, max_rows=None, max_columns=None, per_column=True
+):
+    matrix = np.asarray(matrix)
     rows, columns = matrix.shape
-    pad = get_matrix_pad(matrix)
-
-    for row in range(rows):
-        current_row = matrix[row]
-        string_row = "| "
-        for column in range(columns):
-            if column == columns - 1 and is_augmented:
-                string_row += ":"
-            string_row += pad_number(current_row[column], pad) + " "
-        string_row += "|"
-        print(string_row)
+
+    row_indexes, row_gap = select_indexes(rows, max_rows)
+    column_indexes, column_gap = select_indexes(columns, max_columns)
+
+    # Every shown cell goes through str() exactly once
+    cells = format_cells(matrix[np.ix_(row_indexes, column_indexes)])
+    if column_gap is not None:
+        cells = np.insert(cells.astype(object), column_gap, elision, axis=1)
+    if row_gap is not None:
+        cells = np.insert(cells.astype(object), row_gap, elision, axis=0)
+    cells = cells.astype(str)
+
+    if cells.size == 0:
+        return "| |\n" * len(cells)
+
+    lengths = np.char.str_len(cells)
+    widths = lengths.max(axis=0) if per_column else lengths.max()
+    cells = np.char.rjust(cells, widths).astype(object)
+    if is_augmented:
+        cells[:, -1] = ":" + cells[:, -1]
+
+    lines = ["| " + " ".join(row) + " |" for row in cells.tolist()]
+    return "\n".join(lines) + "\n"
+
+
+def write_matrix(
+    matrix,
+    stream=None,
+    is_augmented=False,
+    max_rows=None,
+    max_columns=None,
+    per_column=True,
+):
+    if stream is None:
+        stream = sys.stdout
+    stream.write(format_matrix(matrix, is_augmented, max_rows, max_columns, per_column))
+
+
+def print_matrix(matrix, is_augmented=False):
+    write_matrix(matrix, sys.stdout, is_augmented, per_column=False)
 
 
 def print_augumented_matrix(matrix):
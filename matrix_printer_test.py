@@ -1,10 +1,11 @@
 import unittest
 import io
 import sys
+from fractions import Fraction
 from numpy import array
 from unittest.mock import patch
 
-from matrix_printer import get_matrix_pad, pad_number, print_augumented_matrix, print_matrix
+from matrix_printer import format_matrix, get_matrix_pad, pad_number, print_augumented_matrix, print_matrix, write_matrix
 
 class TestPadNumber(unittest.TestCase):
     def test_pad_number_pad_3_number_1(self):
@@ -155,3 +156,46 @@ class TestPrintAugumentedMatrix(unittest.TestCase):
         matrix = array([[1, 2, 3],[4, 5, 6]])
         print_augumented_matrix(matrix)
         self.assertTrue(print_matrix.calledWith(matrix, True))
+
+
+class TestFormatMatrix(unittest.TestCase):
+    def test_format_matrix_per_column_widths(self):
+        matrix = array([[10, 2, 3], [3, 4, 500]])
+        expected = "| 10 2   3 |\n|  3 4 500 |\n"
+        self.assertEqual(format_matrix(matrix), expected)
+
+    def test_format_matrix_uniform_width_matches_print_matrix(self):
+        matrix = array([[1, 2, -3], [3, 4, -5], [6, 7, 8]])
+        expected = "|  1  2 :-3 |\n|  3  4 :-5 |\n|  6  7 : 8 |\n"
+        self.assertEqual(format_matrix(matrix, True, per_column=False), expected)
+
+    def test_format_matrix_fractions(self):
+        matrix = array([[Fraction(1, 3), Fraction(2)], [Fraction(-5, 4), Fraction(0)]], dtype=object)
+        expected = "|  1/3 :2 |\n| -5/4 :0 |\n"
+        self.assertEqual(format_matrix(matrix, True), expected)
+
+    def test_format_matrix_elides_rows(self):
+        matrix = array([[1, 1], [2, 2], [3, 3], [4, 4], [5, 5]])
+        expected = "|   1   1 |\n| ... ... |\n|   4   4 |\n|   5   5 |\n"
+        self.assertEqual(format_matrix(matrix, max_rows=3), expected)
+
+    def test_format_matrix_elides_columns_keeping_constants(self):
+        matrix = array([[1, 2, 3, 4, 5], [6, 7, 8, 9, 10]])
+        expected = "| 1 ... : 5 |\n| 6 ... :10 |\n"
+        self.assertEqual(format_matrix(matrix, True, max_columns=2), expected)
+
+    def test_format_matrix_empty(self):
+        self.assertEqual(format_matrix(array([[1, 2]])[:0]), "")
+
+
+class TestWriteMatrix(unittest.TestCase):
+    def test_write_matrix_to_stream(self):
+        stream = io.StringIO()
+        write_matrix(array([[1, 2], [3, 4]]), stream, True)
+        self.assertEqual(stream.getvalue(), "| 1 :2 |\n| 3 :4 |\n")
+
+    def test_write_matrix_single_write(self):
+        stream = io.StringIO()
+        with patch.object(stream, "write", wraps=stream.write) as write:
+            write_matrix(array([[1, 2], [3, 4], [5, 6]]), stream)
+        write.assert_called_once()
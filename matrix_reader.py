@@ -1,3 +1,5 @@
+import re
+import sys
 from numpy import array, insert
 from fractions import Fraction
 
@@ -38,3 +40,69 @@ def read_matrix():
         matrix = array(matrix)
 
     return matrix
+
+
+token_separator = re.compile(r"[\s,]+")
+
+
+def parse_row(tokens):
+    # Plain integers are kept as ints, which every solver treats like
+    # Fractions, so most rows never pay for Fraction construction; a row
+    # that fails goes straight to Fraction rather than retrying int per token
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        return list(map(Fraction, tokens))
+
+
+def print_read_error(line_number, message):
+    print(f"Line {line_number}: {message}", file=sys.stderr)
+
+
+def read_matrices(stream, on_error=print_read_error):
+    matrix = []
+    number_of_columns = 0
+    # A matrix missing a reported row is a different system, so it is
+    # skipped instead of being solved without it
+    has_errors = False
+
+    for line_number, line in enumerate(stream, start=1):
+        data = line.strip()
+        if data == "":
+            continue
+
+        if data.upper() == end_command:
+            if len(matrix) > 0 and not has_errors:
+                yield array(matrix, dtype=object)
+            matrix = []
+            number_of_columns = 0
+            has_errors = False
+            continue
+
+        tokens = token_separator.split(data)
+        try:
+            fraction_row = parse_row(tokens)
+        except (ValueError, ZeroDivisionError):
+            on_error(line_number, f"invalid number in '{data}'")
+            has_errors = True
+            continue
+
+        if number_of_columns == 0:
+            number_of_columns = len(fraction_row)
+        elif number_of_columns != len(fraction_row):
+            on_error(
+                line_number,
+                f"expected {number_of_columns} columns but found {len(fraction_row)}",
+            )
+            has_errors = True
+            continue
+
+        matrix.append(fraction_row)
+
+    if len(matrix) > 0 and not has_errors:
+        yield array(matrix, dtype=object)
+
+
+def read_matrix_file(path, on_error=print_read_error):
+    with open(path) as stream:
+        yield from read_matrices(stream, on_error)
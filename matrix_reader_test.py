@@ -1,12 +1,19 @@
 import unittest
 import io
+import os
 import sys
+import tempfile
 from fractions import Fraction
 from numpy import array
 
 from unittest.mock import patch
 
-from matrix_reader import read_matrix
+from matrix_reader import (
+    parse_row,
+    read_matrices,
+    read_matrix,
+    read_matrix_file,
+)
 
 string_of_ints = "1,2 3,4 END"
 
@@ -42,3 +49,77 @@ class TextMatrixReader(unittest.TestCase):
         read_matrix()
         sys.stdout = sys.__stdout__
         self.assertTrue(capturedOutput.getvalue().find(expected) != -1)
+
+
+class TestParseRow(unittest.TestCase):
+    def test_parse_row_integers(self):
+        row = parse_row(["1", "-2", "3"])
+        self.assertEqual(row, [1, -2, 3])
+        self.assertTrue(all(type(value) is int for value in row))
+
+    def test_parse_row_mixed(self):
+        row = parse_row(["-12", "3/4", "0.5"])
+        self.assertEqual(row, [-12, Fraction(3, 4), Fraction(1, 2)])
+        self.assertTrue(all(type(value) is Fraction for value in row))
+
+    def test_parse_row_invalid(self):
+        with self.assertRaises(ValueError):
+            parse_row(["1", "a"])
+
+
+class TestReadMatrices(unittest.TestCase):
+    def test_read_matrices_single(self):
+        stream = io.StringIO("1 2\n3 4\nEND\n")
+        matrices = list(read_matrices(stream))
+        self.assertEqual(len(matrices), 1)
+        self.assertSequenceEqual(matrices[0].tolist(), [[1, 2], [3, 4]])
+
+    def test_read_matrices_separators(self):
+        stream = io.StringIO("1,2,3\n4\t5\t6\n7, 8  9\nend\n")
+        matrices = list(read_matrices(stream))
+        self.assertSequenceEqual(
+            matrices[0].tolist(), [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+        )
+
+    def test_read_matrices_multiple(self):
+        stream = io.StringIO("1 2\nEND\n\n3 4 5\n6 7 8\nEND\n9 1/2\n")
+        matrices = list(read_matrices(stream))
+        self.assertEqual(
+            [matrix.tolist() for matrix in matrices],
+            [[[1, 2]], [[3, 4, 5], [6, 7, 8]], [[9, Fraction(1, 2)]]],
+        )
+
+    def test_read_matrices_is_lazy(self):
+        lines = iter(["1 2\n", "END\n", "not read\n"])
+        matrices = read_matrices(lines)
+        self.assertSequenceEqual(next(matrices).tolist(), [[1, 2]])
+        self.assertEqual(next(lines), "not read\n")
+
+    def test_read_matrices_skips_matrices_with_errors(self):
+        errors = []
+        stream = io.StringIO("1 2 3\n4 a 6\n7 8\n9 10 11\nEND\n1 2\nEND\n3 x\n")
+        matrices = list(
+            read_matrices(stream, lambda line, message: errors.append(line))
+        )
+        self.assertEqual([matrix.tolist() for matrix in matrices], [[[1, 2]]])
+        self.assertEqual(errors, [2, 3, 8])
+
+    def test_read_matrices_default_error_output(self):
+        capturedOutput = io.StringIO()
+        sys.stderr = capturedOutput
+        list(read_matrices(io.StringIO("1 2\n1 0/0\nEND\n")))
+        sys.stderr = sys.__stderr__
+        self.assertTrue(capturedOutput.getvalue().startswith("Line 2:"))
+
+    def test_read_matrices_empty(self):
+        self.assertEqual(list(read_matrices(io.StringIO("END\n\n"))), [])
+
+
+class TestReadMatrixFile(unittest.TestCase):
+    def test_read_matrix_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "matrices.txt")
+            with open(path, "w") as file:
+                file.write("1 2\nEND\n3 4\nEND\n")
+            matrices = list(read_matrix_file(path))
+        self.assertEqual([matrix.tolist() for matrix in matrices], [[[1, 2]], [[3, 4]]])
@@ -0,0 +1,141 @@
+import numpy as np
+from fractions import Fraction
+from math import isqrt
+
+from bareiss_solver import scale_to_integers, solve_bareiss
+from float_solver import invert_square
+from modular_solver import hadamard_bits
+
+# Bits of the solution gained per refinement step, while residuals shrink
+initial_shift = 40
+max_shift = 50
+first_attempt_bits = 32
+
+
+def round_scaled(vector, shift):
+    return np.array(
+        [int(value) for value in np.rint(np.ldexp(vector, shift))], dtype=object
+    )
+
+
+def largest_magnitude(vector):
+    return max((abs(int(value)) for value in vector), default=0)
+
+
+def safe_shift(correction, shift):
+    # float64 holds 53 bits; shifting further only scales rounding noise
+    largest = np.abs(correction).max() if len(correction) else 0.0
+    if not np.isfinite(largest):
+        return None
+    if largest == 0:
+        return shift
+    return max(0, min(shift, 52 - int(np.frexp(largest)[1])))
+
+
+def reconstruct_vector(numerators, denominator):
+    # Each entry is numerator / denominator with error below 1 / denominator,
+    # so the unique nearby fraction with a small enough denominator is exact;
+    # the running common denominator shrinks the search for later entries
+    bound = isqrt(denominator // 2)
+    common = 1
+    values = []
+
+    for numerator in numerators:
+        scaled = Fraction(int(numerator) * common, denominator)
+        approximation = scaled.limit_denominator(max(1, bound // common))
+        values.append(approximation / common)
+        common *= approximation.denominator
+        if common > bound:
+            return None
+
+    return values, common
+
+
+def verify_vector(integer_matrix, values, common):
+    numerators = np.array([int(value * common) for value in values], dtype=object)
+    expected = integer_matrix[:, -1] * common
+    return (integer_matrix[:, :-1].dot(numerators) == expected).all()
+
+
+def try_reconstruct(integer_matrix, numerators, denominator):
+    reconstructed = reconstruct_vector(numerators, denominator)
+    if reconstructed is None:
+        return None
+    values, common = reconstructed
+    if not verify_vector(integer_matrix, values, common):
+        return None
+    return values
+
+
+def refine_exact(integer_matrix):
+    size = len(integer_matrix)
+    coefficients = integer_matrix[:, :-1]
+
+    inverse = invert_square(coefficients.astype(np.float64))
+    if inverse is None:
+        return None
+
+    # Past twice the Hadamard bound every denominator is recoverable
+    limit = 2 * hadamard_bits(integer_matrix) + 64
+    # Rounding each step to integers alone leaves a residual this large
+    floor = max(sum(abs(int(value)) for value in row) for row in coefficients)
+
+    residual = integer_matrix[:, -1].copy()
+    numerators = np.zeros(size, dtype=object)
+    denominator = 1
+    bits = 0
+    target = initial_shift
+    next_attempt = first_attempt_bits
+
+    while bits <= limit:
+        if largest_magnitude(residual) == 0:
+            return [Fraction(int(value), denominator) for value in numerators]
+
+        # The solve runs in float64; the residual it leaves is exact
+        correction = inverse @ residual.astype(np.float64)
+        shift = safe_shift(correction, target)
+        if shift is None:
+            return None
+
+        step = round_scaled(correction, shift)
+        updated = residual * (1 << shift) - coefficients.dot(step)
+
+        previous = largest_magnitude(residual)
+        current = largest_magnitude(updated)
+        if current > max(previous, floor) or (shift == 0 and current >= previous):
+            if target == 0:
+                return None
+            target //= 2
+            continue
+
+        residual = updated
+        numerators = numerators * (1 << shift) + step
+        denominator <<= shift
+        bits += shift
+        target = min(target + 8, max_shift)
+
+        if bits >= next_attempt:
+            next_attempt *= 2
+            values = try_reconstruct(integer_matrix, numerators, denominator)
+            if values is not None:
+                return values
+
+    return try_reconstruct(integer_matrix, numerators, denominator)
+
+
+def solve_mixed(matrix):
+    rows, columns = matrix.shape
+    if rows != columns - 1 or rows == 0:
+        return solve_bareiss(matrix)
+
+    values = refine_exact(scale_to_integers(matrix))
+    if values is None:
+        # Singular or too badly conditioned for float64 to make progress
+        return solve_bareiss(matrix)
+
+    reduced = np.full((rows, columns), Fraction(0), dtype=object)
+    for row_index, value in enumerate(values):
+        reduced[row_index, row_index] = Fraction(1)
+        reduced[row_index, -1] = value
+
+    return reduced
@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+
+from bareiss_solver import solve_bareiss
+from benchmark import generate_system
+from linear_sistem_solver import solve_linear_system
+from mixed_solver import (
+    reconstruct_vector,
+    refine_exact,
+    safe_shift,
+    solve_mixed,
+    try_reconstruct,
+)
+
+
+class TestReconstructVector(unittest.TestCase):
+    def test_reconstruct_vector_recovers_fractions(self):
+        denominator = 2**40
+        values = [Fraction(1, 3), Fraction(-5, 7), Fraction(2)]
+        numerators = [round(value * denominator) for value in values]
+        reconstructed, common = reconstruct_vector(numerators, denominator)
+        self.assertEqual(reconstructed, values)
+        self.assertEqual(common, 21)
+
+    def test_try_reconstruct_rejects_short_approximations(self):
+        matrix = np.array([[997, 1]], dtype=object)
+        self.assertIsNone(try_reconstruct(matrix, [round(2**8 / 997)], 2**8))
+        self.assertEqual(
+            try_reconstruct(matrix, [round(2**30 / 997)], 2**30), [Fraction(1, 997)]
+        )
+
+
+class TestSafeShift(unittest.TestCase):
+    def test_safe_shift_keeps_within_float_precision(self):
+        self.assertEqual(safe_shift(np.array([0.5]), 40), 40)
+        self.assertEqual(safe_shift(np.array([2.0**30]), 40), 21)
+        self.assertEqual(safe_shift(np.array([2.0**60]), 40), 0)
+        self.assertIsNone(safe_shift(np.array([np.inf]), 40))
+
+
+class TestRefineExact(unittest.TestCase):
+    def test_refine_exact_small_denominators(self):
+        matrix = np.array([[3, 1, 2], [1, 2, 3]], dtype=object)
+        self.assertEqual(refine_exact(matrix), [Fraction(1, 5), Fraction(7, 5)])
+
+    def test_refine_exact_singular(self):
+        matrix = np.array([[1, 2, 3], [2, 4, 6]], dtype=object)
+        self.assertIsNone(refine_exact(matrix))
+
+
+class TestSolveMixed(unittest.TestCase):
+    def test_solve_mixed_matches_bareiss(self):
+        for kind in ("dense", "sparse", "singular", "inconsistent"):
+            for size in (1, 7, 40):
+                with self.subTest(kind=kind, size=size):
+                    matrix = generate_system(kind, size)
+                    self.assertEqual(
+                        solve_mixed(matrix.copy()).tolist(),
+                        solve_bareiss(matrix.copy()).tolist(),
+                    )
+
+    def test_solve_mixed_large_denominators(self):
+        # A random 60x60 system needs several hundred bits of refinement
+        matrix = generate_system("dense", 60, seed=3)
+        self.assertTrue(
+            (solve_linear_system(matrix.copy(), "mixed") == solve_bareiss(matrix)).all()
+        )
+
+    def test_solve_mixed_fraction_entries(self):
+        matrix = generate_system("ill_conditioned", 6)
+        reduced = solve_mixed(matrix)
+        self.assertEqual(reduced[:, -1].tolist(), [1] * 6)
+
+    def test_solve_mixed_non_square(self):
+        matrix = np.array([[1, 2, 3, 4], [2, 4, 7, 9]], dtype=object)
+        self.assertEqual(
+            solve_mixed(matrix.copy()).tolist(), solve_bareiss(matrix).tolist()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,268 @@
+import numpy as np
+from fractions import Fraction
+from math import gcd, isqrt, log2
+
+from bareiss_solver import fits_int64, scale_to_integers, solve_bareiss
+
+largest_prime = 2**31 - 1
+miller_rabin_bases = (2, 3, 5, 7, 11, 13, 17)
+
+
+def is_prime(number):
+    if number < 2:
+        return False
+    for base in miller_rabin_bases:
+        if number % base == 0:
+            return number == base
+
+    exponent = number - 1
+    shift = 0
+    while exponent % 2 == 0:
+        exponent //= 2
+        shift += 1
+
+    for base in miller_rabin_bases:
+        witness = pow(base, exponent, number)
+        if witness in (1, number - 1):
+            continue
+        for _ in range(shift - 1):
+            witness = witness * witness % number
+            if witness == number - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def prime_bound(rows):
+    # Updates are reduced lazily, so each entry may collect one product of
+    # residues per pivot step on top of its own value without leaving int64
+    return min(largest_prime, isqrt(2**62 // (rows + 2)))
+
+
+def generate_primes(start=largest_prime):
+    number = start
+    while number > 2:
+        if is_prime(number):
+            yield number
+        number -= 1
+
+
+def residues(matrix, prime):
+    if matrix.dtype != object:
+        return matrix % prime
+    return (matrix % prime).astype(np.int64)
+
+
+def modular_echelon(matrix, prime):
+    rows, columns = matrix.shape
+    pivot_columns = []
+    pivot_row = 0
+
+    for column_index in range(columns):
+        if pivot_row == rows:
+            break
+
+        column = matrix[pivot_row:, column_index]
+        column %= prime
+        candidates = np.flatnonzero(column)
+        if len(candidates) == 0:
+            continue
+
+        candidate_row = pivot_row + candidates[0]
+        if candidate_row != pivot_row:
+            matrix[[pivot_row, candidate_row]] = matrix[[candidate_row, pivot_row]]
+
+        row = matrix[pivot_row, column_index:]
+        inverse = pow(int(row[0]), -1, prime)
+        row %= prime
+        row *= inverse
+        row %= prime
+
+        matrix[pivot_row + 1 :, column_index:] -= np.outer(
+            matrix[pivot_row + 1 :, column_index], row
+        )
+
+        pivot_columns.append(column_index)
+        pivot_row += 1
+
+    matrix %= prime
+
+    return matrix, pivot_columns
+
+
+def modular_back_substitute(echelon, pivot_columns, free_columns, prime):
+    rank = len(pivot_columns)
+    solution = echelon[:rank, free_columns]
+
+    for row_index in reversed(range(1, rank)):
+        solution[row_index] %= prime
+        factors = echelon[:row_index, pivot_columns[row_index]]
+        solution[:row_index] -= np.outer(factors, solution[row_index])
+
+    return solution % prime
+
+
+def solve_modulo(matrix, prime):
+    echelon, pivot_columns = modular_echelon(residues(matrix, prime), prime)
+    free_columns = [
+        index for index in range(matrix.shape[1]) if index not in set(pivot_columns)
+    ]
+    solution = modular_back_substitute(echelon, pivot_columns, free_columns, prime)
+
+    return solution, pivot_columns, free_columns
+
+
+def combine_residues(values, modulus, solution, prime):
+    # Garner step: values stays the residue modulo modulus * prime
+    inverse = pow(modulus % prime, -1, prime)
+    difference = (solution.astype(object) - values % prime) * inverse % prime
+    return values + modulus * difference, modulus * prime
+
+
+def reconstruct_rational(value, modulus, bound):
+    previous_remainder, remainder = modulus, value
+    previous_coefficient, coefficient = 0, 1
+
+    while remainder > bound:
+        quotient = previous_remainder // remainder
+        previous_remainder, remainder = (
+            remainder,
+            previous_remainder - quotient * remainder,
+        )
+        previous_coefficient, coefficient = (
+            coefficient,
+            previous_coefficient - quotient * coefficient,
+        )
+
+    if coefficient == 0 or abs(coefficient) > bound:
+        return None
+    if gcd(remainder, coefficient) != 1:
+        return None
+    if coefficient < 0:
+        return -remainder, -coefficient
+    return remainder, coefficient
+
+
+def reconstruct_solution(values, modulus):
+    bound = isqrt(modulus // 2)
+    numerators = np.zeros(values.shape, dtype=object)
+    denominator = 1
+
+    # Entries share most of their denominator, so scaling by the running
+    # denominator usually leaves a small integer to read off directly
+    for index, value in np.ndenumerate(values):
+        scaled = value * denominator % modulus
+        if scaled > modulus // 2:
+            scaled -= modulus
+
+        if abs(scaled) <= bound:
+            numerators[index] = scaled
+            continue
+
+        fraction = reconstruct_rational(scaled % modulus, modulus, bound)
+        if fraction is None:
+            return None
+        numerator, factor = fraction
+        numerators *= factor
+        numerators[index] = numerator
+        denominator *= factor
+        if denominator > bound:
+            return None
+
+    return numerators, denominator
+
+
+def verify_solution(matrix, numerators, denominator, pivot_columns, free_columns):
+    expected = denominator * matrix[:, free_columns]
+    return (matrix[:, pivot_columns].dot(numerators) == expected).all()
+
+
+def hadamard_bits(matrix):
+    bits = 0.0
+    for row in matrix:
+        norm = sum(int(value) * int(value) for value in row)
+        if norm > 0:
+            bits += log2(norm) / 2
+    return bits
+
+
+def prime_limit(matrix, start):
+    # Numerators and denominators are minors, bounded by Hadamard's inequality
+    return int((2 * hadamard_bits(matrix) + 2) / (log2(start) - 1)) + 2
+
+
+def modular_reduce(matrix):
+    columns = matrix.shape[1]
+    integer_matrix = matrix.astype(object)
+    if fits_int64(matrix):
+        matrix = matrix.astype(np.int64)
+
+    start = prime_bound(len(matrix))
+    limit = prime_limit(matrix, start)
+    best_key = None
+    values = None
+    modulus = 1
+    used_primes = 0
+    next_attempt = 1
+
+    for prime in generate_primes(start):
+        solution, pivot_columns, free_columns = solve_modulo(matrix, prime)
+        used_primes += 1
+
+        # Unlucky primes lose pivots or push them right; keep the best set
+        key = (-len(pivot_columns), pivot_columns)
+        if best_key is None or key < best_key:
+            best_key = key
+            values = solution.astype(object)
+            modulus = prime
+            next_attempt = used_primes + 1
+        elif key == best_key:
+            values, modulus = combine_residues(values, modulus, solution, prime)
+        else:
+            continue
+
+        pivot_columns = best_key[1]
+        if pivot_columns and pivot_columns[-1] == columns - 1:
+            return None
+
+        if used_primes >= next_attempt or used_primes > limit:
+            next_attempt = used_primes + max(1, used_primes // 4)
+            free_columns = [
+                index for index in range(columns) if index not in set(pivot_columns)
+            ]
+            reconstructed = reconstruct_solution(values, modulus)
+            if reconstructed is not None:
+                numerators, denominator = reconstructed
+                if verify_solution(
+                    integer_matrix,
+                    numerators,
+                    denominator,
+                    pivot_columns,
+                    free_columns,
+                ):
+                    return numerators, denominator, pivot_columns, free_columns
+
+        if used_primes > 2 * limit:
+            return None
+
+    return None
+
+
+def solve_modular(matrix):
+    rows, columns = matrix.shape
+
+    result = modular_reduce(scale_to_integers(matrix))
+    if result is None:
+        # Inconsistent systems keep the constants Bareiss leaves behind
+        return solve_bareiss(matrix)
+    numerators, denominator, pivot_columns, free_columns = result
+
+    reduced = np.full((rows, columns), Fraction(0), dtype=object)
+    for row_index, pivot_index in enumerate(pivot_columns):
+        reduced[row_index, pivot_index] = Fraction(1)
+        reduced[row_index, free_columns] = [
+            Fraction(int(value), denominator) for value in numerators[row_index]
+        ]
+
+    return reduced
@@ -0,0 +1,128 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+
+from bareiss_solver import solve_bareiss
+from modular_solver import (
+    combine_residues,
+    generate_primes,
+    is_prime,
+    modular_echelon,
+    prime_bound,
+    reconstruct_rational,
+    reconstruct_solution,
+    solve_modular,
+)
+
+
+class TestPrimes(unittest.TestCase):
+    def test_is_prime(self):
+        primes = [number for number in range(30) if is_prime(number)]
+        self.assertEqual(primes, [2, 3, 5, 7, 11, 13, 17, 19, 23, 29])
+
+    def test_is_prime_large(self):
+        self.assertTrue(is_prime(2**31 - 1))
+        self.assertFalse(is_prime(2**31 - 3))
+        self.assertFalse(is_prime(3215031751))
+
+    def test_generate_primes_descends_from_start(self):
+        primes = generate_primes(100)
+        self.assertEqual([next(primes) for _ in range(3)], [97, 89, 83])
+
+    def test_prime_bound_keeps_products_in_int64(self):
+        for rows in (1, 100, 10000):
+            bound = prime_bound(rows)
+            self.assertLess((rows + 2) * bound * bound, 2**63)
+
+
+class TestModularEchelon(unittest.TestCase):
+    def test_modular_echelon_normalizes_pivots(self):
+        matrix = np.array([[2, 4, 6], [1, 3, 5]], dtype=np.int64)
+        echelon, pivot_columns = modular_echelon(matrix, 7)
+        self.assertEqual(pivot_columns, [0, 1])
+        self.assertEqual(echelon.tolist(), [[1, 2, 3], [0, 1, 2]])
+
+    def test_modular_echelon_prime_dividing_column(self):
+        matrix = np.array([[7, 1, 2], [14, 3, 4]], dtype=np.int64)
+        _, pivot_columns = modular_echelon(matrix % 7, 7)
+        self.assertEqual(pivot_columns, [1, 2])
+
+
+class TestReconstruction(unittest.TestCase):
+    def test_combine_residues(self):
+        values = np.array([[2]], dtype=object)
+        values, modulus = combine_residues(values, 3, np.array([[3]]), 5)
+        self.assertEqual(modulus, 15)
+        self.assertEqual(values[0, 0], 8)
+
+    def test_reconstruct_rational(self):
+        modulus = 10007
+        value = 3 * pow(7, -1, modulus) % modulus
+        self.assertEqual(reconstruct_rational(value, modulus, 70), (3, 7))
+
+    def test_reconstruct_rational_negative(self):
+        modulus = 10007
+        value = -5 * pow(9, -1, modulus) % modulus
+        self.assertEqual(reconstruct_rational(value, modulus, 70), (-5, 9))
+
+    def test_reconstruct_solution_common_denominator(self):
+        modulus = 1000003
+        fractions = [Fraction(1, 6), Fraction(-5, 3), Fraction(4)]
+        values = np.array(
+            [
+                [
+                    value.numerator * pow(value.denominator, -1, modulus) % modulus
+                    for value in fractions
+                ]
+            ],
+            dtype=object,
+        )
+        numerators, denominator = reconstruct_solution(values, modulus)
+        self.assertEqual(
+            [Fraction(value, denominator) for value in numerators[0]], fractions
+        )
+
+
+class TestSolveModular(unittest.TestCase):
+    def test_solve_modular_3x4(self):
+        matrix = np.array([[1, -2, 1, 0], [0, 2, -8, 8], [5, 0, -5, 10]], dtype=object)
+        expected = [[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, -1]]
+        self.assertEqual(solve_modular(matrix).tolist(), expected)
+
+    def test_solve_modular_fraction_input(self):
+        matrix = np.array(
+            [[Fraction(1, 2), Fraction(1, 3), 1], [Fraction(1, 4), 1, Fraction(2, 5)]],
+            dtype=object,
+        )
+        self.assertEqual(
+            solve_modular(matrix.copy()).tolist(), solve_bareiss(matrix.copy()).tolist()
+        )
+
+    def test_solve_modular_free_variables(self):
+        matrix = np.array([[1, 2, 3, 4], [2, 4, 7, 9], [3, 6, 10, 13]], dtype=object)
+        expected = [[1, 2, 0, 1], [0, 0, 1, 1], [0, 0, 0, 0]]
+        self.assertEqual(solve_modular(matrix).tolist(), expected)
+
+    def test_solve_modular_inconsistent_falls_back(self):
+        matrix = np.array([[1, 1, 2], [2, 2, 5]], dtype=object)
+        self.assertEqual(
+            solve_modular(matrix.copy()).tolist(), solve_bareiss(matrix.copy()).tolist()
+        )
+
+    def test_solve_modular_large_entries(self):
+        matrix = np.array(
+            [[2**70 + 1, 3, 1], [5, 2**65, 2], [7, 11, 2**80]], dtype=object
+        )
+        self.assertEqual(
+            solve_modular(matrix.copy()).tolist(), solve_bareiss(matrix.copy()).tolist()
+        )
+
+    def test_solve_modular_matches_bareiss(self):
+        matrix = np.random.default_rng(3).integers(-50, 51, (25, 26)).astype(object)
+        self.assertEqual(
+            solve_modular(matrix.copy()).tolist(), solve_bareiss(matrix.copy()).tolist()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,327 @@
+import multiprocessing
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from bareiss_solver import (
+    echelon_to_fractions,
+    fits_int64,
+    fraction_free_eliminate,
+    scale_to_integers,
+)
+from float_solver import float_reduce, rounding_scale, solve_square
+
+# Below this many cells the messaging costs more than the row updates
+parallel_threshold = 64 * 64
+block_size = 64
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def split_rows(rows, workers):
+    return [np.arange(worker, rows, workers) for worker in range(workers)]
+
+
+def eliminate_row_block(connection, row_indexes, block):
+    block = block.astype(np.int64 if fits_int64(block) else object)
+    active = np.ones(len(row_indexes), dtype=bool)
+    positions = {int(row_index): index for index, row_index in enumerate(row_indexes)}
+
+    def find(column_index):
+        nonzero = active & (block[:, column_index] != 0)
+        return row_indexes[nonzero].tolist()
+
+    while True:
+        message = connection.recv()
+        command = message[0]
+
+        if command == "find":
+            connection.send(find(message[1]))
+
+        elif command == "row":
+            connection.send(block[positions[message[1]]])
+
+        elif command == "eliminate":
+            _, pivot_index, column_index, pivot_row, previous_pivot, find_next = message
+            if pivot_index in positions:
+                active[positions[pivot_index]] = False
+
+            below = np.flatnonzero(active)
+            if len(below) > 0:
+                if block.dtype != object and not (
+                    fits_int64(block[below]) and fits_int64(pivot_row)
+                ):
+                    block = block.astype(object)
+
+                pivot_row = pivot_row.astype(block.dtype)
+                pivot = pivot_row[column_index]
+                right = slice(column_index + 1, None)
+
+                block[below, right] = (
+                    pivot * block[below, right]
+                    - np.outer(block[below, column_index], pivot_row[right])
+                ) // previous_pivot
+                block[below, column_index] = 0
+
+            # Answering the next column's search saves a round trip
+            connection.send(find(column_index + 1) if find_next else None)
+
+        elif command == "gather":
+            connection.send(block)
+
+        elif command == "stop":
+            connection.close()
+            return
+
+
+class RowWorkers:
+    def __init__(self, matrix, workers):
+        self.connections = []
+        self.processes = []
+        self.row_indexes = split_rows(len(matrix), workers)
+
+        context = multiprocessing.get_context()
+        for row_indexes in self.row_indexes:
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=eliminate_row_block,
+                args=(child, row_indexes, matrix[row_indexes]),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+
+    def owner(self, row_index):
+        return self.connections[row_index % len(self.connections)]
+
+    def broadcast(self, message):
+        for connection in self.connections:
+            connection.send(message)
+
+    def collect(self):
+        return [connection.recv() for connection in self.connections]
+
+    def find(self, column_index):
+        self.broadcast(("find", column_index))
+        return [row for rows in self.collect() for row in rows]
+
+    def row(self, row_index):
+        connection = self.owner(row_index)
+        connection.send(("row", row_index))
+        return connection.recv()
+
+    def eliminate(self, pivot_index, column_index, pivot_row, previous_pivot, find):
+        self.broadcast(
+            ("eliminate", pivot_index, column_index, pivot_row, previous_pivot, find)
+        )
+        replies = self.collect()
+        if find:
+            return [row for rows in replies for row in rows]
+        return None
+
+    def gather(self, columns):
+        self.broadcast(("gather",))
+        matrix = np.empty((sum(map(len, self.row_indexes)), columns), dtype=object)
+        for row_indexes, block in zip(self.row_indexes, self.collect()):
+            matrix[row_indexes] = block
+        return matrix
+
+    def close(self):
+        for connection in self.connections:
+            try:
+                connection.send(("stop",))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self.processes:
+            process.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def parallel_fraction_free_eliminate(matrix, coefficient_columns, workers=None):
+    rows, columns = matrix.shape
+    if workers is None:
+        workers = default_workers()
+
+    if workers <= 1 or rows < 2 or matrix.size < parallel_threshold:
+        return fraction_free_eliminate(matrix, coefficient_columns)
+
+    # Rows never move between workers; swaps only touch this ordering, which
+    # keeps the pivot choices identical to fraction_free_eliminate
+    order = list(range(rows))
+    positions = list(range(rows))
+
+    previous_pivot = 1
+    pivot_columns = []
+    pivot_row = 0
+
+    with RowWorkers(matrix, min(workers, rows)) as row_workers:
+        candidates = None
+        for column_index in range(coefficient_columns):
+            if pivot_row == rows:
+                break
+
+            if candidates is None:
+                candidates = row_workers.find(column_index)
+            if len(candidates) == 0:
+                candidates = None
+                continue
+
+            pivot_index = min(candidates, key=positions.__getitem__)
+            displaced = order[pivot_row]
+            order[pivot_row], order[positions[pivot_index]] = pivot_index, displaced
+            positions[displaced], positions[pivot_index] = (
+                positions[pivot_index],
+                pivot_row,
+            )
+
+            pivot_values = row_workers.row(pivot_index)
+            candidates = row_workers.eliminate(
+                pivot_index,
+                column_index,
+                pivot_values,
+                previous_pivot,
+                column_index + 1 < coefficient_columns,
+            )
+
+            previous_pivot = int(pivot_values[column_index])
+            pivot_columns.append(column_index)
+            pivot_row += 1
+
+        echelon = row_workers.gather(columns)
+
+    return echelon[order], pivot_columns
+
+
+def solve_bareiss_parallel(matrix, workers=None):
+    columns = matrix.shape[1]
+    echelon, pivot_columns = parallel_fraction_free_eliminate(
+        scale_to_integers(matrix), columns - 1, workers
+    )
+
+    return echelon_to_fractions(echelon, pivot_columns)
+
+
+def reduce_panel(panel, first_row, tolerance, scale, largest):
+    rows = len(panel)
+    order = np.arange(rows)
+    pivot_columns = []
+    pivot_row = first_row
+
+    for column_index in range(panel.shape[1]):
+        if pivot_row == rows:
+            break
+
+        threshold = scale * largest if tolerance is None else tolerance
+        column = np.abs(panel[pivot_row:, column_index])
+        candidate_row = pivot_row + int(column.argmax())
+
+        if column[candidate_row - pivot_row] <= threshold:
+            panel[pivot_row:, column_index] = 0.0
+            continue
+
+        if candidate_row != pivot_row:
+            panel[[pivot_row, candidate_row]] = panel[[candidate_row, pivot_row]]
+            order[[pivot_row, candidate_row]] = order[[candidate_row, pivot_row]]
+
+        panel[pivot_row] /= panel[pivot_row, column_index]
+
+        factors = panel[:, column_index].copy()
+        factors[pivot_row] = 0.0
+        panel -= np.outer(factors, panel[pivot_row])
+        panel[:, column_index] = 0.0
+        panel[pivot_row, column_index] = 1.0
+        largest = max(largest, np.abs(panel).max())
+
+        pivot_columns.append(column_index)
+        pivot_row += 1
+
+    return order, pivot_columns, largest
+
+
+def update_trailing(executor, trailing, multipliers, solved, workers):
+    def update(row_slice):
+        trailing[row_slice] -= multipliers[row_slice] @ solved
+
+    rows = len(trailing)
+    step = -(-rows // workers)
+    slices = [slice(start, start + step) for start in range(0, rows, step)]
+    list(executor.map(update, slices))
+
+
+def parallel_float_reduce(matrix, coefficient_columns, workers=None, tolerance=None):
+    matrix = np.array(matrix, dtype=np.float64)
+    rows = len(matrix)
+    if workers is None:
+        workers = default_workers()
+
+    if workers <= 1 or matrix.size < parallel_threshold:
+        return float_reduce(matrix, coefficient_columns, tolerance)
+
+    coefficients = matrix[:, :coefficient_columns]
+    scale = rounding_scale(coefficients)
+    largest = np.abs(coefficients).max() if coefficients.size else 0.0
+
+    pivot_columns = []
+    pivot_row = 0
+
+    with ThreadPoolExecutor(workers) as executor:
+        for start in range(0, coefficient_columns, block_size):
+            if pivot_row == rows:
+                break
+            stop = min(start + block_size, coefficient_columns)
+
+            panel = matrix[:, start:stop].copy()
+            order, panel_pivots, largest = reduce_panel(
+                panel, pivot_row, tolerance, scale, largest
+            )
+            matrix[pivot_row:] = matrix[order[pivot_row:]]
+
+            if panel_pivots:
+                # Gauss-Jordan over the panel applied to the trailing columns
+                # in one solve and one GEMM split across the workers
+                pivot_rows = slice(pivot_row, pivot_row + len(panel_pivots))
+                trailing = matrix[:, stop:]
+                multipliers = matrix[:, start:stop][:, panel_pivots]
+                solved = np.linalg.solve(multipliers[pivot_rows], trailing[pivot_rows])
+                multipliers[pivot_rows] = 0.0
+
+                update_trailing(executor, trailing, multipliers, solved, workers)
+                trailing[pivot_rows] = solved
+                if stop < coefficient_columns:
+                    largest = max(largest, np.abs(coefficients[:, stop:]).max())
+
+            matrix[:, start:stop] = panel
+            pivot_columns += [start + column_index for column_index in panel_pivots]
+            pivot_row += len(panel_pivots)
+
+    matrix[pivot_row:, :coefficient_columns] = 0.0
+
+    return matrix, pivot_columns
+
+
+def solve_float_parallel(matrix, workers=None):
+    matrix = np.array(matrix, dtype=np.float64)
+    rows, columns = matrix.shape
+
+    # LAPACK already runs this path on the threaded BLAS
+    if rows == columns - 1 and rows > 0:
+        solution = solve_square(matrix[:, :-1], matrix[:, -1])
+        if solution is not None:
+            solved_matrix = np.zeros((rows, columns))
+            solved_matrix[:, :-1] = np.eye(rows)
+            solved_matrix[:, -1] = solution
+            return solved_matrix
+
+    solved_matrix, _ = parallel_float_reduce(matrix, columns - 1, workers)
+
+    return solved_matrix
@@ -0,0 +1,103 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+from unittest.mock import patch
+
+from bareiss_solver import fraction_free_eliminate, solve_bareiss
+from float_solver import float_reduce
+from parallel_solver import (
+    parallel_float_reduce,
+    parallel_fraction_free_eliminate,
+    solve_bareiss_parallel,
+    solve_float_parallel,
+    split_rows,
+)
+
+
+class TestSplitRows(unittest.TestCase):
+    def test_split_rows_is_cyclic(self):
+        chunks = split_rows(7, 3)
+        self.assertEqual(
+            [chunk.tolist() for chunk in chunks], [[0, 3, 6], [1, 4], [2, 5]]
+        )
+
+
+@patch("parallel_solver.parallel_threshold", 0)
+class TestParallelBareiss(unittest.TestCase):
+    def test_eliminate_matches_serial(self):
+        matrix = np.random.default_rng(0).integers(-5, 6, (9, 8)).astype(object)
+        matrix[:, 2] = 0
+        matrix[7] = matrix[1] * 3
+
+        echelon, pivot_columns = parallel_fraction_free_eliminate(matrix, 7, workers=3)
+        expected, expected_columns = fraction_free_eliminate(matrix, 7)
+        self.assertEqual(echelon.tolist(), expected.tolist())
+        self.assertEqual(pivot_columns, expected_columns)
+
+    def test_eliminate_promotes_large_entries(self):
+        matrix = np.random.default_rng(1).integers(-5, 6, (6, 7)).astype(object)
+        matrix *= 2**30
+
+        echelon, _ = parallel_fraction_free_eliminate(matrix, 6, workers=2)
+        expected, _ = fraction_free_eliminate(matrix, 6)
+        self.assertEqual(echelon.tolist(), expected.tolist())
+
+    def test_solve_bareiss_parallel_fractions(self):
+        matrix = np.array(
+            [
+                [Fraction(1, 2), 1, 0, 2],
+                [0, Fraction(1, 3), 1, 1],
+                [1, 0, Fraction(-1, 4), 0],
+            ],
+            dtype=object,
+        )
+        self.assertEqual(
+            solve_bareiss_parallel(matrix.copy(), workers=2).tolist(),
+            solve_bareiss(matrix.copy()).tolist(),
+        )
+
+    def test_solve_bareiss_parallel_inconsistent(self):
+        matrix = np.array([[1, 1, 2], [2, 2, 5], [0, 1, 1]], dtype=object)
+        self.assertEqual(
+            solve_bareiss_parallel(matrix.copy(), workers=3).tolist(),
+            solve_bareiss(matrix.copy()).tolist(),
+        )
+
+
+@patch("parallel_solver.parallel_threshold", 0)
+@patch("parallel_solver.block_size", 3)
+class TestParallelFloat(unittest.TestCase):
+    def test_reduce_matches_serial(self):
+        matrix = np.random.default_rng(2).standard_normal((8, 11))
+        matrix[:, 1] = 0
+        matrix[:, 4] = 0
+
+        reduced, pivot_columns = parallel_float_reduce(matrix, 10, workers=2)
+        expected, expected_columns = float_reduce(matrix, 10)
+        self.assertEqual(pivot_columns, expected_columns)
+        self.assertTrue(np.allclose(reduced, expected))
+
+    def test_reduce_exactly_singular(self):
+        matrix = np.array(
+            [[1.0, 2, 3, 4], [2, 4, 6, 8], [1, 0, 1, 2]], dtype=np.float64
+        )
+        reduced, pivot_columns = parallel_float_reduce(matrix, 3, workers=2)
+        self.assertEqual(pivot_columns, [0, 1])
+        self.assertTrue(
+            np.allclose(reduced, [[1, 0, 1, 2], [0, 1, 1, 1], [0, 0, 0, 0]])
+        )
+
+    def test_reduce_rank_from_elimination_growth(self):
+        rng = np.random.default_rng(9)
+        matrix = rng.integers(-5, 6, (60, 58)) @ rng.integers(-5, 6, (58, 90))
+        _, pivot_columns = parallel_float_reduce(matrix, 89, workers=2)
+        self.assertEqual(len(pivot_columns), 58)
+
+    def test_solve_float_parallel_square(self):
+        matrix = np.array([[1, -2, 1, 0], [0, 2, -8, 8], [5, 0, -5, 10]], dtype=object)
+        expected = [[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, -1]]
+        self.assertTrue(np.allclose(solve_float_parallel(matrix, workers=2), expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
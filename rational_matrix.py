@@ -0,0 +1,201 @@
+import numpy as np
+from fractions import Fraction
+
+from bareiss_solver import row_scales
+
+int64_limit = 2**63 - 1
+
+
+def magnitude(values):
+    if values.size == 0:
+        return 0
+    return max(abs(int(values.max())), abs(int(values.min())))
+
+
+def storage_for(*bounds):
+    return np.int64 if max(bounds) <= int64_limit else object
+
+
+class RationalMatrix:
+    def __init__(self, numerators, denominators):
+        self.numerators = numerators
+        self.denominators = denominators
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        matrix = np.asarray(matrix)
+        rows, columns = matrix.shape
+
+        if matrix.dtype.kind in "iu":
+            numerators = matrix.astype(object)
+            denominators = np.ones(rows, dtype=object)
+        else:
+            # One denominator per row: the least common multiple of its cells
+            scales = row_scales(matrix)
+            numerators = np.empty((rows, columns), dtype=object)
+            for row_index, scale in enumerate(scales):
+                numerators[row_index] = [
+                    int(Fraction(value) * scale) for value in matrix[row_index]
+                ]
+            denominators = np.array(scales, dtype=object)
+
+        dtype = storage_for(magnitude(numerators), magnitude(denominators))
+        return cls(numerators.astype(dtype), denominators.astype(dtype))
+
+    @property
+    def shape(self):
+        return self.numerators.shape
+
+    def __len__(self):
+        return len(self.numerators)
+
+    @property
+    def is_compact(self):
+        return self.numerators.dtype != object
+
+    def copy(self):
+        return RationalMatrix(self.numerators.copy(), self.denominators.copy())
+
+    def promote(self):
+        # int64 can not hold the next result, so switch to Python ints for good
+        if self.is_compact:
+            self.numerators = self.numerators.astype(object)
+            self.denominators = self.denominators.astype(object)
+
+    def reserve(self, *bounds):
+        if self.is_compact and max(bounds) > int64_limit:
+            self.promote()
+
+    def normalize(self, row_indexes):
+        numerators = self.numerators[row_indexes]
+        denominators = self.denominators[row_indexes]
+
+        negative = denominators < 0
+        numerators[negative] = -numerators[negative]
+        denominators[negative] = -denominators[negative]
+
+        common = np.gcd.reduce(
+            np.column_stack([numerators, denominators]), axis=1
+        ).astype(numerators.dtype)
+        common[common == 0] = 1
+        self.numerators[row_indexes] = numerators // common[:, None]
+        self.denominators[row_indexes] = denominators // common
+
+    def swap_rows(self, first, second):
+        self.numerators[[first, second]] = self.numerators[[second, first]]
+        self.denominators[[first, second]] = self.denominators[[second, first]]
+
+    def scale_row(self, row_index, numerator, denominator=1):
+        if numerator == 0 or denominator == 0:
+            raise ValueError("Rows can only be scaled by a nonzero value")
+
+        row = self.numerators[row_index]
+        self.reserve(
+            magnitude(row) * abs(numerator),
+            abs(int(self.denominators[row_index])) * abs(denominator),
+        )
+        self.numerators[row_index] *= numerator
+        self.denominators[row_index] *= denominator
+        self.normalize([row_index])
+
+    def make_unit(self, row_index, column_index):
+        # Dividing by an entry of the row only changes the row's denominator
+        pivot = self.numerators[row_index, column_index]
+        if pivot == 0:
+            raise ValueError(f"Entry ({row_index}, {column_index}) is zero")
+        self.denominators[row_index] = pivot
+        self.normalize([row_index])
+
+    def add_row(self, target, source, numerator, denominator=1):
+        # target += numerator / denominator * source, over one denominator
+        target_scale = denominator * int(self.denominators[source])
+        source_scale = numerator * int(self.denominators[target])
+        new_denominator = int(self.denominators[target]) * target_scale
+        self.reserve(
+            magnitude(self.numerators[target]) * abs(target_scale)
+            + magnitude(self.numerators[source]) * abs(source_scale),
+            abs(target_scale),
+            abs(source_scale),
+            abs(new_denominator),
+        )
+
+        self.numerators[target] = (
+            self.numerators[target] * target_scale
+            + self.numerators[source] * source_scale
+        )
+        self.denominators[target] = new_denominator
+        self.normalize([target])
+
+    def eliminate_column(self, source, column_index):
+        targets = np.flatnonzero(self.numerators[:, column_index] != 0)
+        targets = targets[targets != source]
+        if len(targets) == 0:
+            return
+
+        pivot = int(self.numerators[source, column_index])
+        self.reserve(
+            magnitude(self.numerators[targets]) * abs(pivot)
+            + magnitude(self.numerators[targets, column_index])
+            * magnitude(self.numerators[source]),
+            magnitude(self.denominators[targets]) * abs(pivot),
+        )
+
+        # Every row holding the column is cleared in one array operation
+        pivot_row = self.numerators[source]
+        block = self.numerators[targets]
+        factors = self.numerators[targets, column_index]
+        self.numerators[targets] = block * pivot - factors[:, None] * pivot_row
+        self.denominators[targets] *= pivot
+        self.normalize(targets)
+
+    def value(self, row_index, column_index):
+        return Fraction(
+            int(self.numerators[row_index, column_index]),
+            int(self.denominators[row_index]),
+        )
+
+    def to_fractions(self):
+        rows, columns = self.shape
+        fractions = np.empty((rows, columns), dtype=object)
+        for row_index in range(rows):
+            denominator = int(self.denominators[row_index])
+            fractions[row_index] = [
+                Fraction(int(value), denominator)
+                for value in self.numerators[row_index]
+            ]
+        return fractions
+
+
+def rational_reduce(matrix, coefficient_columns):
+    matrix = RationalMatrix.from_matrix(matrix)
+    rows = len(matrix)
+
+    pivot_columns = []
+    pivot_row = 0
+
+    for column_index in range(coefficient_columns):
+        if pivot_row == rows:
+            break
+
+        candidates = np.flatnonzero(matrix.numerators[pivot_row:, column_index] != 0)
+        if len(candidates) == 0:
+            continue
+
+        candidate_row = pivot_row + int(candidates[0])
+        if candidate_row != pivot_row:
+            matrix.swap_rows(pivot_row, candidate_row)
+
+        matrix.make_unit(pivot_row, column_index)
+        matrix.eliminate_column(pivot_row, column_index)
+
+        pivot_columns.append(column_index)
+        pivot_row += 1
+
+    return matrix, pivot_columns
+
+
+def solve_rational(matrix):
+    columns = matrix.shape[1]
+    reduced, _ = rational_reduce(matrix, columns - 1)
+
+    return reduced.to_fractions()
@@ -0,0 +1,101 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+
+from bareiss_solver import solve_bareiss
+from benchmark import generate_system
+from linear_sistem_solver import solve_linear_system
+from rational_matrix import RationalMatrix, rational_reduce, solve_rational
+
+
+def fractions(rows):
+    return np.array([[Fraction(value) for value in row] for row in rows], dtype=object)
+
+
+class TestRationalMatrix(unittest.TestCase):
+    def test_from_matrix_uses_row_denominators(self):
+        matrix = RationalMatrix.from_matrix(
+            fractions([[Fraction(1, 2), Fraction(1, 3)], [2, 4]])
+        )
+        self.assertTrue(matrix.is_compact)
+        self.assertEqual(matrix.numerators.tolist(), [[3, 2], [2, 4]])
+        self.assertEqual(matrix.denominators.tolist(), [6, 1])
+
+    def test_from_integer_array(self):
+        matrix = RationalMatrix.from_matrix(np.array([[1, -2], [3, 4]]))
+        self.assertEqual(matrix.numerators.dtype, np.int64)
+        self.assertEqual(matrix.to_fractions().tolist(), [[1, -2], [3, 4]])
+
+    def test_large_entries_start_promoted(self):
+        matrix = RationalMatrix.from_matrix(np.array([[2**70, 1]], dtype=object))
+        self.assertFalse(matrix.is_compact)
+        self.assertEqual(matrix.value(0, 0), 2**70)
+
+    def test_swap_rows(self):
+        matrix = RationalMatrix.from_matrix(fractions([[1, 2], [Fraction(1, 2), 3]]))
+        matrix.swap_rows(0, 1)
+        self.assertEqual(matrix.to_fractions().tolist(), [[Fraction(1, 2), 3], [1, 2]])
+
+    def test_scale_row_reduces_by_gcd(self):
+        matrix = RationalMatrix.from_matrix(fractions([[2, 4, 6]]))
+        matrix.scale_row(0, -1, 2)
+        self.assertEqual(matrix.numerators.tolist(), [[-1, -2, -3]])
+        self.assertEqual(matrix.denominators.tolist(), [1])
+        with self.assertRaises(ValueError):
+            matrix.scale_row(0, 0)
+
+    def test_make_unit(self):
+        matrix = RationalMatrix.from_matrix(fractions([[0, -4, 6]]))
+        matrix.make_unit(0, 1)
+        self.assertEqual(matrix.to_fractions().tolist(), [[0, 1, Fraction(-3, 2)]])
+        with self.assertRaises(ValueError):
+            matrix.make_unit(0, 0)
+
+    def test_add_row(self):
+        matrix = RationalMatrix.from_matrix(fractions([[1, Fraction(1, 2)], [3, 1]]))
+        matrix.add_row(1, 0, -3)
+        self.assertEqual(
+            matrix.to_fractions().tolist(), [[1, Fraction(1, 2)], [0, Fraction(-1, 2)]]
+        )
+
+    def test_eliminate_column(self):
+        matrix = RationalMatrix.from_matrix(fractions([[2, 1], [4, 3], [0, 5], [1, 1]]))
+        matrix.make_unit(0, 0)
+        matrix.eliminate_column(0, 0)
+        self.assertEqual(matrix.to_fractions()[:, 0].tolist(), [1, 0, 0, 0])
+        self.assertEqual(matrix.value(3, 1), Fraction(1, 2))
+
+    def test_overflow_promotes_storage(self):
+        matrix = RationalMatrix.from_matrix(np.array([[2**40, 1], [3, 2**40]]))
+        self.assertTrue(matrix.is_compact)
+        matrix.eliminate_column(1, 0)
+        self.assertFalse(matrix.is_compact)
+        self.assertEqual(matrix.value(0, 1), Fraction(3 - 2**80, 3))
+
+
+class TestSolveRational(unittest.TestCase):
+    def test_rational_reduce_pivot_columns(self):
+        reduced, pivot_columns = rational_reduce(
+            np.array([[1, 2, 3, 4], [2, 4, 7, 9]]), 3
+        )
+        self.assertEqual(pivot_columns, [0, 2])
+        self.assertEqual(reduced.to_fractions().tolist(), [[1, 2, 0, 1], [0, 0, 1, 1]])
+
+    def test_solve_rational_matches_bareiss(self):
+        for kind in ("dense", "sparse", "singular", "ill_conditioned"):
+            for size in (1, 6, 30):
+                with self.subTest(kind=kind, size=size):
+                    matrix = generate_system(kind, size)
+                    self.assertEqual(
+                        solve_linear_system(matrix.copy(), "rational").tolist(),
+                        solve_bareiss(matrix).tolist(),
+                    )
+
+    def test_solve_rational_inconsistent(self):
+        reduced = solve_rational(fractions([[1, 1, 1], [1, 1, 2]]))
+        self.assertEqual(reduced[:, :2].tolist(), [[1, 1], [0, 0]])
+        self.assertNotEqual(reduced[1, 2], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
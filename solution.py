@@ -0,0 +1,218 @@
+import csv
+import json
+import numpy as np
+from collections import namedtuple
+from fractions import Fraction
+
+from bareiss_solver import solve_bareiss
+from float_solver import float_tolerance
+from linear_sistem_solver import solve_linear_system
+from matrix_binary import write_binary_matrix
+
+Solution = namedtuple(
+    "Solution",
+    [
+        "rank",
+        "consistent",
+        "pivot_columns",
+        "free_columns",
+        "values",
+        "null_space",
+        "reduced",
+    ],
+)
+
+output_formats = ["json", "csv", "binary"]
+
+
+def find_pivots(reduced):
+    nonzero = reduced[:, :-1] != 0
+    pivot_rows = np.flatnonzero(nonzero.any(axis=1))
+    pivot_columns = nonzero[pivot_rows].argmax(axis=1)
+    return pivot_rows, pivot_columns
+
+
+def count_pivot_rows(reduced):
+    return int((reduced[:, :-1] != 0).any(axis=1).sum())
+
+
+def analyze_solution(reduced, pivots=None):
+    rows, columns = reduced.shape
+    variables = columns - 1
+    exact = reduced.dtype == object
+    zero = Fraction(0) if exact else 0.0
+
+    # Pivots recorded while eliminating are reused once they account for
+    # every nonzero row; otherwise the leading columns are read off again
+    if pivots is not None and len(pivots) == count_pivot_rows(reduced):
+        pivot_rows = np.array([row for row, _ in pivots], dtype=np.intp)
+        pivot_columns = np.array([column for _, column in pivots], dtype=np.intp)
+    else:
+        pivot_rows, pivot_columns = find_pivots(reduced)
+
+    # The constant left in a zero row collects rounding from every row that
+    # was subtracted from it, so float results are judged with some slack
+    tolerance = rows * float_tolerance(reduced) if reduced.dtype.kind == "f" else 0
+    zero_rows = np.ones(rows, dtype=bool)
+    zero_rows[pivot_rows] = False
+    consistent = not (abs(reduced[zero_rows, -1]) > tolerance).any()
+
+    pivot_set = set(pivot_columns.tolist())
+    free_columns = [index for index in range(variables) if index not in pivot_set]
+
+    leads = []
+    for row_index, column_index in zip(pivot_rows, pivot_columns):
+        lead = reduced[row_index, column_index]
+        leads.append(Fraction(lead) if exact else lead)
+
+    values = None
+    if consistent:
+        values = [zero] * variables
+        for row_index, column_index, lead in zip(pivot_rows, pivot_columns, leads):
+            values[column_index] = reduced[row_index, -1] / lead
+
+    null_space = []
+    for free_column in free_columns:
+        vector = [zero] * variables
+        vector[free_column] = zero + 1
+        for row_index, column_index, lead in zip(pivot_rows, pivot_columns, leads):
+            vector[column_index] = -reduced[row_index, free_column] / lead
+        null_space.append(vector)
+
+    return Solution(
+        len(pivot_rows),
+        bool(consistent),
+        pivot_columns.tolist(),
+        free_columns,
+        values,
+        null_space,
+        reduced,
+    )
+
+
+def is_reduced(reduced):
+    # Every pivot column must be zero outside the row it leads
+    _, pivot_columns = find_pivots(reduced)
+    return bool(((reduced[:, pivot_columns] != 0).sum(axis=0) == 1).all())
+
+
+def find_solution(matrix, method="fraction", workers=None, profiler=None):
+    if method != "fraction":
+        reduced = solve_linear_system(matrix, method, workers, profiler)
+        return analyze_solution(reduced)
+
+    # The legacy pipeline reduces the matrix in place and can stop short of
+    # reduced row echelon form, so its result is checked against a copy;
+    # object entries also keep integer arrays from truncating divisions
+    matrix = np.array(matrix, dtype=object)
+    original = matrix.copy()
+    pivots = [] if workers is None else None
+    reduced = solve_linear_system(matrix, method, workers, profiler, pivots)
+    if is_reduced(reduced):
+        return analyze_solution(reduced, pivots)
+    return analyze_solution(solve_bareiss(original))
+
+
+def format_term(coefficient, name):
+    if coefficient == 1:
+        return name
+    return f"{format_number(coefficient)}*{name}"
+
+
+def format_number(value):
+    if isinstance(value, (float, np.floating)):
+        return str(float(value))
+    return str(Fraction(value))
+
+
+def format_general_solution(solution):
+    if not solution.consistent:
+        return ["The system is inconsistent: it has no solution."]
+
+    variables = len(solution.values)
+    lines = []
+    for column_index in range(variables):
+        name = f"x{column_index + 1}"
+        if column_index in solution.free_columns:
+            lines.append(f"{name} is free")
+            continue
+
+        expression = format_number(solution.values[column_index])
+        for free_column, vector in zip(solution.free_columns, solution.null_space):
+            coefficient = vector[column_index]
+            if coefficient == 0:
+                continue
+            sign = "-" if coefficient < 0 else "+"
+            expression += f" {sign} " + format_term(
+                abs(coefficient), f"x{free_column + 1}"
+            )
+        lines.append(f"{name} = {expression}")
+
+    return lines
+
+
+def format_value(value):
+    if isinstance(value, (float, np.floating)):
+        return float(value)
+    return str(Fraction(value))
+
+
+def solution_record(solution, index=None):
+    record = {} if index is None else {"index": index}
+    record.update(
+        rank=solution.rank,
+        consistent=solution.consistent,
+        pivot_columns=solution.pivot_columns,
+        free_columns=solution.free_columns,
+        values=(
+            None
+            if solution.values is None
+            else [format_value(value) for value in solution.values]
+        ),
+        null_space=[
+            [format_value(value) for value in vector] for vector in solution.null_space
+        ],
+    )
+    return record
+
+
+def write_json_lines(stream, solutions, start=0):
+    lines = [
+        json.dumps(solution_record(solution, index))
+        for index, solution in enumerate(solutions, start)
+    ]
+    if lines:
+        stream.write("\n".join(lines) + "\n")
+
+
+def csv_header(variables):
+    return ["index", "rank", "consistent", "free_columns"] + [
+        f"x{index + 1}" for index in range(variables)
+    ]
+
+
+def csv_row(solution, index):
+    values = solution.values or []
+    return [
+        index,
+        solution.rank,
+        int(solution.consistent),
+        " ".join(map(str, solution.free_columns)),
+    ] + [format_value(value) for value in values]
+
+
+def write_csv(stream, solutions, start=0, header=True):
+    writer = csv.writer(stream, lineterminator="\n")
+    if header and solutions:
+        first = solutions[0]
+        variables = len(first.pivot_columns) + len(first.free_columns)
+        writer.writerow(csv_header(variables))
+    writer.writerows(
+        csv_row(solution, index) for index, solution in enumerate(solutions, start)
+    )
+
+
+def write_binary(stream, reduced_matrices):
+    # The reduced matrix carries rank, consistency and exact values at once
+    for reduced in reduced_matrices:
+        write_binary_matrix(stream, reduced)
@@ -0,0 +1,244 @@
+import unittest
+import importlib.util
+import io
+import json
+import os
+import tempfile
+import numpy as np
+from contextlib import redirect_stdout
+from fractions import Fraction
+from unittest.mock import patch
+
+from matrix_binary import iter_binary_matrices
+from solution import (
+    analyze_solution,
+    find_solution,
+    format_general_solution,
+    is_reduced,
+    solution_record,
+    write_binary,
+    write_csv,
+    write_json_lines,
+)
+
+spec = importlib.util.spec_from_file_location(
+    "solver_cli", os.path.join(os.path.dirname(__file__), "__main__.py")
+)
+solver_cli = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(solver_cli)
+
+
+def fractions(rows):
+    return np.array([[Fraction(value) for value in row] for row in rows], dtype=object)
+
+
+unique = fractions([[1, 0, Fraction(1, 2)], [0, 1, -2]])
+underdetermined = fractions([[1, 2, 0, 3], [0, 0, 1, 4], [0, 0, 0, 0]])
+inconsistent = fractions([[1, 1, 0], [0, 0, 1]])
+
+
+class TestAnalyzeSolution(unittest.TestCase):
+    def test_analyze_unique_solution(self):
+        solution = analyze_solution(unique)
+        self.assertEqual(solution.rank, 2)
+        self.assertTrue(solution.consistent)
+        self.assertEqual(solution.free_columns, [])
+        self.assertEqual(solution.values, [Fraction(1, 2), Fraction(-2)])
+
+    def test_analyze_free_columns(self):
+        solution = analyze_solution(underdetermined)
+        self.assertEqual(solution.rank, 2)
+        self.assertEqual(solution.pivot_columns, [0, 2])
+        self.assertEqual(solution.free_columns, [1])
+        self.assertEqual(solution.values, [3, 0, 4])
+
+    def test_analyze_inconsistent(self):
+        solution = analyze_solution(inconsistent)
+        self.assertFalse(solution.consistent)
+        self.assertIsNone(solution.values)
+
+    def test_analyze_integer_entries_stay_exact(self):
+        solution = analyze_solution(np.array([[2, 1]], dtype=object))
+        self.assertEqual(solution.values, [Fraction(1, 2)])
+
+    def test_analyze_float(self):
+        solution = analyze_solution(np.array([[1.0, 0.0, 0.5], [0.0, 1.0, 2.0]]))
+        self.assertEqual(solution.values, [0.5, 2.0])
+
+    def test_analyze_float_rounding_is_consistent(self):
+        reduced = np.array([[1.0, 0.0, 0.5], [0.0, 1.0, 2.0], [0.0, 0.0, 5.6e-17]])
+        self.assertTrue(analyze_solution(reduced).consistent)
+        reduced[2, 2] = 1e-6
+        self.assertFalse(analyze_solution(reduced).consistent)
+
+    def test_analyze_integer_array_has_no_tolerance(self):
+        reduced = np.array([[1, 0, 2**60], [0, 0, 1]])
+        self.assertFalse(analyze_solution(reduced).consistent)
+
+    def test_find_solution_falls_back_when_not_reduced(self):
+        matrix = np.array(
+            [
+                [-1, -4, -2, 0, -2, -1, -2],
+                [-2, -2, -1, -3, 0, -4, -1],
+                [0, 0, -2, -2, -4, 0, -2],
+                [-2, 0, -4, -3, -1, -4, -3],
+                [-4, -4, -3, -2, -1, -1, 0],
+            ]
+        )
+        expected = find_solution(matrix.copy(), "bareiss")
+        solution = find_solution(matrix, "fraction")
+        self.assertEqual(solution.pivot_columns, [0, 1, 2, 3, 4])
+        self.assertEqual(solution.values, expected.values)
+
+    def test_find_solution_integer_array_stays_exact(self):
+        matrix = np.array([[-3, -4]])
+        solution = find_solution(matrix, "fraction")
+        self.assertEqual(solution.values, [Fraction(4, 3)])
+        self.assertEqual(matrix.tolist(), [[-3, -4]])
+
+    def test_is_reduced(self):
+        self.assertTrue(is_reduced(underdetermined))
+        self.assertFalse(is_reduced(fractions([[1, 1, 0], [0, 1, 2]])))
+
+    def test_find_solution_float_consistent(self):
+        matrix = np.array(
+            [
+                [-1, 4, 3, 1, -4, -4, 0],
+                [3, 0, -1, 1, 3, 1, 1],
+                [-3, -1, -3, -1, 3, -1, 1],
+                [2, 4, 2, 2, -1, -3, 1],
+            ]
+        )
+        solution = find_solution(matrix, "float")
+        self.assertEqual(solution.rank, 3)
+        self.assertTrue(solution.consistent)
+
+    def test_analyze_null_space(self):
+        solution = analyze_solution(underdetermined)
+        self.assertEqual(solution.null_space, [[-2, 1, 0]])
+
+    def test_analyze_reuses_recorded_pivots(self):
+        solution = analyze_solution(underdetermined, [(0, 0), (1, 2)])
+        self.assertEqual(solution.pivot_columns, [0, 2])
+        self.assertEqual(solution.free_columns, [1])
+
+    def test_analyze_ignores_incomplete_pivots(self):
+        solution = analyze_solution(underdetermined, [(0, 0)])
+        self.assertEqual(solution.pivot_columns, [0, 2])
+
+    def test_find_solution(self):
+        matrix = np.array([[1, 2, 3, 4], [2, 4, 7, 9], [3, 6, 10, 13]], dtype=object)
+        solution = find_solution(matrix)
+        self.assertEqual(solution.rank, 2)
+        self.assertEqual(solution.values, [1, 0, 1])
+        self.assertEqual(solution.null_space, [[-2, 1, 0]])
+
+
+class TestGeneralSolution(unittest.TestCase):
+    def test_format_unique(self):
+        lines = format_general_solution(analyze_solution(unique))
+        self.assertEqual(lines, ["x1 = 1/2", "x2 = -2"])
+
+    def test_format_free_columns(self):
+        lines = format_general_solution(analyze_solution(underdetermined))
+        self.assertEqual(lines, ["x1 = 3 - 2*x2", "x2 is free", "x3 = 4"])
+
+    def test_format_inconsistent(self):
+        lines = format_general_solution(analyze_solution(inconsistent))
+        self.assertEqual(lines, ["The system is inconsistent: it has no solution."])
+
+
+class TestWriters(unittest.TestCase):
+    def test_solution_record_uses_exact_strings(self):
+        record = solution_record(analyze_solution(unique), 4)
+        self.assertEqual(record["index"], 4)
+        self.assertEqual(record["values"], ["1/2", "-2"])
+
+    def test_write_json_lines(self):
+        stream = io.StringIO()
+        write_json_lines(
+            stream, [analyze_solution(unique), analyze_solution(inconsistent)]
+        )
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1])["values"], None)
+        self.assertEqual(json.loads(lines[1])["index"], 1)
+
+    def test_write_csv(self):
+        stream = io.StringIO()
+        write_csv(stream, [analyze_solution(underdetermined)])
+        self.assertEqual(
+            stream.getvalue(),
+            "index,rank,consistent,free_columns,x1,x2,x3\n" "0,2,1,1,3,0,4\n",
+        )
+
+    def test_write_binary_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "solutions.bin")
+            with open(path, "wb") as stream:
+                write_binary(stream, [unique, inconsistent])
+            loaded = list(iter_binary_matrices(path))
+        self.assertEqual(loaded[0].tolist(), unique.tolist())
+        self.assertEqual(loaded[1].tolist(), inconsistent.tolist())
+
+
+class TestCommandLine(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.directory.name, "input.txt")
+        with open(self.input, "w") as file:
+            file.write("1 2 3\n4 5 6\nEND\n1 1 1\n1 1 2\nEND\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_json_format(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            solver_cli.main([self.input, "--format", "json"])
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(records[0]["values"], ["-1", "2"])
+        self.assertFalse(records[1]["consistent"])
+
+    def test_csv_format_to_file(self):
+        path = os.path.join(self.directory.name, "output.csv")
+        solver_cli.main(
+            [self.input, "--format", "csv", "--method", "bareiss", "--output", path]
+        )
+        with open(path) as file:
+            lines = file.read().splitlines()
+        self.assertEqual(lines[1], "0,2,1,,-1,2")
+        self.assertEqual(len(lines), 3)
+
+    def test_binary_format_exact_results(self):
+        matrix = np.random.default_rng(0).integers(-9, 10, (20, 21))
+        with open(self.input, "w") as file:
+            file.write("\n".join(" ".join(map(str, row)) for row in matrix))
+            file.write("\nEND\n")
+        path = os.path.join(self.directory.name, "output.bin")
+        solver_cli.main(
+            [self.input, "--format", "binary", "--method", "bareiss", "--output", path]
+        )
+
+        loaded = list(iter_binary_matrices(path))
+        expected = find_solution(matrix.astype(object), "bareiss").reduced
+        self.assertEqual(loaded[0].tolist(), expected.tolist())
+
+    def test_failed_run_removes_output(self):
+        path = os.path.join(self.directory.name, "output.json")
+        with patch.object(solver_cli, "write_chunk", side_effect=ValueError("bad")):
+            with self.assertRaises(ValueError):
+                solver_cli.main([self.input, "--format", "json", "--output", path])
+        self.assertFalse(os.path.exists(path))
+
+    def test_pretty_prints_general_solution(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            solver_cli.main([self.input])
+        lines = output.getvalue().splitlines()
+        self.assertIn("x1 = -1", lines)
+        self.assertIn("The system is inconsistent: it has no solution.", lines)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import numpy as np
+from collections import OrderedDict, namedtuple
+from fractions import Fraction
+
+from linear_sistem_solver import solve_linear_system
+
+CacheStatistics = namedtuple(
+    "CacheStatistics", ["hits", "misses", "disk_hits", "evictions", "size"]
+)
+
+
+def normalize_value(value):
+    if type(value) is int or type(value) is Fraction:
+        return str(value)
+    if isinstance(value, (float, np.floating)):
+        return "f" + float(value).hex()
+    return str(Fraction(value))
+
+
+def matrix_key(matrix, method="fraction"):
+    matrix = np.asarray(matrix)
+    digest = hashlib.sha256()
+    digest.update(f"{method}:{matrix.shape}:".encode())
+
+    # Integers, whole Fractions and int arrays share one text form, so the
+    # same system hashes alike whichever way it was read
+    if matrix.dtype.kind == "f":
+        digest.update(b"float:")
+        digest.update(np.ascontiguousarray(matrix, dtype="<f8").tobytes())
+    elif matrix.dtype.kind in "iub":
+        digest.update(b"exact:")
+        digest.update(",".join(map(str, matrix.ravel().tolist())).encode())
+    else:
+        digest.update(b"exact:")
+        digest.update(",".join(map(normalize_value, matrix.flat)).encode())
+
+    return digest.hexdigest()
+
+
+class SolverCache:
+    def __init__(self, maxsize=128, directory=None, solver=solve_linear_system):
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative")
+
+        self.maxsize = maxsize
+        self.directory = directory
+        self.solver = solver
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def disk_path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def load(self, key):
+        if self.directory is None:
+            return None
+        try:
+            with open(self.disk_path(key), "rb") as file:
+                return pickle.load(file)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def store(self, key, result):
+        if self.directory is None:
+            return
+
+        # Write and rename so a concurrent reader never sees half a file
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.disk_path(key))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def remember(self, key, result):
+        if self.maxsize == 0:
+            return
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key].copy()
+
+        result = self.load(key)
+        if result is not None:
+            self.remember(key, result)
+            self.hits += 1
+            self.disk_hits += 1
+            return result.copy()
+
+        self.misses += 1
+        return None
+
+    def put(self, key, result):
+        result = result.copy()
+        self.remember(key, result)
+        self.store(key, result)
+
+    def solve(self, matrix, method="fraction", **options):
+        key = matrix_key(matrix, method)
+
+        result = self.get(key)
+        if result is None:
+            # Solvers may reduce their argument in place
+            result = self.solver(np.array(matrix, copy=True), method, **options)
+            self.put(key, result)
+
+        return result
+
+    def statistics(self):
+        return CacheStatistics(
+            self.hits, self.misses, self.disk_hits, self.evictions, len(self.entries)
+        )
+
+    def clear(self, disk=False):
+        self.entries.clear()
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.unlink(os.path.join(self.directory, name))
@@ -0,0 +1,112 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+from fractions import Fraction
+from unittest.mock import Mock
+
+from linear_sistem_solver import solve_linear_system
+from solver_cache import SolverCache, matrix_key
+
+
+def system():
+    return np.array([[1, -2, 1, 0], [0, 2, -8, 8], [5, 0, -5, 10]], dtype=object)
+
+
+class TestMatrixKey(unittest.TestCase):
+    def test_key_normalizes_exact_values(self):
+        integers = np.array([[1, 2], [3, 4]])
+        fractions = np.array(
+            [[Fraction(1), Fraction(4, 2)], [Fraction(3), Fraction(4)]], dtype=object
+        )
+        self.assertEqual(matrix_key(integers), matrix_key(fractions))
+
+    def test_key_depends_on_shape(self):
+        matrix = np.array([[1, 2, 3, 4]])
+        self.assertNotEqual(matrix_key(matrix), matrix_key(matrix.reshape(2, 2)))
+
+    def test_key_depends_on_method(self):
+        self.assertNotEqual(
+            matrix_key(system(), "fraction"), matrix_key(system(), "bareiss")
+        )
+
+    def test_key_separates_floats_from_fractions(self):
+        floats = np.array([[0.5, 1.0]])
+        fractions = np.array([[Fraction(1, 2), 1]], dtype=object)
+        self.assertNotEqual(matrix_key(floats), matrix_key(fractions))
+
+
+class TestSolverCache(unittest.TestCase):
+    def test_solve_counts_hits_and_misses(self):
+        cache = SolverCache()
+        first = cache.solve(system())
+        second = cache.solve(system())
+
+        self.assertEqual(first.tolist(), solve_linear_system(system()).tolist())
+        self.assertEqual(second.tolist(), first.tolist())
+        statistics = cache.statistics()
+        self.assertEqual((statistics.hits, statistics.misses), (1, 1))
+
+    def test_solve_does_not_modify_input(self):
+        cache = SolverCache()
+        matrix = system()
+        cache.solve(matrix)
+        self.assertEqual(matrix.tolist(), system().tolist())
+
+    def test_solve_returns_copies(self):
+        cache = SolverCache()
+        first = cache.solve(system())
+        first[0, 0] = 99
+        self.assertEqual(cache.solve(system())[0, 0], 1)
+
+    def test_solver_runs_once(self):
+        solver = Mock(side_effect=solve_linear_system)
+        cache = SolverCache(solver=solver)
+        for _ in range(3):
+            cache.solve(system(), "bareiss")
+        solver.assert_called_once()
+
+    def test_least_recently_used_is_evicted(self):
+        cache = SolverCache(maxsize=2)
+        matrices = [np.array([[value, 1]], dtype=object) for value in (1, 2, 3)]
+        cache.solve(matrices[0])
+        cache.solve(matrices[1])
+        cache.solve(matrices[0])
+        cache.solve(matrices[2])
+
+        statistics = cache.statistics()
+        self.assertEqual((statistics.evictions, statistics.size), (1, 2))
+        cache.solve(matrices[0])
+        self.assertEqual(cache.statistics().hits, 2)
+
+    def test_zero_maxsize_disables_memory(self):
+        cache = SolverCache(maxsize=0)
+        cache.solve(system())
+        cache.solve(system())
+        self.assertEqual(cache.statistics().misses, 2)
+
+    def test_negative_maxsize_raises(self):
+        with self.assertRaises(ValueError):
+            SolverCache(maxsize=-1)
+
+    def test_disk_tier_survives_new_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            SolverCache(directory=directory).solve(system())
+
+            cache = SolverCache(directory=directory)
+            result = cache.solve(system())
+            self.assertEqual(result.tolist(), solve_linear_system(system()).tolist())
+            self.assertEqual(cache.statistics().disk_hits, 1)
+
+    def test_clear_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SolverCache(directory=directory)
+            cache.solve(system())
+            cache.clear(disk=True)
+
+            self.assertEqual(os.listdir(directory), [])
+            self.assertEqual(cache.statistics().size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+StageTiming = namedtuple("StageTiming", ["calls", "seconds"])
+ProfileReport = namedtuple(
+    "ProfileReport",
+    ["stages", "counters", "max_numerator_bits", "max_denominator_bits"],
+)
+
+counter_names = [
+    "row_swaps",
+    "row_scalings",
+    "row_additions",
+    "zero_rows_moved",
+    "fraction_allocations",
+]
+
+
+class SolverProfiler:
+    def __init__(self):
+        self.stage_calls = {}
+        self.stage_seconds = {}
+        self.counters = dict.fromkeys(counter_names, 0)
+        self.max_numerator_bits = 0
+        self.max_denominator_bits = 0
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stage_calls[name] = self.stage_calls.get(name, 0) + 1
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + elapsed
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_row(self, name, row, allocations):
+        self.count(name)
+        self.count("fraction_allocations", allocations)
+
+        for value in row:
+            numerator = getattr(value, "numerator", None)
+            if numerator is None:
+                continue
+            numerator_bits = int(numerator).bit_length()
+            denominator_bits = int(value.denominator).bit_length()
+            if numerator_bits > self.max_numerator_bits:
+                self.max_numerator_bits = numerator_bits
+            if denominator_bits > self.max_denominator_bits:
+                self.max_denominator_bits = denominator_bits
+
+    def report(self):
+        stages = {
+            name: StageTiming(self.stage_calls[name], self.stage_seconds[name])
+            for name in self.stage_calls
+        }
+        return ProfileReport(
+            stages,
+            dict(self.counters),
+            self.max_numerator_bits,
+            self.max_denominator_bits,
+        )
+
+    def to_dict(self):
+        report = self.report()
+        return {
+            "stages": {
+                name: timing._asdict() for name, timing in report.stages.items()
+            },
+            "counters": report.counters,
+            "max_numerator_bits": report.max_numerator_bits,
+            "max_denominator_bits": report.max_denominator_bits,
+        }
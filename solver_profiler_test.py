@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+
+from linear_sistem_solver import auto_swap, solve_linear_system
+from solver_profiler import SolverProfiler
+
+
+def system():
+    return np.array(
+        [[0, 2, -8, 8], [1, -2, 1, 0], [5, 0, -5, 10]],
+        dtype=object,
+    )
+
+
+class TestSolverProfiler(unittest.TestCase):
+    def test_stage_records_calls_and_time(self):
+        profiler = SolverProfiler()
+        for _ in range(2):
+            with profiler.stage("work"):
+                pass
+        timing = profiler.report().stages["work"]
+        self.assertEqual(timing.calls, 2)
+        self.assertGreaterEqual(timing.seconds, 0)
+
+    def test_record_row_tracks_bit_lengths(self):
+        profiler = SolverProfiler()
+        profiler.record_row("row_additions", [Fraction(255, 2), 3], 5)
+        report = profiler.report()
+        self.assertEqual(report.counters["row_additions"], 1)
+        self.assertEqual(report.counters["fraction_allocations"], 5)
+        self.assertEqual(report.max_numerator_bits, 8)
+        self.assertEqual(report.max_denominator_bits, 2)
+
+    def test_solve_reports_pipeline_stages(self):
+        profiler = SolverProfiler()
+        solve_linear_system(system(), profiler=profiler)
+        stages = profiler.report().stages
+
+        self.assertEqual(stages["solve_top_to_bottom"].calls, 1)
+        self.assertEqual(stages["solve_bottom_to_top"].calls, 1)
+        self.assertEqual(stages["push_zero_row_to_the_end"].calls, 3)
+        self.assertEqual(stages["auto_multiply"].calls, 3)
+        self.assertEqual(stages["auto_swap"].calls, 2)
+        self.assertIn("solve:fraction", stages)
+
+    def test_solve_counts_row_operations(self):
+        profiler = SolverProfiler()
+        solve_linear_system(system(), profiler=profiler)
+        counters = profiler.report().counters
+
+        self.assertGreater(counters["row_swaps"], 0)
+        self.assertGreater(counters["row_scalings"], 0)
+        self.assertGreater(counters["row_additions"], 0)
+        self.assertGreater(counters["fraction_allocations"], 0)
+
+    def test_profiled_solve_matches_plain_solve(self):
+        plain = solve_linear_system(system())
+        profiled = solve_linear_system(system(), profiler=SolverProfiler())
+        self.assertEqual(plain.tolist(), profiled.tolist())
+
+    def test_other_methods_are_timed_whole(self):
+        profiler = SolverProfiler()
+        solve_linear_system(system(), method="bareiss", profiler=profiler)
+        self.assertEqual(list(profiler.report().stages), ["solve:bareiss"])
+
+    def test_stage_counts_swaps(self):
+        profiler = SolverProfiler()
+        auto_swap(system(), profiler=profiler)
+        self.assertEqual(profiler.report().counters["row_swaps"], 1)
+
+    def test_to_dict(self):
+        profiler = SolverProfiler()
+        solve_linear_system(system(), profiler=profiler)
+        report = profiler.to_dict()
+        self.assertEqual(report["stages"]["solve:fraction"]["calls"], 1)
+        self.assertIn("max_numerator_bits", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,344 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+import numpy as np
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+
+from batch_solver import solve_linear_systems
+from linear_sistem_solver import solver_methods
+from matrix_binary import (
+    decode_binary_matrix,
+    header_size,
+    parse_binary_header,
+)
+from matrix_reader import end_command, read_matrices
+from solution import analyze_solution, find_solution, solution_record
+
+ServerStatistics = namedtuple(
+    "ServerStatistics", ["requests", "batches", "batched", "pooled"]
+)
+
+# Text lines of a large matrix are long; the stream default is 64 KiB
+line_limit = 2**24
+whitespace = b" \t\r\n"
+
+
+class ConnectionLost(Exception):
+    pass
+
+
+async def read_binary_request(reader, first):
+    header = first + await reader.readexactly(header_size - len(first))
+    _, _, _, payload = parse_binary_header(header)
+    return decode_binary_matrix(header + await reader.readexactly(payload))
+
+
+async def read_text_request(reader, first):
+    lines = [first + await reader.readline()]
+    while lines[-1].strip().upper() != end_command.encode():
+        line = await reader.readline()
+        if not line:
+            break
+        lines.append(line)
+
+    errors = []
+    text = [line.decode() for line in lines]
+    matrices = list(
+        read_matrices(
+            text, lambda line, message: errors.append(f"line {line}: {message}")
+        )
+    )
+    if errors:
+        raise ValueError("; ".join(errors))
+    if not matrices:
+        raise ValueError("No matrix was read")
+    return matrices[0]
+
+
+async def read_request(reader):
+    first = await reader.read(1)
+    while first and first in whitespace:
+        first = await reader.read(1)
+    if not first:
+        return None
+
+    # Text rows hold numbers, so a leading "L" can only start the magic
+    if first == b"L":
+        try:
+            return await read_binary_request(reader, first)
+        except asyncio.IncompleteReadError:
+            raise ConnectionLost("Truncated binary matrix") from None
+        except ValueError as error:
+            # The stream can not be resynchronized after a bad header
+            raise ConnectionLost(str(error)) from None
+    return await read_text_request(reader, first)
+
+
+def exact_matrix(matrix):
+    # Binary records decode to int64 or float64 arrays; the exact methods
+    # get the same Python ints and Fractions the text reader produces
+    values = matrix.tolist()
+    if matrix.dtype.kind == "f":
+        values = [[Fraction(value) for value in row] for row in values]
+    exact = np.empty(matrix.shape, dtype=object)
+    exact[...] = values
+    return exact
+
+
+def batch_solutions(batch):
+    return [analyze_solution(reduced) for reduced in batch.matrices]
+
+
+class SolverServer:
+    def __init__(
+        self,
+        method="float",
+        workers=None,
+        batch_size=256,
+        batch_delay=0.001,
+        heavy_rows=64,
+    ):
+        if method not in solver_methods:
+            raise ValueError(
+                f"Unknown method '{method}'. "
+                f"Expected one of: {', '.join(solver_methods)}"
+            )
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.method = method
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.heavy_rows = heavy_rows
+
+        self.server = None
+        self.pool = None
+        self.queue = None
+        self.batcher = None
+        self.requests = 0
+        self.batches = 0
+        self.batched = 0
+        self.pooled = 0
+
+    def statistics(self):
+        return ServerStatistics(self.requests, self.batches, self.batched, self.pooled)
+
+    @property
+    def address(self):
+        return self.server.sockets[0].getsockname()
+
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        self.queue = asyncio.Queue()
+        self.batcher = asyncio.create_task(self.run_batches())
+
+        if path is not None:
+            self.server = await asyncio.start_unix_server(
+                self.handle_connection, path, limit=line_limit
+            )
+        else:
+            self.server = await asyncio.start_server(
+                self.handle_connection, host, port, limit=line_limit
+            )
+        return self.server
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.batcher is not None:
+            self.batcher.cancel()
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+
+    async def serve_forever(self):
+        await self.server.serve_forever()
+
+    async def __aenter__(self):
+        if self.server is None:
+            await self.start()
+        return self
+
+    async def __aexit__(self, *exception):
+        await self.close()
+
+    async def solve(self, matrix):
+        self.requests += 1
+        if self.method != "float" and matrix.dtype != object:
+            matrix = exact_matrix(matrix)
+        rows = len(matrix)
+
+        if rows > self.heavy_rows:
+            # Heavy systems would stall every other client on the event loop
+            if self.pool is None:
+                # Forked workers would inherit the open client sockets and
+                # keep connections alive after the server closes them
+                self.pool = ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            self.pooled += 1
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.pool, find_solution, matrix, self.method
+            )
+
+        if self.method == "float":
+            future = asyncio.get_running_loop().create_future()
+            self.queue.put_nowait((matrix, future))
+            return await future
+
+        # Exact solves of even a few dozen rows take long enough to stall
+        # every other connection, so they run on a thread
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, find_solution, matrix, self.method)
+
+    async def run_batches(self):
+        while True:
+            entries = [await self.queue.get()]
+            # Requests arriving while this one waits share its batch
+            await asyncio.sleep(self.batch_delay)
+            while len(entries) < self.batch_size and not self.queue.empty():
+                entries.append(self.queue.get_nowait())
+            self.solve_batch(entries)
+
+    def solve_batch(self, entries):
+        groups = {}
+        for matrix, future in entries:
+            groups.setdefault(matrix.shape, []).append((matrix, future))
+
+        for group in groups.values():
+            futures = [future for _, future in group]
+            try:
+                batch = solve_linear_systems([matrix for matrix, _ in group])
+                solutions = batch_solutions(batch)
+            except (ValueError, ArithmeticError, TypeError) as error:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(ValueError(str(error)))
+                continue
+
+            self.batches += 1
+            self.batched += len(group)
+            for future, solution in zip(futures, solutions):
+                if not future.done():
+                    future.set_result(solution)
+
+    async def answer(self, matrix, index):
+        try:
+            solution = await self.solve(matrix)
+        except Exception as error:
+            # One failed solve, even a broken worker, must not end the
+            # connection for the requests queued behind it
+            return {"index": index, "error": str(error)}
+        return solution_record(solution, index)
+
+    async def handle_connection(self, reader, writer):
+        # Requests are solved concurrently, answers go back in request order
+        answers = asyncio.Queue()
+        responder = asyncio.create_task(self.write_answers(answers, writer))
+        index = 0
+
+        try:
+            while True:
+                try:
+                    matrix = await read_request(reader)
+                except ValueError as error:
+                    answers.put_nowait(error_answer(index, error))
+                    index += 1
+                    continue
+                except ConnectionLost as error:
+                    answers.put_nowait(error_answer(index, error))
+                    break
+
+                if matrix is None:
+                    break
+                answers.put_nowait(asyncio.ensure_future(self.answer(matrix, index)))
+                index += 1
+        finally:
+            answers.put_nowait(None)
+            await responder
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def write_answers(self, answers, writer):
+        while True:
+            answer = await answers.get()
+            if answer is None:
+                return
+            record = await answer
+            writer.write(json.dumps(record).encode() + b"\n")
+            try:
+                await writer.drain()
+            except ConnectionError:
+                return
+
+
+def error_answer(index, error):
+    future = asyncio.get_running_loop().create_future()
+    future.set_result({"index": index, "error": str(error)})
+    return future
+
+
+def parse_arguments(arguments=None):
+    parser = argparse.ArgumentParser(
+        prog="linear_system_solver serve",
+        description="Serve solutions over a local socket, one JSON line per "
+        "matrix sent as text (ending with END) or in the binary format.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on this Unix socket instead")
+    parser.add_argument("--method", choices=list(solver_methods), default="float")
+    parser.add_argument(
+        "--workers", type=int, help="processes for heavy systems (default: CPUs)"
+    )
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument(
+        "--batch-delay",
+        type=float,
+        default=1.0,
+        help="milliseconds to wait for more systems to batch with",
+    )
+    parser.add_argument(
+        "--heavy-rows",
+        type=int,
+        default=64,
+        help="systems with more rows are solved in the worker pool",
+    )
+    return parser.parse_args(arguments)
+
+
+async def run_server(arguments):
+    server = SolverServer(
+        arguments.method,
+        arguments.workers,
+        arguments.batch_size,
+        arguments.batch_delay / 1000,
+        arguments.heavy_rows,
+    )
+    await server.start(arguments.host, arguments.port, arguments.unix)
+    print(f"Listening on {server.address}", file=sys.stderr)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(arguments=None):
+    arguments = parse_arguments(arguments)
+    try:
+        asyncio.run(run_server(arguments))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import unittest
+import asyncio
+import io
+import json
+import os
+import tempfile
+import time
+import numpy as np
+from fractions import Fraction
+from unittest.mock import patch
+
+from batch_solver import solve_linear_systems
+from matrix_binary import write_binary_matrix
+from solution import find_solution
+from solver_server import SolverServer, batch_solutions
+
+
+def binary_request(matrix):
+    stream = io.BytesIO()
+    write_binary_matrix(stream, matrix)
+    return stream.getvalue()
+
+
+async def exchange(address, data, path=None):
+    if path is None:
+        reader, writer = await asyncio.open_connection(*address)
+    else:
+        reader, writer = await asyncio.open_unix_connection(path)
+    writer.write(data)
+    writer.write_eof()
+
+    records = []
+    while line := await reader.readline():
+        records.append(json.loads(line))
+    writer.close()
+    await writer.wait_closed()
+    return records
+
+
+class TestBatchSolutions(unittest.TestCase):
+    def test_rounding_noise_is_not_inconsistent(self):
+        batch = solve_linear_systems([[[1.0, 1.0, 2.0], [1.0, 1.0, 2.0]]])
+        batch.matrices[0, 1, -1] = 1e-17
+        solution = batch_solutions(batch)[0]
+        self.assertTrue(solution.consistent)
+        self.assertEqual(solution.free_columns, [1])
+
+
+class TestSolverServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = SolverServer(batch_delay=0.01)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_text_requests(self):
+        records = await exchange(
+            self.server.address, b"1 2 3\n4 5 6\nEND\n\n1 1 2\n1 1 3\nend\n"
+        )
+        self.assertEqual([record["index"] for record in records], [0, 1])
+        self.assertEqual(records[0]["values"], [-1.0, 2.0])
+        self.assertFalse(records[1]["consistent"])
+
+    async def test_binary_requests(self):
+        data = binary_request(np.array([[2, 0, 4], [0, 4, 2]])) + binary_request(
+            np.array([[Fraction(1, 2), Fraction(1, 4)]], dtype=object)
+        )
+        records = await exchange(self.server.address, data)
+        self.assertEqual(records[0]["values"], [2.0, 0.5])
+        self.assertEqual(records[1]["values"], [0.5])
+
+    async def test_invalid_text_answers_with_error(self):
+        records = await exchange(self.server.address, b"1 x\nEND\n2 4\nEND\n")
+        self.assertIn("invalid number", records[0]["error"])
+        self.assertEqual(records[1]["values"], [2.0])
+
+    async def test_bad_binary_header_closes_connection(self):
+        records = await exchange(self.server.address, b"LSSQ" + b"\0" * 60)
+        self.assertEqual(len(records), 1)
+        self.assertIn("error", records[0])
+
+    async def test_concurrent_clients_are_batched(self):
+        request = b"2 1 3\n1 3 4\nEND\n" * 20
+        answers = await asyncio.gather(
+            *[exchange(self.server.address, request) for _ in range(5)]
+        )
+
+        for records in answers:
+            self.assertEqual(len(records), 20)
+            self.assertTrue(all(record["values"] == [1.0, 1.0] for record in records))
+        statistics = self.server.statistics()
+        self.assertEqual(statistics.batched, 100)
+        self.assertLess(statistics.batches, 100)
+
+    async def test_mixed_shapes_in_one_batch(self):
+        records = await exchange(self.server.address, b"2 4\nEND\n1 0 1\n0 1 2\nEND\n")
+        self.assertEqual(records[0]["values"], [2.0])
+        self.assertEqual(records[1]["values"], [1.0, 2.0])
+
+
+class TestSolverServerOptions(unittest.IsolatedAsyncioTestCase):
+    async def test_exact_method(self):
+        async with SolverServer("fraction") as server:
+            records = await exchange(server.address, b"3 1\nEND\n")
+        self.assertEqual(records[0]["values"], ["1/3"])
+
+    async def test_exact_method_binary_requests(self):
+        data = binary_request(np.array([[2, 3]])) + binary_request(
+            np.array([[4.0, 0.5]])
+        )
+        async with SolverServer("fraction") as server:
+            records = await exchange(server.address, data)
+        self.assertEqual(records[0]["values"], ["3/2"])
+        self.assertEqual(records[1]["values"], ["1/8"])
+
+    async def test_exact_solves_do_not_block_other_clients(self):
+        def solve(matrix, method):
+            if len(matrix) == 2:
+                time.sleep(0.5)
+            return find_solution(matrix, method)
+
+        with patch("solver_server.find_solution", side_effect=solve):
+            async with SolverServer("bareiss") as server:
+                started = time.perf_counter()
+                slow = asyncio.ensure_future(
+                    exchange(server.address, b"1 2 3\n4 5 6\nEND\n")
+                )
+                await asyncio.sleep(0.05)
+                records = await exchange(server.address, b"2 4\nEND\n")
+                elapsed = time.perf_counter() - started
+                slow_records = await slow
+
+        self.assertEqual(records[0]["values"], ["2"])
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(slow_records[0]["values"], ["-1", "2"])
+
+    async def test_heavy_systems_use_the_pool(self):
+        async with SolverServer("bareiss", workers=1, heavy_rows=1) as server:
+            records = await exchange(server.address, b"1 2 3\n4 5 6\nEND\n2 4\nEND\n")
+            statistics = server.statistics()
+        self.assertEqual(records[0]["values"], ["-1", "2"])
+        self.assertEqual(records[1]["values"], ["2"])
+        self.assertEqual((statistics.requests, statistics.pooled), (2, 1))
+
+    async def test_unix_socket(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "solver.sock")
+            server = SolverServer()
+            await server.start(path=path)
+            try:
+                records = await exchange(None, b"2 4\nEND\n", path)
+            finally:
+                await server.close()
+        self.assertEqual(records[0]["values"], [2.0])
+
+    def test_unknown_method_raises(self):
+        with self.assertRaises(ValueError):
+            SolverServer("unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+import heapq
+import numpy as np
+from collections import defaultdict
+from fractions import Fraction
+
+
+def to_sparse_rows(matrix):
+    sparse_rows = []
+    for row in matrix:
+        sparse_rows.append(
+            {
+                column_index: Fraction(value)
+                for column_index, value in enumerate(row)
+                if value != 0
+            }
+        )
+    return sparse_rows
+
+
+def to_dense_matrix(sparse_rows, columns):
+    matrix = np.full((len(sparse_rows), columns), Fraction(0), dtype=object)
+    for row_index, row in enumerate(sparse_rows):
+        for column_index, value in row.items():
+            matrix[row_index, column_index] = value
+    return matrix
+
+
+def index_columns(sparse_rows, row_indexes, coefficient_columns):
+    column_rows = defaultdict(set)
+    for row_index in row_indexes:
+        for column_index in sparse_rows[row_index]:
+            if column_index < coefficient_columns:
+                column_rows[column_index].add(row_index)
+    return column_rows
+
+
+def subtract_row(target, source, factor):
+    added = []
+    removed = []
+    for column_index, value in source.items():
+        updated = target.get(column_index, 0) - factor * value
+        if updated == 0:
+            if column_index in target:
+                del target[column_index]
+                removed.append(column_index)
+        else:
+            if column_index not in target:
+                added.append(column_index)
+            target[column_index] = updated
+    return added, removed
+
+
+class ColumnQueue:
+    def __init__(self, column_rows, ordering):
+        self.column_rows = column_rows
+        self.ordering = ordering
+        self.heap = [self.key(column_index) for column_index in column_rows]
+        heapq.heapify(self.heap)
+
+    def key(self, column_index):
+        if self.ordering == "natural":
+            return (column_index, column_index)
+        return (len(self.column_rows[column_index]), column_index)
+
+    def update(self, column_index):
+        # Markowitz counts change as rows fill in; stale entries are skipped
+        if self.ordering != "natural" and self.column_rows[column_index]:
+            heapq.heappush(self.heap, self.key(column_index))
+
+    def pop(self):
+        while self.heap:
+            entry = heapq.heappop(self.heap)
+            column_index = entry[1]
+            rows = self.column_rows.get(column_index)
+            if rows and entry == self.key(column_index):
+                return column_index
+        return None
+
+
+def eliminate_forward(sparse_rows, coefficient_columns, ordering):
+    active_rows = set(range(len(sparse_rows)))
+    column_rows = index_columns(sparse_rows, active_rows, coefficient_columns)
+    queue = ColumnQueue(column_rows, ordering)
+    pivots = []
+
+    while True:
+        column_index = queue.pop()
+        if column_index is None:
+            break
+        candidates = column_rows[column_index]
+
+        # Markowitz: within the sparsest column take the sparsest row
+        pivot_row_index = min(
+            candidates, key=lambda index: (len(sparse_rows[index]), index)
+        )
+        pivot_row = sparse_rows[pivot_row_index]
+        pivot = pivot_row[column_index]
+        for key in pivot_row:
+            pivot_row[key] /= pivot
+
+        active_rows.remove(pivot_row_index)
+        touched = set()
+        for key in pivot_row:
+            if key < coefficient_columns:
+                column_rows[key].discard(pivot_row_index)
+                touched.add(key)
+
+        for row_index in list(column_rows[column_index]):
+            row = sparse_rows[row_index]
+            added, removed = subtract_row(row, pivot_row, row[column_index])
+            for key in added:
+                if key < coefficient_columns:
+                    column_rows[key].add(row_index)
+                    touched.add(key)
+            for key in removed:
+                if key < coefficient_columns:
+                    column_rows[key].discard(row_index)
+                    touched.add(key)
+
+        del column_rows[column_index]
+        touched.discard(column_index)
+        for key in touched:
+            queue.update(key)
+        pivots.append((pivot_row_index, column_index))
+
+    return pivots, active_rows
+
+
+def eliminate_backward(sparse_rows, pivots):
+    pivot_columns = {column_index for _, column_index in pivots}
+    column_rows = defaultdict(set)
+    for row_index, column_index in pivots:
+        for key in sparse_rows[row_index]:
+            if key in pivot_columns and key != column_index:
+                column_rows[key].add(row_index)
+
+    for row_index, column_index in reversed(pivots):
+        pivot_row = sparse_rows[row_index]
+        for target_index in column_rows[column_index]:
+            target = sparse_rows[target_index]
+            subtract_row(target, pivot_row, target[column_index])
+
+
+def is_reduced_row_echelon(sparse_rows, pivots, coefficient_columns):
+    for row_index, column_index in pivots:
+        leading = min(
+            key for key in sparse_rows[row_index] if key < coefficient_columns
+        )
+        if leading != column_index:
+            return False
+    return True
+
+
+def reduce_sparse_rows(sparse_rows, columns, ordering):
+    coefficient_columns = columns - 1
+    pivots, remaining_rows = eliminate_forward(
+        sparse_rows, coefficient_columns, ordering
+    )
+    eliminate_backward(sparse_rows, pivots)
+
+    pivots.sort(key=lambda pivot: pivot[1])
+    return pivots, sorted(remaining_rows)
+
+
+def solve_sparse_system(sparse_rows, columns, ordering="markowitz"):
+    coefficient_columns = columns - 1
+    sparse_rows = [dict(row) for row in sparse_rows]
+
+    pivots, remaining_rows = reduce_sparse_rows(sparse_rows, columns, ordering)
+
+    # A fill-reducing order may pick pivots right of free columns; one
+    # column-ordered pass over the already reduced rows makes it canonical
+    if not is_reduced_row_echelon(sparse_rows, pivots, coefficient_columns):
+        sparse_rows = [sparse_rows[index] for index, _ in pivots] + [
+            sparse_rows[index] for index in remaining_rows
+        ]
+        pivots, remaining_rows = reduce_sparse_rows(sparse_rows, columns, "natural")
+
+    reduced_rows = [sparse_rows[index] for index, _ in pivots]
+    reduced_rows += [sparse_rows[index] for index in remaining_rows]
+    pivot_columns = [column_index for _, column_index in pivots]
+
+    return reduced_rows, pivot_columns
+
+
+def solve_sparse(matrix):
+    columns = matrix.shape[1]
+    reduced_rows, _ = solve_sparse_system(to_sparse_rows(matrix), columns)
+    return to_dense_matrix(reduced_rows, columns)
@@ -0,0 +1,122 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+
+from sparse_solver import (
+    eliminate_forward,
+    solve_sparse,
+    solve_sparse_system,
+    subtract_row,
+    to_dense_matrix,
+    to_sparse_rows,
+)
+
+
+class TestToSparseRows(unittest.TestCase):
+    def test_to_sparse_rows_drops_zeros(self):
+        matrix = np.array([[1, 0, 2], [0, 0, 0]], dtype=object)
+        self.assertEqual(to_sparse_rows(matrix), [{0: 1, 2: 2}, {}])
+
+    def test_to_dense_matrix_round_trip(self):
+        matrix = np.array([[1, 0, Fraction(1, 2)], [0, 3, 0]], dtype=object)
+        self.assertEqual(
+            to_dense_matrix(to_sparse_rows(matrix), 3).tolist(), matrix.tolist()
+        )
+
+
+class TestSubtractRow(unittest.TestCase):
+    def test_subtract_row_reports_fill_and_cancellation(self):
+        target = {0: Fraction(2), 1: Fraction(1)}
+        added, removed = subtract_row(target, {0: Fraction(1), 2: Fraction(1)}, 2)
+        self.assertEqual(target, {1: 1, 2: -2})
+        self.assertEqual(added, [2])
+        self.assertEqual(removed, [0])
+
+
+class TestEliminateForward(unittest.TestCase):
+    def test_eliminate_forward_prefers_sparse_pivots(self):
+        # The dense first column would fill every row if it went first
+        rows = [
+            {0: Fraction(4), 1: Fraction(1), 2: Fraction(1), 3: Fraction(1)},
+            {0: Fraction(1), 1: Fraction(2), 4: Fraction(1)},
+            {0: Fraction(1), 2: Fraction(2), 4: Fraction(1)},
+            {0: Fraction(1), 3: Fraction(2), 4: Fraction(1)},
+        ]
+        pivots, remaining = eliminate_forward(rows, 4, "markowitz")
+        self.assertNotEqual(pivots[0][1], 0)
+        self.assertEqual(remaining, set())
+
+    def test_eliminate_forward_natural_order(self):
+        rows = [{0: Fraction(1), 1: Fraction(1)}, {1: Fraction(1), 2: Fraction(3)}]
+        pivots, _ = eliminate_forward(rows, 2, "natural")
+        self.assertEqual([column for _, column in pivots], [0, 1])
+
+
+class TestSolveSparseSystem(unittest.TestCase):
+    def test_solve_sparse_system_3x4(self):
+        rows = to_sparse_rows(
+            np.array([[45, -5, -40, 100], [-5, 35, -10, 0], [-40, -10, 65, 0]])
+        )
+        reduced_rows, pivot_columns = solve_sparse_system(rows, 4)
+        self.assertEqual(reduced_rows, [{0: 1, 3: 6}, {1: 1, 3: 2}, {2: 1, 3: 4}])
+        self.assertEqual(pivot_columns, [0, 1, 2])
+
+    def test_solve_sparse_system_does_not_modify_input(self):
+        rows = [{0: Fraction(2), 1: Fraction(4)}]
+        solve_sparse_system(rows, 2)
+        self.assertEqual(rows, [{0: 2, 1: 4}])
+
+    def test_solve_sparse_system_canonical_pivots(self):
+        # Markowitz would start from the sparse last column
+        rows = to_sparse_rows(np.array([[1, 1, 1, 2], [1, 1, 0, 1]]))
+        reduced_rows, pivot_columns = solve_sparse_system(rows, 4)
+        self.assertEqual(pivot_columns, [0, 2])
+        self.assertEqual(reduced_rows, [{0: 1, 1: 1, 3: 1}, {2: 1, 3: 1}])
+
+    def test_solve_sparse_system_reorders_markowitz_pivots(self):
+        # Column 2 is taken first, leaving free column 1 ahead of its pivot
+        rows = to_sparse_rows(np.array([[1, 1, 0, 1], [2, 2, 0, 2], [0, 1, 1, 0]]))
+        reduced_rows, pivot_columns = solve_sparse_system(rows, 4)
+        self.assertEqual(pivot_columns, [0, 1])
+        self.assertEqual(reduced_rows, [{0: 1, 2: -1, 3: 1}, {1: 1, 2: 1}, {}])
+
+
+class TestSolveSparse(unittest.TestCase):
+    def test_solve_sparse_fractions(self):
+        matrix = np.array(
+            [[10, -8, 0, 40], [-8, 20, -6, 0], [0, -6, 10, -20]], dtype=object
+        )
+        expected = np.array(
+            [[1, 0, 0, Fraction(28, 5)], [0, 1, 0, 2], [0, 0, 1, Fraction(-4, 5)]],
+            dtype=object,
+        )
+        self.assertTrue((solve_sparse(matrix) == expected).all())
+
+    def test_solve_sparse_free_variable(self):
+        matrix = np.array(
+            [[1, 0, -1, 0, 1], [0, 1, 2, -1, 3], [1, 1, 3, -1, 7]], dtype=object
+        )
+        expected = np.array(
+            [
+                [1, 0, 0, 0, Fraction(5, 2)],
+                [0, 1, 0, -1, 0],
+                [0, 0, 1, 0, Fraction(3, 2)],
+            ],
+            dtype=object,
+        )
+        self.assertTrue((solve_sparse(matrix) == expected).all())
+
+    def test_solve_sparse_zero_rows_at_the_end(self):
+        matrix = np.array(
+            [[0, 0, 0, 0], [1, 2, 0, 4], [2, 4, 0, 8], [0, 0, 3, 3]], dtype=object
+        )
+        expected = np.array(
+            [[1, 2, 0, 4], [0, 0, 1, 1], [0, 0, 0, 0], [0, 0, 0, 0]], dtype=object
+        )
+        self.assertTrue((solve_sparse(matrix) == expected).all())
+
+    def test_solve_sparse_inconsistent(self):
+        matrix = np.array([[1, 1, 1], [1, 1, 2]], dtype=object)
+        solved = solve_sparse(matrix)
+        self.assertEqual(solved[1, :2].tolist(), [0, 0])
+        self.assertNotEqual(solved[1, 2], 0)
@@ -0,0 +1,211 @@
+import numpy as np
+from collections import namedtuple
+from fractions import Fraction
+from math import lcm
+
+from bareiss_solver import solve_bareiss
+
+Structure = namedtuple("Structure", ["kind", "lower", "upper"])
+
+
+def exact(value):
+    # Fraction keeps numpy integers as they are, and they overflow later
+    return Fraction(int(value) if isinstance(value, np.integer) else value)
+
+
+def bandwidths(coefficients):
+    row_indexes, column_indexes = np.nonzero(coefficients != 0)
+    if len(row_indexes) == 0:
+        return 0, 0
+    offsets = column_indexes - row_indexes
+    return max(0, -int(offsets.min())), max(0, int(offsets.max()))
+
+
+def detect_structure(matrix):
+    rows, columns = matrix.shape
+    if rows != columns - 1 or rows == 0:
+        return None
+
+    lower, upper = bandwidths(matrix[:, :-1])
+    if lower == 0 and upper == 0:
+        return Structure("diagonal", lower, upper)
+    if upper == 0:
+        return Structure("lower", lower, upper)
+    if lower == 0:
+        return Structure("upper", lower, upper)
+    if lower == 1 and upper == 1:
+        return Structure("tridiagonal", lower, upper)
+    # Wide bands cost about as much as dense elimination, in slower Python
+    if lower + upper < rows // 2:
+        return Structure("banded", lower, upper)
+    return None
+
+
+def known_sum(row, values, start, stop):
+    total = Fraction(0)
+    for column_index in np.flatnonzero(row[start:stop] != 0) + start:
+        total += exact(row[column_index]) * values[column_index]
+    return total
+
+
+def solve_diagonal(matrix):
+    values = []
+    for row_index, row in enumerate(matrix):
+        pivot = exact(row[row_index])
+        if pivot == 0:
+            return None
+        values.append(exact(row[-1]) / pivot)
+    return values
+
+
+def substitute_lower(matrix, lower):
+    size = len(matrix)
+    values = [None] * size
+
+    for row_index in range(size):
+        row = matrix[row_index]
+        pivot = exact(row[row_index])
+        if pivot == 0:
+            return None
+        start = max(0, row_index - lower)
+        total = exact(row[-1]) - known_sum(row, values, start, row_index)
+        values[row_index] = total / pivot
+
+    return values
+
+
+def substitute_upper(matrix, upper):
+    size = len(matrix)
+    values = [None] * size
+
+    for row_index in reversed(range(size)):
+        row = matrix[row_index]
+        pivot = exact(row[row_index])
+        if pivot == 0:
+            return None
+        stop = min(size, row_index + upper + 1)
+        total = exact(row[-1]) - known_sum(row, values, row_index + 1, stop)
+        values[row_index] = total / pivot
+
+    return values
+
+
+def solve_tridiagonal(matrix):
+    size = len(matrix)
+    factors = []
+    constants = []
+    factor = Fraction(0)
+    constant = Fraction(0)
+
+    # Thomas algorithm: one forward sweep, one backward sweep
+    for row_index in range(size):
+        below = exact(matrix[row_index, row_index - 1]) if row_index > 0 else 0
+        pivot = exact(matrix[row_index, row_index]) - below * factor
+        if pivot == 0:
+            return None
+        above = exact(matrix[row_index, row_index + 1]) if row_index < size - 1 else 0
+        factor = above / pivot
+        constant = (exact(matrix[row_index, -1]) - below * constant) / pivot
+        factors.append(factor)
+        constants.append(constant)
+
+    values = [None] * size
+    value = Fraction(0)
+    for row_index in reversed(range(size)):
+        value = constants[row_index] - factors[row_index] * value
+        values[row_index] = value
+
+    return values
+
+
+def integer_row(values):
+    fractions = [exact(value) for value in values]
+    scale = lcm(*[value.denominator for value in fractions])
+    return np.array([int(value * scale) for value in fractions], dtype=object)
+
+
+def solve_banded(matrix, lower, upper):
+    size = len(matrix)
+
+    # Row k keeps columns k - lower through k + upper and its constant:
+    # elimination without row swaps never fills in outside that window
+    starts = [max(0, row_index - lower) for row_index in range(size)]
+    stops = [min(size, row_index + upper + 1) for row_index in range(size)]
+    rows = [
+        integer_row(np.append(matrix[row_index, start:stop], matrix[row_index, -1]))
+        for row_index, (start, stop) in enumerate(zip(starts, stops))
+    ]
+
+    # Fraction-free elimination inside the band. Rows below the band would
+    # only be scaled by pivot / previous, so that waits until they enter it
+    previous = 1
+    for pivot_index in range(size):
+        pivot_row = rows[pivot_index]
+        pivot = pivot_row[pivot_index - starts[pivot_index]]
+        if pivot == 0:
+            return None
+        tail = pivot_row[pivot_index - starts[pivot_index] :]
+
+        for row_index in range(pivot_index + 1, min(size, pivot_index + lower + 1)):
+            row = rows[row_index]
+            start = starts[row_index]
+            if start == pivot_index:
+                row *= previous
+
+            factor = row[pivot_index - start]
+            row *= pivot
+            if factor != 0:
+                row[pivot_index - start : stops[pivot_index] - start] -= (
+                    factor * tail[:-1]
+                )
+                row[-1] -= factor * tail[-1]
+            # Sylvester's identity makes the division exact
+            row //= previous
+
+        previous = pivot
+
+    # The determinant times each value is an integer, so these divisions
+    # are exact too
+    determinant = previous
+    numerators = np.zeros(size, dtype=object)
+    for row_index in reversed(range(size)):
+        row = rows[row_index]
+        start = starts[row_index]
+        stop = stops[row_index]
+        known = row[row_index + 1 - start : stop - start]
+        total = determinant * row[-1] - known.dot(numerators[row_index + 1 : stop])
+        numerators[row_index] = total // row[row_index - start]
+
+    return [Fraction(int(value), int(determinant)) for value in numerators]
+
+
+def solve_known_structure(matrix, structure):
+    if structure.kind == "diagonal":
+        return solve_diagonal(matrix)
+    if structure.kind == "lower":
+        return substitute_lower(matrix, structure.lower)
+    if structure.kind == "upper":
+        return substitute_upper(matrix, structure.upper)
+    if structure.kind == "tridiagonal":
+        return solve_tridiagonal(matrix)
+    return solve_banded(matrix, structure.lower, structure.upper)
+
+
+def solve_structured(matrix):
+    matrix = np.asarray(matrix)
+    structure = detect_structure(matrix)
+    if structure is None:
+        return solve_bareiss(matrix)
+
+    values = solve_known_structure(matrix, structure)
+    if values is None:
+        # A zero pivot: singular, or the band needs row swaps
+        return solve_bareiss(matrix)
+
+    rows, columns = matrix.shape
+    reduced = np.full((rows, columns), Fraction(0), dtype=object)
+    for row_index, value in enumerate(values):
+        reduced[row_index, row_index] = Fraction(1)
+        reduced[row_index, -1] = value
+
+    return reduced
@@ -0,0 +1,134 @@
+import unittest
+import numpy as np
+from fractions import Fraction
+
+from bareiss_solver import solve_bareiss
+from linear_sistem_solver import solve_linear_system
+from structured_solver import (
+    Structure,
+    bandwidths,
+    detect_structure,
+    solve_banded,
+    solve_diagonal,
+    solve_structured,
+    solve_tridiagonal,
+    substitute_lower,
+    substitute_upper,
+)
+
+
+def banded_system(size, lower, upper, seed):
+    rng = np.random.default_rng(seed)
+    matrix = rng.integers(-5, 6, (size, size + 1)).astype(object)
+    row_indexes, column_indexes = np.indices((size, size))
+    outside = (column_indexes - row_indexes > upper) | (
+        row_indexes - column_indexes > lower
+    )
+    matrix[:, :size][outside] = 0
+    matrix[np.arange(size), np.arange(size)] = rng.integers(20, 30, size)
+    return matrix
+
+
+def poisson_system(size):
+    matrix = np.zeros((size, size + 1), dtype=object)
+    for row_index in range(size):
+        matrix[row_index, row_index] = 2
+        if row_index > 0:
+            matrix[row_index, row_index - 1] = -1
+        if row_index < size - 1:
+            matrix[row_index, row_index + 1] = -1
+        matrix[row_index, -1] = 1
+    return matrix
+
+
+class TestDetectStructure(unittest.TestCase):
+    def test_bandwidths(self):
+        self.assertEqual(bandwidths(banded_system(8, 2, 3, 0)[:, :-1]), (2, 3))
+        self.assertEqual(bandwidths(np.zeros((3, 3))), (0, 0))
+
+    def test_detects_each_structure(self):
+        cases = [
+            (banded_system(6, 0, 0, 0), "diagonal"),
+            (banded_system(6, 5, 0, 0), "lower"),
+            (banded_system(6, 0, 5, 0), "upper"),
+            (banded_system(6, 1, 1, 0), "tridiagonal"),
+            (banded_system(12, 2, 1, 0), "banded"),
+        ]
+        for matrix, kind in cases:
+            self.assertEqual(detect_structure(matrix).kind, kind)
+
+    def test_reports_bandwidths(self):
+        self.assertEqual(
+            detect_structure(banded_system(12, 2, 1, 0)), Structure("banded", 2, 1)
+        )
+
+    def test_dense_and_rectangular_have_no_structure(self):
+        self.assertIsNone(detect_structure(banded_system(6, 5, 5, 0)))
+        self.assertIsNone(detect_structure(banded_system(6, 1, 1, 0)[:4]))
+
+
+class TestStructuredSolvers(unittest.TestCase):
+    def test_solve_diagonal(self):
+        matrix = np.array([[2, 0, 3], [0, 4, 1]])
+        self.assertEqual(solve_diagonal(matrix), [Fraction(3, 2), Fraction(1, 4)])
+
+    def test_substitute_lower(self):
+        matrix = np.array([[2, 0, 0, 2], [1, 1, 0, 3], [1, 2, 4, 9]])
+        self.assertEqual(substitute_lower(matrix, 2), [1, 2, 1])
+
+    def test_substitute_upper(self):
+        matrix = np.array([[1, 2, 1, 6], [0, 1, 3, 5], [0, 0, 2, 2]])
+        self.assertEqual(substitute_upper(matrix, 2), [1, 2, 1])
+
+    def test_solve_tridiagonal(self):
+        self.assertEqual(solve_tridiagonal(poisson_system(4)), [2, 3, 3, 2])
+
+    def test_solve_banded(self):
+        matrix = banded_system(10, 2, 3, 1)
+        expected = solve_bareiss(matrix.copy())[:, -1].tolist()
+        self.assertEqual(solve_banded(matrix, 2, 3), expected)
+
+    def test_zero_pivot_returns_none(self):
+        matrix = np.array([[0, 1, 1], [1, 0, 2]])
+        self.assertIsNone(solve_tridiagonal(matrix))
+        self.assertIsNone(solve_banded(matrix, 1, 1))
+        self.assertIsNone(substitute_upper(np.array([[1, 1, 1], [0, 0, 1]]), 1))
+
+
+class TestSolveStructured(unittest.TestCase):
+    def test_matches_bareiss(self):
+        for seed in range(5):
+            for lower, upper in [(0, 0), (4, 0), (0, 4), (1, 1), (2, 1), (1, 3)]:
+                matrix = banded_system(12, lower, upper, seed)
+                self.assertEqual(
+                    solve_linear_system(matrix.copy(), "structured").tolist(),
+                    solve_bareiss(matrix).tolist(),
+                )
+
+    def test_float_input_is_exact(self):
+        matrix = poisson_system(5).astype(np.float64) / 4
+        self.assertEqual(
+            solve_structured(matrix).tolist(), solve_bareiss(matrix).tolist()
+        )
+
+    def test_singular_falls_back(self):
+        matrix = np.array([[1, 1, 0, 1], [1, 1, 0, 1], [0, 0, 1, 2]], dtype=object)
+        self.assertEqual(
+            solve_structured(matrix).tolist(), solve_bareiss(matrix).tolist()
+        )
+
+    def test_band_needing_row_swaps_falls_back(self):
+        matrix = np.array([[0, 1, 0, 1], [1, 0, 1, 2], [0, 1, 1, 3]], dtype=object)
+        self.assertEqual(
+            solve_structured(matrix).tolist(), solve_bareiss(matrix).tolist()
+        )
+
+    def test_long_tridiagonal(self):
+        reduced = solve_structured(poisson_system(2000))
+        values = reduced[:, -1]
+        self.assertEqual(values[0], 1000)
+        self.assertEqual(values[999], 1000 * 1001 // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()